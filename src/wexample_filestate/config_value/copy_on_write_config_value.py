@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from wexample_config.config_value.config_value import ConfigValue
+from wexample_config.config_value.nested_config_value import NestedConfigValue
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class CopyOnWriteConfigValue(NestedConfigValue):
+    """Nested config view over a parsed document, without deep copying it.
+
+    Every level is wrapped up front, as NestedConfigValue does, but each node
+    wraps a shallow copy of its own container: only the dicts and lists are
+    copied, scalars are shared. Neither reads nor writes through the view,
+    including get_dict(), get_list() or raw, can reach the source document.
+    """
+
+    def __attrs_post_init__(self) -> None:
+        # NestedConfigValue wraps the children of its container in place.
+        if isinstance(self.raw, Mapping):
+            self.raw = dict(self.raw)
+        elif isinstance(self.raw, Sequence) and not isinstance(
+            self.raw, (str, bytes, bytearray, tuple)
+        ):
+            self.raw = list(self.raw)
+
+        super().__attrs_post_init__()
+
+    @classmethod
+    def _wrap(cls, val: Any) -> ConfigValue:
+        if isinstance(val, ConfigValue):
+            return val
+
+        return super()._wrap(val)
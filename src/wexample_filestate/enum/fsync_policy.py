@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class FsyncPolicy(Enum):
+    """When the files written by a run are synced to the disk.
+
+    NONE leaves it to the operating system. FILE syncs each file before it
+    replaces the previous one, then its directory. BATCH syncs the files the
+    same way, but each of their directories only once, when the operations
+    of the run are applied.
+    """
+
+    BATCH = "batch"
+    FILE = "file"
+    NONE = "none"
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+def config_fingerprint(config: Any, *context: Any) -> str | None:
+    """Return a stable hash of a raw config and extra context values.
+
+    Only JSON-like primitives, enums and classes (by qualified name) are
+    accepted. Callables and arbitrary objects can change behavior without
+    changing their representation, so any of them makes the config opaque
+    and None is returned.
+    """
+    import hashlib
+    import json
+
+    try:
+        normalized = _config_normalize([config, list(context)])
+    except TypeError:
+        return None
+
+    return hashlib.sha1(
+        json.dumps(normalized, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+def config_fingerprint_version() -> str:
+    """Return the installed package version, as context of stored fingerprints.
+
+    Fingerprints recorded by another version are then ignored, since the
+    checks they stand for may have changed.
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("wexample-filestate")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _config_normalize(value: Any) -> Any:
+    from enum import Enum
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return f"{type(value).__qualname__}.{value.name}"
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    if isinstance(value, dict):
+        normalized = {}
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise TypeError(f"Unsupported config key: {key!r}")
+            normalized[key] = _config_normalize(item)
+        return normalized
+    if isinstance(value, (list, tuple)):
+        return [_config_normalize(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_config_normalize(item) for item in value), key=repr)
+
+    raise TypeError(f"Unsupported config value: {type(value).__name__}")
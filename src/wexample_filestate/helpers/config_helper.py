@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from wexample_config.const.types import DictConfig
@@ -9,6 +9,32 @@ if TYPE_CHECKING:
     from wexample_filestate.const.disk import DiskItemType
 
 
+def config_clone(config: Any) -> Any:
+    """Copy the containers of a config, sharing its immutable leaves.
+
+    Much cheaper than deepcopy on pattern templates: strings, enums, classes
+    and callables are shared. Config options are still deep copied, as
+    building the tree assigns their parent.
+    """
+    import copy
+
+    from wexample_config.config_option.abstract_config_option import (
+        AbstractConfigOption,
+    )
+
+    if isinstance(config, dict):
+        return {key: config_clone(value) for key, value in config.items()}
+    if isinstance(config, list):
+        return [config_clone(value) for value in config]
+    if isinstance(config, tuple):
+        return tuple(config_clone(value) for value in config)
+    if isinstance(config, set):
+        return {config_clone(value) for value in config}
+    if isinstance(config, AbstractConfigOption):
+        return copy.deepcopy(config)
+    return config
+
+
 def config_has_same_type_as_path(config: DictConfig, path: FileStringOrPath) -> bool:
     from wexample_helpers.helpers.file import file_resolve_path
 
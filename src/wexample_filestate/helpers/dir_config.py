@@ -1,20 +1,68 @@
 from __future__ import annotations
 
+import os
+import stat as stat_module
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from wexample_filestate.const.globals import DIR_CONFIG_FILENAME
 
+if TYPE_CHECKING:
+    from collections import Counter
 
-def read_dir_config(path: Path) -> dict:
-    """Read the .wex.yml local config from a directory. Returns empty dict if absent or invalid."""
-    import yaml
+# Parsed configs by file path, with the (mtime_ns, size) they were read with.
+_DIR_CONFIG_CACHE: dict[str, tuple[tuple[int, int], dict]] = {}
+_DIR_CONFIG_CACHE_STATS: dict[str, int] = {"hits": 0, "misses": 0}
 
-    config_path = path / DIR_CONFIG_FILENAME
-    if not config_path.is_file():
+
+def read_dir_config(path: Path, stats: Counter[str] | None = None) -> dict:
+    """Read the .wex.yml local config from a directory. Returns empty dict if absent or invalid.
+
+    Parsed files are cached for the whole process, keyed by path, mtime and
+    size, so unchanged files are never parsed twice. Callers get their own
+    copy of the cached config, and may count its hits and misses in stats.
+    """
+    from wexample_filestate.helpers.config_helper import config_clone
+
+    config_path = os.fspath(path / DIR_CONFIG_FILENAME)
+    try:
+        stat = os.stat(config_path)
+    except OSError:
         return {}
+    if not stat_module.S_ISREG(stat.st_mode):
+        return {}
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _DIR_CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == key:
+        _DIR_CONFIG_CACHE_STATS["hits"] += 1
+        if stats is not None:
+            stats["hits"] += 1
+        return config_clone(cached[1])
+
+    _DIR_CONFIG_CACHE_STATS["misses"] += 1
+    if stats is not None:
+        stats["misses"] += 1
+    config = _read_dir_config_file(config_path)
+    _DIR_CONFIG_CACHE[config_path] = (key, config)
+    return config_clone(config)
+
+
+def read_dir_config_cache_clear() -> None:
+    _DIR_CONFIG_CACHE.clear()
+    _DIR_CONFIG_CACHE_STATS.update(hits=0, misses=0)
+
+
+def read_dir_config_cache_stats() -> dict[str, int]:
+    """Return the number of cache hits and misses of read_dir_config()."""
+    return {**_DIR_CONFIG_CACHE_STATS, "size": len(_DIR_CONFIG_CACHE)}
+
+
+def _read_dir_config_file(config_path: str) -> dict:
+    from wexample_filestate.item.file.yaml_file import YamlFile
 
     try:
         with open(config_path) as f:
-            return yaml.safe_load(f) or {}
+            return YamlFile.loads_read_only(f.read()) or {}
     except Exception:
         return {}
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def key_path_get(data: Any, path: str) -> Any:
+    """Return the value at a dotted key path of nested dicts, or None."""
+    current = data
+    for part in path.split("."):
+        if not isinstance(current, dict) or part not in current:
+            return None
+        current = current[part]
+    return current
+
+
+def key_path_leaves(node: dict) -> Iterator[str]:
+    """Yield the key paths ending at or below a node of key_path_tree."""
+    for key, child in node.items():
+        if key is None:
+            yield child
+        else:
+            yield from key_path_leaves(child)
+
+
+def key_path_resolve(value: Any, node: dict, results: dict[str, Any]) -> None:
+    """Store in results the value of every key path of a tree node.
+
+    The node is the one matching value in a tree built by key_path_tree;
+    key paths missing from value are left out of results.
+    """
+    for key, child in node.items():
+        if key is None:
+            results[child] = value
+        elif isinstance(value, dict) and key in value:
+            key_path_resolve(value[key], child, results)
+
+
+def key_path_tree(key_paths: list[str]) -> dict:
+    """Return dotted key paths as a tree of their parts.
+
+    Each node maps a key to its child node, and None to the key path
+    ending at this node, if any.
+    """
+    tree: dict = {}
+    for path in key_paths:
+        node = tree
+        for part in path.split("."):
+            node = node.setdefault(part, {})
+        node[None] = path
+    return tree
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
 from wexample_config.config_option.abstract_nested_config_option import (
@@ -19,6 +20,9 @@ from wexample_filestate.item.mixins.item_mixin import ItemMixin
 from wexample_filestate.option.mixin.option_mixin import OptionMixin
 
 if TYPE_CHECKING:
+    import os
+    from collections.abc import Callable, Iterator
+    from concurrent.futures import Executor
     from pathlib import Path
 
     from wexample_config.const.types import DictConfig
@@ -32,6 +36,7 @@ if TYPE_CHECKING:
         SourceFileOrDirectoryType,
         TargetFileOrDirectoryType,
     )
+    from wexample_filestate.enum.fsync_policy import FsyncPolicy
     from wexample_filestate.enum.scopes import Scope
     from wexample_filestate.operation.abstract_operation import AbstractOperation
     from wexample_filestate.result.abstract_result import AbstractResult
@@ -39,6 +44,14 @@ if TYPE_CHECKING:
         FileStateDryRunResult,
     )
     from wexample_filestate.result.file_state_result import FileStateResult
+    from wexample_filestate.service.option_fingerprint_store import (
+        OptionFingerprintStore,
+    )
+    from wexample_filestate.service.scan_index import ScanIndex
+    from wexample_filestate.utils.atomic_file_writer import AtomicFileWriter
+    from wexample_filestate.utils.path_filter import PathFilter
+    from wexample_filestate.utils.process_work_unit import ProcessWorkUnit
+    from wexample_filestate.utils.stat_snapshot import StatSnapshot
 
 
 @base_class
@@ -67,6 +80,37 @@ class AbstractItemTarget(
         description="Inputs (base_path, base_name) used to compute _cached_path; "
         "drives auto-invalidation if either changes.",
     )
+    _converge: bool = private_field(
+        default=False,
+        description="Whether content options are chained on each item during "
+        "the running apply() or dry_run(); only set on the root item.",
+    )
+    _file_writer: AtomicFileWriter | None = private_field(
+        default=None,
+        description="Writer of the files changed by the running apply(), with "
+        "its fsync policy; only set on the root item.",
+    )
+    _option_fingerprints: OptionFingerprintStore | None = private_field(
+        default=None,
+        description="Option checks found clean for a given content by previous "
+        "runs, used by apply(incremental=True); only set on the root item.",
+    )
+    _path_filter: PathFilter | None = private_field(
+        default=None,
+        description="Compiled filter_paths of the last run, reused while the "
+        "same filter paths are given; only set on the root item.",
+    )
+    _scan_index: ScanIndex | None = private_field(
+        default=None,
+        description="Index of items verified clean by previous runs, used by "
+        "apply(incremental=True); only set on the root item.",
+    )
+    _stat_snapshot: StatSnapshot | None = private_field(
+        default=None,
+        description="Filesystem metadata shared by the whole tree during an "
+        "apply() or dry_run(); only set on the root item.",
+    )
+    _converge_max_passes = 5
     _enable_bubbling = True
 
     def __attrs_post_init__(self) -> None:
@@ -112,7 +156,35 @@ class AbstractItemTarget(
         filter_operation: str | None = None,
         max: int = None,
         result: FileStateResult | None = None,
+        incremental: bool = False,
+        workers: int | None = None,
+        processes: bool = False,
+        converge: bool = False,
+        fsync_policy: FsyncPolicy | None = None,
     ) -> FileStateResult:
+        """Build and apply the operations needed to match the configuration.
+
+        With ``incremental=True``, items recorded as clean by a previous run
+        (same disk signature, same config) skip their option checks. Only use
+        it when options depend on the item itself and its config: content
+        generated from other files or from the environment is not tracked.
+        Content options additionally skip their check when the file content
+        and their config match a check that required nothing before.
+
+        With ``workers`` greater than 1, item checks run on a thread pool, or
+        on a process pool with ``processes=True``; see
+        :meth:`build_operations_parallel`. ``processes=True`` without more
+        than one worker raises a ValueError.
+
+        With ``converge=True``, the content options of a file are chained in
+        memory, each one checking the content proposed by the previous ones,
+        until none of them requires a change. The file then gets a single
+        write with the final content instead of one write per run.
+
+        Files are written atomically, through a temporary file renamed over
+        the previous one. ``fsync_policy`` decides when they are synced to
+        the disk, see FsyncPolicy; by default it is left to the system.
+        """
         from wexample_filestate.enum.scopes import Scope
         from wexample_filestate.result.file_state_result import FileStateResult
 
@@ -124,30 +196,104 @@ class AbstractItemTarget(
         self.last_result = result
 
         try:
-            self._prepare_options(scopes=scopes, filter_paths=filter_paths)
-
-            self.build_operations(
-                result=result,
+            with self._stat_snapshot_scope(), self._scan_index_scope(
+                incremental=incremental,
                 scopes=scopes,
-                filter_paths=filter_paths,
                 filter_operation=filter_operation,
-                max=max,
-            )
+            ), self._option_fingerprint_scope(
+                incremental=incremental, scopes=scopes
+            ), self._converge_scope(converge), self._file_writer_scope(fsync_policy):
+                self._prepare_options(scopes=scopes, filter_paths=filter_paths)
+
+                self._build_operations_with_workers(
+                    result=result,
+                    scopes=scopes,
+                    filter_paths=filter_paths,
+                    filter_operation=filter_operation,
+                    max=max,
+                    workers=workers,
+                    processes=processes,
+                )
+
+                if result.operations:
+                    result.apply_operations(interactive=interactive)
+
+                    # Push applied operations to history stack for sequential rollbacks
+                    applied_operations = [
+                        op for op in result.operations if op.applied
+                    ]
+                    if applied_operations:
+                        self.operations_history.append(applied_operations)
+                else:
+                    self.log(
+                        message=f"All configuration checks passed.",
+                    )
+        except KeyboardInterrupt:
+            self.log("Canceled by user")
 
-            if result.operations:
-                result.apply_operations(interactive=interactive)
+        return result
 
-                # Push applied operations to history stack for sequential rollbacks
-                applied_operations = [op for op in result.operations if op.applied]
-                if applied_operations:
-                    self.operations_history.append(applied_operations)
-            else:
-                self.log(
-                    message=f"All configuration checks passed.",
-                )
+    def apply_streaming(
+        self,
+        interactive: bool = False,
+        scopes: set[Scope] | None = None,
+        filter_paths: list[str] | None = None,
+        filter_operation: str | None = None,
+        max: int = None,
+        incremental: bool = False,
+        converge: bool = False,
+        fsync_policy: FsyncPolicy | None = None,
+    ) -> FileStateResult:
+        """Apply each operation as soon as it is found, see :meth:`iter_operations`.
+
+        Unlike :meth:`apply`, proposed contents are never all held in memory:
+        each one is released once applied, and so is the content read while
+        checking an item. Backups kept for :meth:`rollback` still follow the
+        remove_backup_max_file_size option.
+        """
+        from wexample_filestate.enum.scopes import Scope
+        from wexample_filestate.result.file_state_result import FileStateResult
+
+        result = FileStateResult(state_manager=self)
+
+        if scopes is None:
+            scopes = set(Scope)
+
+        self.last_result = result
+        applied_operations = []
+
+        try:
+            with self._stat_snapshot_scope(), self._scan_index_scope(
+                incremental=incremental,
+                scopes=scopes,
+                filter_operation=filter_operation,
+            ), self._option_fingerprint_scope(
+                incremental=incremental, scopes=scopes
+            ), self._converge_scope(converge), self._file_writer_scope(fsync_policy):
+                self._prepare_options(scopes=scopes, filter_paths=filter_paths)
+
+                for operation in self.iter_operations(
+                    scopes=scopes,
+                    filter_paths=filter_paths,
+                    filter_operation=filter_operation,
+                    max=max,
+                    release_content=True,
+                ):
+                    if result.apply_operation(operation, interactive=interactive):
+                        applied_operations.append(operation)
+                    operation.release_content()
+
+                if not result.operations:
+                    self.log(
+                        message=f"All configuration checks passed.",
+                    )
         except KeyboardInterrupt:
             self.log("Canceled by user")
 
+        # Push applied operations to history stack for sequential rollbacks
+        if applied_operations:
+            self.operations_history.append(applied_operations)
+
         return result
 
     def build_operations(
@@ -158,39 +304,84 @@ class AbstractItemTarget(
         filter_operation: str | None = None,
         max: int = None,
     ) -> bool:
-        from wexample_prompt.common.spinner_pool import SpinnerPool
-        from wexample_prompt.enums.verbosity_level import VerbosityLevel
-
-        if filter_paths is not None and self.get_path().exists():
-            if not any(self._path_matches(p) for p in filter_paths):
-                return False
-
-        self.io.indentation_up()
-
-        has_any_task: bool = False
-        # Allow to set active to false
-        if self.is_active():
-            loading_log = self.log(
-                message=f"{SpinnerPool.shared().next()} @path{{{self.get_display_path()}}}",
-            )
-
-            has_task: bool = False
-            has_any_task: bool = False
+        if not self._matches_filter_paths(filter_paths):
+            return False
 
-            operation = self._find_first_operation(scopes, filter_operation)
-            if operation is not None:
-                has_task = True
-                self.task(f"[{operation.get_name()}] {operation.description}")
-                result.operations.append(operation)
+        return self._collect_operation(
+            result=result,
+            find_operation=lambda: self._find_first_operation(
+                scopes, filter_operation
+            ),
+        )
 
-            if (
-                not has_task
-                and self.io.default_context_verbosity != VerbosityLevel.MAXIMUM
-            ):
-                self.io.erase_response(loading_log)
+    def build_operations_parallel(
+        self,
+        result: AbstractResult,
+        scopes: set[Scope],
+        workers: int,
+        filter_paths: list[str] | None = None,
+        filter_operation: str | None = None,
+        max: int = None,
+        processes: bool = False,
+    ) -> bool:
+        """Same as :meth:`build_operations`, with item checks on a worker pool.
+
+        The tree is walked (and lazily materialized) on the calling thread,
+        which also does all the logging and collects operations in tree order.
+        Only item checks run on the workers, for a bounded window of upcoming
+        items; pending checks are cancelled once ``max`` operations are
+        collected. Options must not modify the item tree while checking an
+        item.
+
+        With ``processes=True``, files whose options are all process pool
+        safe are checked in worker processes, which suits CPU-bound content
+        options; other items are checked on the calling thread.
+        """
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        start = len(result.operations)
+        has_task = False
+        candidates = self._iter_operation_candidates(filter_paths)
+        pending = deque()
+        executor = (
+            ProcessPoolExecutor(max_workers=workers)
+            if processes
+            else ThreadPoolExecutor(max_workers=workers)
+        )
 
-        self.io.indentation_down()
-        return has_any_task
+        try:
+            while True:
+                while len(pending) < workers * 4:
+                    item = next(candidates, None)
+                    if item is None:
+                        break
+                    pending.append(
+                        (
+                            item,
+                            item._submit_operation_check(
+                                executor=executor,
+                                scopes=scopes,
+                                filter_operation=filter_operation,
+                                processes=processes,
+                            ),
+                        )
+                    )
+
+                if not pending:
+                    break
+
+                item, find_operation = pending.popleft()
+                if item._collect_operation(
+                    result=result, find_operation=find_operation
+                ):
+                    has_task = True
+                    if max is not None and len(result.operations) - start >= max:
+                        break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return has_task
 
     def configure(self, config: DictConfig, eager: bool = False) -> None:
         """Configure this item from a raw config dict.
@@ -229,6 +420,9 @@ class AbstractItemTarget(
         filter_paths: list[str] | None = None,
         filter_operation: str | None = None,
         max: int = None,
+        workers: int | None = None,
+        processes: bool = False,
+        converge: bool = False,
     ) -> FileStateDryRunResult:
         from wexample_filestate.result.file_state_dry_run_result import (
             FileStateDryRunResult,
@@ -237,14 +431,17 @@ class AbstractItemTarget(
         result = FileStateDryRunResult(state_manager=self)
         try:
             self.last_result = result
-            self.build_operations(
-                result=result,
-                scopes=scopes,
-                filter_paths=filter_paths,
-                filter_operation=filter_operation,
-                max=max,
-            )
-            result.apply_operations()
+            with self._stat_snapshot_scope(), self._converge_scope(converge):
+                self._build_operations_with_workers(
+                    result=result,
+                    scopes=scopes,
+                    filter_paths=filter_paths,
+                    filter_operation=filter_operation,
+                    max=max,
+                    workers=workers,
+                    processes=processes,
+                )
+                result.apply_operations()
         except KeyboardInterrupt:
             self.log("Canceled by user")
 
@@ -294,6 +491,25 @@ class AbstractItemTarget(
         # Mey be refactored soon.
         return self.base_name
 
+    def get_option_by_key_path(self, key_path: list[str]) -> OptionMixin | None:
+        """Resolve an option from the keys returned by get_option_key_path()."""
+        holder = self
+        for key in key_path:
+            options = getattr(holder, "options", None)
+            if not options or key not in options:
+                return None
+            holder = options[key]
+        return holder
+
+    def get_option_key_path(self, option: OptionMixin) -> list[str]:
+        """Return the option keys leading from this item to a nested option."""
+        key_path = []
+        while option is not None and option is not self:
+            key_path.append(option.get_name())
+            option = option.parent
+        key_path.reverse()
+        return key_path
+
     def get_options_providers(self) -> list[type[AbstractOptionsProvider]]:
         from wexample_filestate.options_provider.default_options_provider import (
             DefaultOptionsProvider,
@@ -307,6 +523,16 @@ class AbstractItemTarget(
             DefaultOptionsProvider,
         ]
 
+    def get_file_writer(self) -> AtomicFileWriter:
+        """Return the file writer of the running apply(), or a default one."""
+        from wexample_filestate.utils.atomic_file_writer import AtomicFileWriter
+
+        return self._get_tree_root()._file_writer or AtomicFileWriter()
+
+    def get_option_fingerprint_store(self) -> OptionFingerprintStore | None:
+        """Return the option fingerprints of the running incremental apply(), if any."""
+        return self._get_tree_root()._option_fingerprints
+
     def get_path(self) -> Path:
         from pathlib import Path
 
@@ -335,6 +561,14 @@ class AbstractItemTarget(
         assert self.source is not None
         return self.source
 
+    def get_scan_index(self) -> ScanIndex | None:
+        """Return the scan index of the running incremental apply(), if any."""
+        return self._get_tree_root()._scan_index
+
+    def get_stat_snapshot(self) -> StatSnapshot | None:
+        """Return the filesystem snapshot of the running apply()/dry_run(), if any."""
+        return self._get_tree_root()._stat_snapshot
+
     def is_active(self) -> bool:
         from wexample_filestate.option.active_option import (
             ActiveOption,
@@ -345,15 +579,49 @@ class AbstractItemTarget(
             active_option.get_value().raw
         )
 
+    def iter_operations(
+        self,
+        scopes: set[Scope],
+        filter_paths: list[str] | None = None,
+        filter_operation: str | None = None,
+        max: int = None,
+        release_content: bool = False,
+    ) -> Iterator[AbstractOperation]:
+        """Yield required operations as they are found, in tree order.
+
+        The tree is checked lazily: applying a yielded operation before
+        resuming the iteration is allowed, and later checks see its effect.
+        With ``release_content=True``, each item drops the content it read
+        once it has been checked and its operation, if any, consumed.
+        """
+        count = 0
+        with self._stat_snapshot_scope() as snapshot:
+            for item in self._iter_operation_candidates(filter_paths):
+                operation = item._check_operation(
+                    lambda: item._find_first_operation(scopes, filter_operation)
+                )
+                if operation is not None:
+                    yield operation
+                    count += 1
+                    # The consumer may have applied the operation.
+                    for path in operation.get_affected_paths():
+                        snapshot.invalidate(path)
+
+                if release_content:
+                    item.release_content()
+
+                if max is not None and count >= max:
+                    return
+
     def locate_source(self, path: Path) -> SourceFileOrDirectoryType:
         from wexample_filestate.item.item_source_directory import ItemSourceDirectory
         from wexample_filestate.item.item_source_file import ItemSourceFile
 
-        if path.is_file():
+        if self.path_is_file(path):
             self.source = ItemSourceFile(
                 path=path,
             )
-        elif path.is_dir():
+        elif self.path_is_dir(path):
             self.source = ItemSourceDirectory(
                 path=path,
             )
@@ -375,6 +643,40 @@ class AbstractItemTarget(
             event=operation.get_event_name(suffix=suffix), payload=payload, **kwargs
         )
 
+    def path_exists(self, path: Path | None = None) -> bool:
+        path = path or self.get_path()
+        snapshot = self.get_stat_snapshot()
+        return snapshot.exists(path) if snapshot else path.exists()
+
+    def path_is_dir(self, path: Path | None = None) -> bool:
+        path = path or self.get_path()
+        snapshot = self.get_stat_snapshot()
+        return snapshot.is_dir(path) if snapshot else path.is_dir()
+
+    def path_is_file(self, path: Path | None = None) -> bool:
+        path = path or self.get_path()
+        snapshot = self.get_stat_snapshot()
+        return snapshot.is_file(path) if snapshot else path.is_file()
+
+    def path_is_symlink(self, path: Path | None = None) -> bool:
+        path = path or self.get_path()
+        snapshot = self.get_stat_snapshot()
+        return snapshot.is_symlink(path) if snapshot else path.is_symlink()
+
+    def path_stat(self, path: Path | None = None) -> os.stat_result | None:
+        """Stat ``path`` (default: this item) following symlinks; None if missing."""
+        path = path or self.get_path()
+        snapshot = self.get_stat_snapshot()
+        if snapshot:
+            return snapshot.stat(path)
+        try:
+            return path.stat()
+        except OSError:
+            return None
+
+    def release_content(self) -> None:
+        """Drop file content held in memory; the next read hits the disk."""
+
     def render_display_path(self) -> str:
         from wexample_helpers.helpers.cli import cli_make_clickable_path
 
@@ -420,7 +722,7 @@ class AbstractItemTarget(
             return None
 
         if _path_exists is None:
-            _path_exists = self.get_path().exists()
+            _path_exists = self.path_exists()
         if not _path_exists and not option.applicable_on_missing():
             return None
 
@@ -428,9 +730,18 @@ class AbstractItemTarget(
             if not self.get_local_file().read().strip():
                 return None
 
+        fingerprint_store = self.get_option_fingerprint_store()
+        fingerprint = None
+        if fingerprint_store is not None and _path_exists and self.is_file():
+            fingerprint = fingerprint_store.build_fingerprint(self, option)
+            if fingerprint is not None and fingerprint_store.is_clean(fingerprint):
+                return None
+
         # Create the required operation (returns None if satisfied/not applicable)
         operation = option.create_required_operation(target=self, scopes=scopes)
         if operation is None:
+            if fingerprint is not None:
+                fingerprint_store.mark_clean(fingerprint)
             return None
 
         # Apply filters
@@ -439,16 +750,164 @@ class AbstractItemTarget(
 
         return operation
 
-    def _find_first_operation(
+    def _build_operations_with_workers(
+        self,
+        result: AbstractResult,
+        scopes: set[Scope],
+        filter_paths: list[str] | None = None,
+        filter_operation: str | None = None,
+        max: int = None,
+        workers: int | None = None,
+        processes: bool = False,
+    ) -> bool:
+        if processes and (workers is None or workers < 2):
+            raise ValueError(
+                f"processes=True requires more than one worker, got workers={workers}"
+            )
+
+        if workers is not None and workers > 1:
+            return self.build_operations_parallel(
+                result=result,
+                scopes=scopes,
+                workers=workers,
+                filter_paths=filter_paths,
+                filter_operation=filter_operation,
+                max=max,
+                processes=processes,
+            )
+
+        return self.build_operations(
+            result=result,
+            scopes=scopes,
+            filter_paths=filter_paths,
+            filter_operation=filter_operation,
+            max=max,
+        )
+
+    def _check_operation(
+        self,
+        find_operation: Callable[[], AbstractOperation | None],
+    ) -> AbstractOperation | None:
+        """Log this item while looking for the operation it requires, if any."""
+        from wexample_prompt.common.spinner_pool import SpinnerPool
+        from wexample_prompt.enums.verbosity_level import VerbosityLevel
+
+        self.io.indentation_up()
+
+        operation = None
+        # Allow to set active to false
+        if self.is_active():
+            loading_log = self.log(
+                message=f"{SpinnerPool.shared().next()} @path{{{self.get_display_path()}}}",
+            )
+
+            operation = find_operation()
+            if operation is not None:
+                self.task(f"[{operation.get_name()}] {operation.description}")
+            elif self.io.default_context_verbosity != VerbosityLevel.MAXIMUM:
+                self.io.erase_response(loading_log)
+
+        self.io.indentation_down()
+        return operation
+
+    def _collect_operation(
+        self,
+        result: AbstractResult,
+        find_operation: Callable[[], AbstractOperation | None],
+    ) -> bool:
+        """Append the operation this item requires to the result, if any."""
+        operation = self._check_operation(find_operation)
+        if operation is None:
+            return False
+
+        result.operations.append(operation)
+        return True
+
+    @contextmanager
+    def _converge_scope(self, converge: bool) -> Iterator[None]:
+        """Chain content options on each item for the duration of a run."""
+        root = self._get_tree_root()
+        if not converge or root._converge:
+            yield
+            return
+
+        root._converge = True
+        try:
+            yield
+        finally:
+            root._converge = False
+
+    def _create_operation_from_process_payload(
+        self,
+        payload: dict[str, Any] | None,
+        scopes: set[Scope],
+        filter_operation: str | None = None,
+    ) -> AbstractOperation | None:
+        from wexample_filestate.operation.file_write_operation import FileWriteOperation
+
+        if payload is None:
+            return None
+
+        option = (
+            None
+            if payload.get("fallback")
+            else self.get_option_by_key_path(payload["option_path"])
+        )
+        if option is None:
+            return self._evaluate_options(scopes, filter_operation)
+
+        return FileWriteOperation(
+            option=option,
+            target=self,
+            content=payload["content"],
+            description=payload["description"],
+        )
+
+    def _create_process_work_unit(
+        self,
+        scopes: set[Scope],
+        filter_operation: str | None = None,
+    ) -> ProcessWorkUnit | None:
+        """Describe this item check for a worker process, if it can run there."""
+        from wexample_filestate.helpers.config_fingerprint import config_fingerprint
+        from wexample_filestate.utils.process_work_unit import ProcessWorkUnit
+
+        if not self.is_file() or not self.path_exists():
+            return None
+
+        for option in self.iter_options_recursive():
+            if not isinstance(option, OptionMixin) or not option.is_process_pool_safe():
+                return None
+
+        # Only configs made of primitives can be sent and rebuilt faithfully.
+        config = self.get_value().raw
+        if not isinstance(config, dict) or config_fingerprint(config) is None:
+            return None
+
+        scan_index = self.get_scan_index()
+        if scan_index is not None:
+            entry = scan_index.build_entry(self)
+            if entry is not None and scan_index.is_clean(self, entry):
+                return None
+
+        return ProcessWorkUnit(
+            config=config,
+            converge=self._get_tree_root()._converge,
+            filter_operation=filter_operation,
+            item_class=type(self),
+            path=str(self.get_path()),
+            scopes=scopes,
+        )
+
+    def _evaluate_options(
         self: TargetFileOrDirectoryType,
         scopes: set[Scope],
         filter_operation: str | None = None,
     ) -> AbstractOperation | None:
-        """Find the first option that requires an operation and return it.
+        path_exists = self.path_exists()
+        if path_exists and self.is_file() and self._get_tree_root()._converge:
+            return self._evaluate_options_converging(scopes, filter_operation)
 
-        Returns None if no operation is required.
-        """
-        path_exists = self.get_path().exists()
         for option in self.options.values():
             operation = self.try_create_operation_from_option(
                 option, scopes, filter_operation, _path_exists=path_exists
@@ -457,9 +916,145 @@ class AbstractItemTarget(
                 return operation
         return None
 
+    def _evaluate_options_converging(
+        self: TargetFileOrDirectoryType,
+        scopes: set[Scope],
+        filter_operation: str | None = None,
+    ) -> AbstractOperation | None:
+        """Chain the content options of this file until they all are satisfied.
+
+        Writes proposed by convergence safe options are staged on the item
+        instead of returned, so the next options check the proposed content;
+        passes are repeated until none proposes a change. Other operations are
+        returned as usual while nothing is staged, and are left to the next
+        run otherwise.
+        """
+        from wexample_filestate.operation.file_write_operation import FileWriteOperation
+
+        writes = []
+        try:
+            for _ in range(self._converge_max_passes):
+                changed = False
+                for option in self.options.values():
+                    if writes and not option.is_convergence_safe():
+                        continue
+
+                    operation = self.try_create_operation_from_option(
+                        option, scopes, filter_operation, _path_exists=True
+                    )
+                    if operation is None:
+                        continue
+
+                    if (
+                        not option.is_convergence_safe()
+                        or type(operation) is not FileWriteOperation
+                        or operation.target is not self
+                    ):
+                        if not writes:
+                            return operation
+                        continue
+
+                    writes.append(operation)
+                    self.stage_content(operation.content)
+                    changed = True
+
+                if not changed:
+                    break
+        finally:
+            if writes:
+                self.stage_content(None)
+
+        if not writes or writes[-1].content == self.get_current_content():
+            return None
+
+        return FileWriteOperation(
+            option=writes[0].option,
+            target=self,
+            content=writes[-1].content,
+            description="; ".join(
+                dict.fromkeys(operation.description for operation in writes)
+            ),
+        )
+
+    def _find_first_operation(
+        self: TargetFileOrDirectoryType,
+        scopes: set[Scope],
+        filter_operation: str | None = None,
+        evaluate: Callable[[], AbstractOperation | None] | None = None,
+    ) -> AbstractOperation | None:
+        """Find the first option that requires an operation and return it.
+
+        Returns None if no operation is required. ``evaluate`` replaces the
+        in-process option checks, e.g. to collect a worker process result.
+        """
+        scan_index = self.get_scan_index()
+        entry = scan_index.build_entry(self) if scan_index is not None else None
+        if entry is not None and scan_index.is_clean(self, entry):
+            return None
+
+        if evaluate is not None:
+            operation = evaluate()
+        else:
+            operation = self._evaluate_options(scopes, filter_operation)
+
+        if scan_index is not None:
+            if operation is not None:
+                scan_index.forget(self)
+            elif entry is not None:
+                scan_index.mark_clean(self, entry)
+        return operation
+
+    @contextmanager
+    def _file_writer_scope(
+        self, fsync_policy: FsyncPolicy | None
+    ) -> Iterator[AtomicFileWriter]:
+        """Share one file writer across the tree for the duration of a run.
+
+        Files still waiting for a batched sync are synced when leaving it.
+        """
+        from wexample_filestate.enum.fsync_policy import FsyncPolicy
+        from wexample_filestate.utils.atomic_file_writer import AtomicFileWriter
+
+        root = self._get_tree_root()
+        if root._file_writer is not None:
+            yield root._file_writer
+            return
+
+        root._file_writer = AtomicFileWriter(
+            fsync_policy=FsyncPolicy(fsync_policy or FsyncPolicy.NONE)
+        )
+        try:
+            yield root._file_writer
+        finally:
+            try:
+                root._file_writer.flush()
+            finally:
+                root._file_writer = None
+
     def _get_bubbling_parent(self):
         return self.get_parent_item_or_none()
 
+    def _get_path_filter(self, filter_paths: list[str] | None) -> PathFilter | None:
+        from wexample_filestate.utils.path_filter import PathFilter
+
+        if filter_paths is None:
+            return None
+
+        root = self._get_tree_root()
+        path_filter = root._path_filter
+        if path_filter is None or path_filter.patterns != filter_paths:
+            path_filter = PathFilter(patterns=list(filter_paths))
+            root._path_filter = path_filter
+        return path_filter
+
+    def _get_tree_root(self) -> AbstractItemTarget:
+        # Walk up without get_root(): memoizing the root on a standalone item
+        # makes it reference itself, which breaks attrs equality.
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
     def _init_listeners(self) -> None:
         """Add event listeners"""
 
@@ -473,6 +1068,25 @@ class AbstractItemTarget(
         self._cached_path = None
         self._cached_path_key = None
 
+        # The name or path of this item may have changed.
+        parent = self.get_parent_item_or_none()
+        if parent is not None:
+            parent._invalidate_lookups()
+
+    def _iter_operation_candidates(
+        self, filter_paths: list[str] | None = None
+    ) -> Iterator[AbstractItemTarget]:
+        """Yield the items build_operations() would check, in the same order."""
+        if self.is_active() and self._matches_filter_paths(filter_paths):
+            yield self
+
+    def _matches_filter_paths(self, filter_paths: list[str] | None = None) -> bool:
+        path_filter = self._get_path_filter(filter_paths)
+        if path_filter is None or path_filter.matches(str(self.get_path())):
+            return True
+        # Missing items are never filtered out, they may have to be created.
+        return not self.path_exists()
+
     def _operation_passes_filters(
         self,
         operation: AbstractOperation,
@@ -490,21 +1104,28 @@ class AbstractItemTarget(
 
         return True
 
-    def _path_matches(self, pattern: str) -> bool:
-        import fnmatch
-        import os
-
-        path_str = str(self.get_path())
-
-        if os.path.isabs(pattern):
-            return path_str == pattern or path_str.startswith(pattern + os.sep)
+    @contextmanager
+    def _option_fingerprint_scope(
+        self, incremental: bool, scopes: set[Scope]
+    ) -> Iterator[OptionFingerprintStore | None]:
+        """Load option fingerprints for an incremental run, save them on success."""
+        from wexample_filestate.service.option_fingerprint_store import (
+            OptionFingerprintStore,
+        )
 
-        if not pattern.startswith("*"):
-            pattern = "*" + pattern
-        if not pattern.endswith("*"):
-            pattern = pattern + "*"
+        root = self._get_tree_root()
+        if not incremental or root._option_fingerprints is not None:
+            yield root._option_fingerprints
+            return
 
-        return fnmatch.fnmatch(path_str, pattern)
+        root._option_fingerprints = OptionFingerprintStore.create_for_root(
+            root=root, scopes=scopes
+        )
+        try:
+            yield root._option_fingerprints
+            root._option_fingerprints.save()
+        finally:
+            root._option_fingerprints = None
 
     def _prepare_options(
         self,
@@ -533,6 +1154,90 @@ class AbstractItemTarget(
                     continue
                 option.prepare(self, scopes, filter_paths)
 
+        def visit_children(directory: ItemTargetDirectory) -> None:
+            # Subtrees filter_paths cannot match are not materialized.
+            if not directory._may_match_filter_below(filter_paths):
+                return
+            for child in directory.get_children_list():
+                if isinstance(child, ItemTargetDirectory):
+                    visit_children(child)
+                visit(child)
+
         visit(self)
         if isinstance(self, ItemTargetDirectory):
-            self.for_each_child_recursive(visit)
+            visit_children(self)
+
+    @contextmanager
+    def _scan_index_scope(
+        self,
+        incremental: bool,
+        scopes: set[Scope],
+        filter_operation: str | None = None,
+    ) -> Iterator[ScanIndex | None]:
+        """Load the scan index for an incremental run and save it on success."""
+        from wexample_filestate.service.scan_index import ScanIndex
+
+        root = self._get_tree_root()
+        if not incremental or root._scan_index is not None:
+            yield root._scan_index
+            return
+
+        root._scan_index = ScanIndex.create_for_root(
+            root=root, scopes=scopes, filter_operation=filter_operation
+        )
+        try:
+            yield root._scan_index
+            root._scan_index.commit()
+            root._scan_index.save()
+        finally:
+            root._scan_index = None
+
+    @contextmanager
+    def _stat_snapshot_scope(self) -> Iterator[StatSnapshot]:
+        """Share one StatSnapshot across the tree for the duration of a run.
+
+        Nested runs (e.g. apply() called from an operation) reuse the snapshot
+        already installed on the root instead of replacing it.
+        """
+        from wexample_filestate.utils.stat_snapshot import StatSnapshot
+
+        root = self._get_tree_root()
+        if root._stat_snapshot is not None:
+            yield root._stat_snapshot
+            return
+
+        root._stat_snapshot = StatSnapshot()
+        try:
+            yield root._stat_snapshot
+        finally:
+            root._stat_snapshot = None
+
+    def _submit_operation_check(
+        self,
+        executor: Executor,
+        scopes: set[Scope],
+        filter_operation: str | None = None,
+        processes: bool = False,
+    ) -> Callable[[], AbstractOperation | None]:
+        """Start checking this item on executor.
+
+        Returns the callable collecting the resulting operation; items that
+        cannot be sent to a worker process are checked when collected.
+        """
+        if not processes:
+            return executor.submit(
+                self._find_first_operation, scopes, filter_operation
+            ).result
+
+        unit = self._create_process_work_unit(scopes, filter_operation)
+        if unit is None:
+            return lambda: self._find_first_operation(scopes, filter_operation)
+
+        future = executor.submit(unit.run)
+        return lambda: self._find_first_operation(
+            scopes,
+            filter_operation,
+            evaluate=lambda: self._create_operation_from_process_payload(
+                future.result(), scopes, filter_operation
+            ),
+        )
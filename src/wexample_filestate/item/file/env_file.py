@@ -5,37 +5,29 @@ from typing import TYPE_CHECKING, ClassVar
 from wexample_filestate.item.file.structured_content_file import StructuredContentFile
 
 if TYPE_CHECKING:
-    from wexample_helpers.const.types import StructuredData
+    from wexample_filestate.serializer.abstract_serializer_backend import (
+        AbstractSerializerBackend,
+    )
 
 
 class EnvFile(StructuredContentFile):
     """
-    Simple .env reader/writer using python-dotenv.
+    Simple .env reader/writer, using python-dotenv by default.
     """
 
     EXTENSION_ENV: ClassVar[str] = "env"
     EXTENSION_DOT_ENV: ClassVar[str] = f".{EXTENSION_ENV}"
 
-    def dumps(self, content: StructuredData | None) -> str:
-        # Produce .env textual content from a dict-like mapping
-        if not isinstance(content, dict):
-            return ""
-        return (
-            "\n".join(f"{k}={'' if v is None else v}" for k, v in content.items())
-            + "\n"
+    @classmethod
+    def get_serializer_backend_classes(cls) -> list[type[AbstractSerializerBackend]]:
+        from wexample_filestate.serializer.dotenv_serializer_backend import (
+            DotenvSerializerBackend,
+        )
+        from wexample_filestate.serializer.env_serializer_backend import (
+            EnvSerializerBackend,
         )
 
-    def loads(self, text: str, strict: bool = True) -> StructuredData:
-        from io import StringIO
-
-        from dotenv import dotenv_values
-
-        try:
-            return dict(dotenv_values(stream=StringIO(text)))
-        except Exception as e:
-            if strict:
-                raise e
-            return {}
+        return [DotenvSerializerBackend, EnvSerializerBackend]
 
     def _expected_file_name_extension(self) -> str:
         return self.EXTENSION_ENV
@@ -5,26 +5,24 @@ from typing import TYPE_CHECKING, ClassVar
 from wexample_filestate.item.file.structured_content_file import StructuredContentFile
 
 if TYPE_CHECKING:
-    from wexample_helpers.const.types import JsonContent, StructuredData
+    from wexample_filestate.serializer.abstract_serializer_backend import (
+        AbstractSerializerBackend,
+    )
 
 
 class JsonFile(StructuredContentFile):
     EXTENSION_JSON: ClassVar[str] = "json"
 
-    def dumps(self, content: StructuredData | None) -> str:
-        import json
+    @classmethod
+    def get_serializer_backend_classes(cls) -> list[type[AbstractSerializerBackend]]:
+        from wexample_filestate.serializer.json_serializer_backend import (
+            JsonSerializerBackend,
+        )
+        from wexample_filestate.serializer.orjson_serializer_backend import (
+            OrjsonSerializerBackend,
+        )
 
-        return json.dumps(content or {}, ensure_ascii=False, indent=2)
-
-    def loads(self, text: str, strict: bool = True) -> JsonContent:  # type: ignore[name-defined]
-        import json
-
-        try:
-            return json.loads(text)
-        except Exception as e:
-            if strict:
-                raise e
-            return {}
+        return [JsonSerializerBackend, OrjsonSerializerBackend]
 
     def _expected_file_name_extension(self) -> str:
         return self.EXTENSION_JSON
@@ -98,9 +98,9 @@ class MarkdownFile(StructuredContentFile):
             front = YamlFile._get_yaml().load(StringIO(front_raw))
             if front is None:
                 front = {}
-        except Exception as e:
+        except Exception:
             if strict:
-                raise e
+                raise
             front = {}
 
         return {"front": front, "body": body}
@@ -109,12 +109,12 @@ class MarkdownFile(StructuredContentFile):
         return self.read_parsed(reload=reload).get("body", "")
 
     def read_front_matter(self, reload: bool = False) -> NestedConfigValue:
-        from copy import deepcopy
-
-        from wexample_config.config_value.nested_config_value import NestedConfigValue
+        from wexample_filestate.config_value.copy_on_write_config_value import (
+            CopyOnWriteConfigValue,
+        )
 
         front = self.read_parsed(reload=reload).get("front") or {}
-        return NestedConfigValue(raw=deepcopy(front))
+        return CopyOnWriteConfigValue(raw=front)
 
     def write_content(
         self,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
@@ -12,9 +12,21 @@ if TYPE_CHECKING:
     from wexample_config.const.types import DictConfig
     from wexample_helpers.const.types import Scalar
 
+    from wexample_filestate.serializer.abstract_serializer_backend import (
+        AbstractSerializerBackend,
+    )
+
+# Backends selected at runtime with use_serializer_backend, keyed by file
+# class and read-only flag; they apply to subclasses too.
+_SELECTED_SERIALIZER_BACKENDS: dict[tuple[type, bool], str] = {}
+
 
 @base_class
 class StructuredContentFile(ItemTargetFile):
+    # Default backend names, None meaning the first listed read-write backend.
+    _read_only_serializer_backend_name: ClassVar[str | None] = None
+    _serializer_backend_name: ClassVar[str | None] = None
+
     _content_cache_config: NestedConfigValue | None = private_field(
         default=None,
         description="Cached configuration content for structured file access",
@@ -24,6 +36,94 @@ class StructuredContentFile(ItemTargetFile):
         description="Cached parsed representation of structured layers",
     )
 
+    @classmethod
+    def get_serializer_backend(
+        cls, read_only: bool = False
+    ) -> type[AbstractSerializerBackend] | None:
+        """Return the backend parsing and dumping the text of this file type.
+
+        The read-only backend is only used by loads_read_only and defaults to
+        the read-write one.
+        """
+        backends = cls.get_serializer_backends()
+        if not backends:
+            return None
+
+        if read_only:
+            name = cls._get_selected_serializer_backend_name(read_only=True)
+            if name in backends:
+                return backends[name]
+
+        name = cls._get_selected_serializer_backend_name(read_only=False)
+        if name in backends:
+            return backends[name]
+
+        for backend in backends.values():
+            if not backend.is_read_only():
+                return backend
+        return None
+
+    @classmethod
+    def get_serializer_backend_classes(cls) -> list[type[AbstractSerializerBackend]]:
+        """Return the supported backends, the default read-write one first."""
+        return []
+
+    @classmethod
+    def get_serializer_backends(cls) -> dict[str, type[AbstractSerializerBackend]]:
+        """Return the supported backends whose dependencies are installed, by name."""
+        return {
+            backend.get_name(): backend
+            for backend in cls.get_serializer_backend_classes()
+            if backend.is_available()
+        }
+
+    @classmethod
+    def loads_read_only(cls, text: str) -> Any:
+        """Parse text into plain data, for checks that never write it back.
+
+        Raises on invalid content, like loads in strict mode.
+        """
+        backend = cls.get_serializer_backend(read_only=True)
+        if backend is None:
+            return text
+        return backend.loads(text)
+
+    @classmethod
+    def use_serializer_backend(cls, name: str | None, read_only: bool = False) -> None:
+        """Select the backend of this file type and its subclasses by name.
+
+        None restores the default backend.
+        """
+        key = (cls, read_only)
+        if name is None:
+            _SELECTED_SERIALIZER_BACKENDS.pop(key, None)
+            return
+
+        backends = cls.get_serializer_backends()
+        if name not in backends:
+            raise ValueError(
+                f'Unknown or unavailable serializer backend "{name}" for '
+                f"{cls.__name__}, available: {', '.join(backends) or 'none'}"
+            )
+        if not read_only and backends[name].is_read_only():
+            raise ValueError(
+                f'Serializer backend "{name}" is read-only and cannot write '
+                f"{cls.__name__} files"
+            )
+
+        _SELECTED_SERIALIZER_BACKENDS[key] = name
+
+    @classmethod
+    def _get_selected_serializer_backend_name(cls, read_only: bool) -> str | None:
+        for klass in cls.__mro__:
+            name = _SELECTED_SERIALIZER_BACKENDS.get((klass, read_only))
+            if name is not None:
+                return name
+
+        if read_only:
+            return cls._read_only_serializer_backend_name
+        return cls._serializer_backend_name
+
     def clear(self) -> None:
         super().clear()
 
@@ -39,12 +139,24 @@ class StructuredContentFile(ItemTargetFile):
         self._content_cache_config = None
 
     def dumps(self, content: Any) -> str:
-        # Default fallback: stringify. Subclasses should override for structured formats.
-        return str(content)
+        backend = self.get_serializer_backend()
+        if backend is None:
+            # Default fallback: stringify.
+            return str(content)
+        return backend.dumps(content)
 
     def loads(self, text: str, strict: bool = True) -> Any:
-        # Default fallback: return as-is (no parsing). Subclasses should override.
-        return text
+        backend = self.get_serializer_backend()
+        if backend is None:
+            # Default fallback: return as-is (no parsing).
+            return text
+
+        try:
+            return backend.loads(text)
+        except Exception:
+            if strict:
+                raise
+            return backend.create_empty_content()
 
     def prepare_value(self, raw_value: DictConfig | None = None) -> DictConfig:
         from wexample_filestate.option.should_have_extension_option import (
@@ -91,19 +203,35 @@ class StructuredContentFile(ItemTargetFile):
         return self.dumps(raw)
 
     def read_config(self, reload: bool = False) -> NestedConfigValue:
-        from copy import deepcopy
-
-        from wexample_config.config_value.nested_config_value import NestedConfigValue
+        from wexample_filestate.config_value.copy_on_write_config_value import (
+            CopyOnWriteConfigValue,
+        )
 
         if reload or self._is_cache_stale():
             self._content_cache_config = None
         if self._content_cache_config is None:
             parsed = self.read_parsed(reload=reload)
-            # Pass a deep copy to avoid any in-place mutation of the shared parsed cache
-            self._content_cache_config = NestedConfigValue(raw=deepcopy(parsed))
+            # Copies the containers of the parsed cache, not its scalars
+            self._content_cache_config = CopyOnWriteConfigValue(raw=parsed)
 
         return self._content_cache_config
 
+    def read_key_paths(self, key_paths: list[str]) -> dict[str, Any] | None:
+        """Return the values at dotted key paths without a full parse when possible.
+
+        Values equal the ones read_parsed would hold, missing key paths map to
+        None. Returns None when the backend cannot read them partially; the
+        caller should then use read_parsed.
+        """
+        backend = self.get_serializer_backend()
+        if backend is None:
+            return None
+
+        try:
+            return backend.loads_key_paths(self.read_text(), key_paths)
+        except Exception:
+            return None
+
     def read_parsed(self, reload: bool = False, strict: bool = False) -> Any:
         if reload or self._parsed_cache is None or self._is_cache_stale():
             text = super().read_text(reload=reload)
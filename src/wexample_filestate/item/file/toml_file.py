@@ -7,50 +7,25 @@ from wexample_helpers.decorator.base_class import base_class
 from wexample_filestate.item.file.structured_content_file import StructuredContentFile
 
 if TYPE_CHECKING:
-    from tomlkit import TOMLDocument
+    from wexample_filestate.serializer.abstract_serializer_backend import (
+        AbstractSerializerBackend,
+    )
 
 
 @base_class
 class TomlFile(StructuredContentFile):
     EXTENSION_TOML: ClassVar[str] = "toml"
 
-    def dumps(self, content: TOMLDocument | dict | None) -> str:
-        # from tomlkit import dumps as toml_dumps
-        from tomlkit import TOMLDocument, document, dumps
-
-        if content is None:
-            return dumps(document())
-
-        # If it's already a TOMLDocument, dump as-is to preserve formatting
-        try:
-            if isinstance(content, TOMLDocument):
-                return dumps(content)
-        except Exception:
-            pass
-
-        # Otherwise, attempt to create a TOMLDocument from a dict-like value
-        if isinstance(content, dict):
-            doc = document()
-            for k, v in content.items():
-                doc[k] = v
-            return dumps(doc)
-
-        # Fallback: stringify
-        return str(content)
-
-    def loads(self, text: str, strict: bool = True) -> TOMLDocument:
-        from tomlkit import document, parse
-
-        try:
-            if not text:
-                # Return an empty TOMLDocument to keep types consistent
-                return document()
-            return parse(text)
-        except Exception as e:
-            if strict:
-                raise e
-            # On parse error, return an empty TOMLDocument instead of a dict
-            return document()
+    @classmethod
+    def get_serializer_backend_classes(cls) -> list[type[AbstractSerializerBackend]]:
+        from wexample_filestate.serializer.toml_serializer_backend import (
+            TomlSerializerBackend,
+        )
+        from wexample_filestate.serializer.tomllib_serializer_backend import (
+            TomllibSerializerBackend,
+        )
+
+        return [TomlSerializerBackend, TomllibSerializerBackend]
 
     def _expected_file_name_extension(self) -> str:
         return self.EXTENSION_TOML
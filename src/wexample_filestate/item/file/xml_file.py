@@ -5,33 +5,24 @@ from typing import TYPE_CHECKING, ClassVar
 from wexample_filestate.item.file.structured_content_file import StructuredContentFile
 
 if TYPE_CHECKING:
-    from wexample_helpers.const.types import StructuredData
+    from wexample_filestate.serializer.abstract_serializer_backend import (
+        AbstractSerializerBackend,
+    )
 
 
 class XmlFile(StructuredContentFile):
     EXTENSION_XML: ClassVar[str] = "xml"
 
-    def dumps(self, content: StructuredData | None) -> str:
-        import xmltodict
-
-        if isinstance(content, str):
-            # Already XML string
-            return content
-        try:
-            return xmltodict.unparse(content or {}, pretty=True)
-        except Exception:
-            return str(content)
-
-    def loads(self, text: str, strict: bool = True) -> StructuredData:
-        import xmltodict
-
-        try:
-            parsed = xmltodict.parse(text)
-            return parsed or {}
-        except Exception as e:
-            if strict:
-                raise e
-            return {}
+    @classmethod
+    def get_serializer_backend_classes(cls) -> list[type[AbstractSerializerBackend]]:
+        from wexample_filestate.serializer.xml_iterparse_serializer_backend import (
+            XmlIterparseSerializerBackend,
+        )
+        from wexample_filestate.serializer.xmltodict_serializer_backend import (
+            XmltodictSerializerBackend,
+        )
+
+        return [XmltodictSerializerBackend, XmlIterparseSerializerBackend]
 
     def _expected_file_name_extension(self) -> str:
         return self.EXTENSION_XML
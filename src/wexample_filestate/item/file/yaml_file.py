@@ -7,31 +7,41 @@ from wexample_helpers.const.types import StructuredData
 from wexample_filestate.item.file.structured_content_file import StructuredContentFile
 
 if TYPE_CHECKING:
+    from ruamel.yaml import YAML
     from wexample_helpers.const.types import StructuredData
     from wexample_helpers_yaml.const.types import YamlContent
 
+    from wexample_filestate.serializer.abstract_serializer_backend import (
+        AbstractSerializerBackend,
+    )
+
 
 class YamlFile(StructuredContentFile):
     EXTENSION_YAML: ClassVar[str] = "yaml"
     EXTENSION_YML: ClassVar[str] = "yml"
+    _read_only_serializer_backend_name: ClassVar[str | None] = "pyyaml"
+
+    @classmethod
+    def get_serializer_backend_classes(cls) -> list[type[AbstractSerializerBackend]]:
+        from wexample_filestate.serializer.pyyaml_serializer_backend import (
+            PyyamlSerializerBackend,
+        )
+        from wexample_filestate.serializer.yaml_serializer_backend import (
+            YamlSerializerBackend,
+        )
+
+        return [YamlSerializerBackend, PyyamlSerializerBackend]
 
     @staticmethod
     def _get_yaml() -> YAML:
-        """Return a ruamel.yaml instance configured for round-trip preservation:
-        comments, anchors/aliases, key order, quote style, and custom tags
-        (e.g. GitLab CI's ``!reference``) are kept intact.
-        """
-        from ruamel.yaml import YAML
-
-        yaml = YAML()
-        yaml.preserve_quotes = True
-        yaml.width = 4096  # avoid line-wrapping rewrites
-        yaml.indent(mapping=2, sequence=4, offset=2)
-        return yaml
+        """Return the round-trip ruamel.yaml instance of the current thread."""
+        from wexample_filestate.serializer.yaml_serializer_backend import (
+            YamlSerializerBackend,
+        )
 
-    def dumps(self, content: StructuredData | None) -> str:
-        import io
+        return YamlSerializerBackend.get_engine()
 
+    def dumps(self, content: StructuredData | None) -> str:
         from wexample_config.config_value.config_value import ConfigValue
 
         try:
@@ -62,20 +72,10 @@ class YamlFile(StructuredContentFile):
             return v
 
         normalized = _normalize(content if content is not None else {})
-        buf = io.StringIO()
-        self._get_yaml().dump(normalized, buf)
-        return buf.getvalue()
+        return super().dumps(normalized)
 
     def loads(self, text: str, strict: bool = True) -> YamlContent:
-        import io
-
-        try:
-            value = self._get_yaml().load(io.StringIO(text))
-            return value if value is not None else {}
-        except Exception as e:
-            if strict:
-                raise e
-            return {}
+        return super().loads(text, strict=strict)
 
     def _expected_file_name_extension(self) -> str:
         return self.EXTENSION_YML
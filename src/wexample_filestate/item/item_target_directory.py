@@ -9,7 +9,7 @@ from wexample_filestate.item.abstract_item_target import AbstractItemTarget
 from wexample_filestate.item.mixins.item_directory_mixin import ItemDirectoryMixin
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
     from wexample_helpers.const.types import (
         FileStringOrPath,
@@ -19,10 +19,33 @@ if TYPE_CHECKING:
     from wexample_filestate.const.types_state_items import TargetFileOrDirectoryType
     from wexample_filestate.enum.scopes import Scope
     from wexample_filestate.result.abstract_result import AbstractResult
+    from wexample_filestate.utils.item_index import ItemIndex
 
 
 @base_class
 class ItemTargetDirectory(ItemDirectoryMixin, AbstractItemTarget):
+    _children_lookup: dict[str, int] | None = private_field(
+        default=None,
+        description="Position of the first direct child of each item name, "
+        "rebuilt when children change",
+    )
+    _children_lookup_key: tuple[int, int] | None = private_field(
+        default=None,
+        description="Identity and length of the children list the lookup was built for",
+    )
+    _children_positions: dict[int, int] | None = private_field(
+        default=None,
+        description="Position of each direct child by child id, built on demand",
+    )
+    _item_index: ItemIndex | None = private_field(
+        default=None,
+        description="Path, name and type index of the tree, only set on the root",
+    )
+    _subtree_built: bool = private_field(
+        default=False,
+        description="True once every directory of the subtree has materialized "
+        "its children; the root index can then answer recursive lookups.",
+    )
     _tree_built: bool = private_field(
         default=False,
         description="True once build_item_tree has materialized direct children. "
@@ -56,6 +79,11 @@ class ItemTargetDirectory(ItemDirectoryMixin, AbstractItemTarget):
             if isinstance(option, ItemTreeConfigOptionMixin):
                 option.build_item_tree()
 
+        # Register the new children if the root index has already been built.
+        index = self._get_built_item_index()
+        if index is not None:
+            index.add_children(self)
+
     def build_item_tree_recursive(self) -> None:
         """Force full recursive materialization of the item tree.
 
@@ -77,6 +105,8 @@ class ItemTargetDirectory(ItemDirectoryMixin, AbstractItemTarget):
     ) -> bool:
         from wexample_filestate.const.state_items import TargetFileOrDirectory
 
+        # max limits the number of operations collected by this whole subtree.
+        start = len(result.operations)
         has_task = super().build_operations(
             result,
             scopes=scopes,
@@ -84,24 +114,32 @@ class ItemTargetDirectory(ItemDirectoryMixin, AbstractItemTarget):
             filter_operation=filter_operation,
             max=max,
         )
-        count = 1 if has_task is True else 0
 
-        if self.is_active():
-            for item in self.get_children_list():
+        if self.is_active() and self._may_match_filter_below(filter_paths):
+            children = self.get_children_list()
+            remaining = (
+                max - (len(result.operations) - start) if max is not None else None
+            )
+            if remaining is not None and remaining <= 0:
+                return has_task
+
+            for item in children:
                 has_task_child = cast(TargetFileOrDirectory, item).build_operations(
                     result=result,
                     scopes=scopes,
                     filter_paths=filter_paths,
                     filter_operation=filter_operation,
-                    max=((max - count) if (max is not None) else None),
+                    max=remaining,
                 )
 
                 if has_task_child:
-                    count += 1
                     has_task = True
 
-                if max is not None and count == max:
-                    return has_task
+                # Stop before pulling the next child, which may be generated lazily.
+                if max is not None:
+                    remaining = max - (len(result.operations) - start)
+                    if remaining <= 0:
+                        return has_task
 
         return has_task
 
@@ -140,16 +178,20 @@ class ItemTargetDirectory(ItemDirectoryMixin, AbstractItemTarget):
         self, item_name: PathOrString, recursive: bool = False
     ) -> TargetFileOrDirectoryType | None:
         item_name = str(item_name)
-        children = self.get_children_list()
 
         # Check direct children first
-        for child in children:
-            if child.get_item_name() == item_name:
-                return child
+        child = self._get_direct_child(item_name)
+        if child is not None:
+            return child
 
         # Search in subdirectories if recursive
         if recursive:
-            for child in children:
+            if self._is_subtree_built():
+                return self._find_first_indexed(
+                    self._get_item_index().get_by_name(item_name)
+                )
+
+            for child in self.get_children_list():
                 if child.is_directory():
                     result = cast(ItemTargetDirectory, child).find_by_name(
                         item_name, recursive=True
@@ -182,28 +224,53 @@ class ItemTargetDirectory(ItemDirectoryMixin, AbstractItemTarget):
         # If the path contains multiple parts (e.g., "subfolder/file.txt")
         parts = target.parts
         if len(parts) > 1:
+            # Already materialized items are found in one step.
+            if not target.is_absolute():
+                found = self._get_item_index().get_by_path(self.get_path() / target)
+                if found is not None:
+                    return found
+
             # Search for the first element of the path (the subfolder)
             first_part = parts[0]
             remaining_path = Path(*parts[1:])
 
             # Find the corresponding subfolder
-            for child in self.get_children_list():
-                if child.get_item_name() == first_part and child.is_directory():
-                    # Continue the search in the subfolder
-                    return cast(ItemTargetDirectory, child).find_by_path(
-                        remaining_path, recursive=recursive
-                    )
+            child = self._get_direct_child(first_part)
+            if child is None or not child.is_directory():
+                child = next(
+                    (
+                        candidate
+                        for candidate in self.get_children_list()
+                        if candidate.get_item_name() == first_part
+                        and candidate.is_directory()
+                    ),
+                    None,
+                )
+            if child is not None:
+                # Continue the search in the subfolder
+                return cast(ItemTargetDirectory, child).find_by_path(
+                    remaining_path, recursive=recursive
+                )
             return None
 
         # Simple search in direct children
+        child = self._get_direct_child(str(target))
+        if child is not None:
+            return child
+
         children = self.get_children_list()
-        for child in children:
-            # Compare by name if target is just a filename, otherwise compare full paths
-            if child.get_item_name() == str(target) or child.get_path() == target:
-                return child
+        if target.is_absolute():
+            for child in children:
+                if child.get_path() == target:
+                    return child
 
         # If recursive, search in subdirectories
         if recursive:
+            if not target.is_absolute() and self._is_subtree_built():
+                return self._find_first_indexed(
+                    self._get_item_index().get_by_name(str(target))
+                )
+
             for child in children:
                 if child.is_directory():
                     result = cast(ItemTargetDirectory, child).find_by_path(
@@ -226,6 +293,11 @@ class ItemTargetDirectory(ItemDirectoryMixin, AbstractItemTarget):
 
         # Search in subdirectories if recursive
         if recursive:
+            if self._is_subtree_built():
+                return self._find_first_indexed(
+                    self._get_item_index().get_by_type(class_type)
+                )
+
             for child in children:
                 if child.is_directory():
                     result = cast(ItemTargetDirectory, child).find_by_type(
@@ -283,6 +355,9 @@ class ItemTargetDirectory(ItemDirectoryMixin, AbstractItemTarget):
 
         return []
 
+    def is_tree_built(self) -> bool:
+        return self._tree_built
+
     def prepare_value(self, raw_value: Any) -> Any:
         from wexample_filestate.option.children_option import (
             ChildrenOption,
@@ -294,6 +369,14 @@ class ItemTargetDirectory(ItemDirectoryMixin, AbstractItemTarget):
 
         return raw_value
 
+    def set_value(self, raw_value: Any) -> None:
+        super().set_value(raw_value)
+
+        # New options replace the children, which are rebuilt on next access.
+        if self._tree_built:
+            self._tree_built = False
+            self._invalidate_lookups()
+
     def _find_all_by_type_recursive(
         self,
         class_type: type[AbstractItemTarget],
@@ -309,6 +392,118 @@ class ItemTargetDirectory(ItemDirectoryMixin, AbstractItemTarget):
             if isinstance(child, ItemTargetDirectory):
                 child._find_all_by_type_recursive(class_type, stop_at_match, results)
 
+    def _find_first_indexed(
+        self, candidates: list[AbstractItemTarget]
+    ) -> AbstractItemTarget | None:
+        """Return the candidate a recursive scan of this directory meets first."""
+        found = None
+        found_key = None
+        for candidate in candidates:
+            key = self._get_search_order_key(candidate)
+            if key is not None and (found_key is None or key < found_key):
+                found, found_key = candidate, key
+        return found
+
+    def _get_built_item_index(self) -> ItemIndex | None:
+        """Return the root index if it has been built, without building it."""
+        root = self._get_tree_root()
+        if isinstance(root, ItemTargetDirectory):
+            return root._item_index
+        return None
+
+    def _get_child_position(self, child: AbstractItemTarget) -> int | None:
+        self._get_children_lookup()
+        if self._children_positions is None:
+            # Ids, not list.index(): attrs equality compares whole subtrees.
+            self._children_positions = {
+                id(item): position
+                for position, item in enumerate(self.get_children_list())
+            }
+        return self._children_positions.get(id(child))
+
+    def _get_children_lookup(self) -> dict[str, int]:
+        from wexample_filestate.utils.lazy_children_list import LazyChildrenList
+
+        children = self.get_children_list()
+        key = (id(children), len(children))
+
+        if self._children_lookup is None or self._children_lookup_key != key:
+            # Generated children are not promoted just to read their names.
+            if isinstance(children, LazyChildrenList):
+                names = children.get_item_names()
+            else:
+                names = [child.get_item_name() for child in children]
+
+            lookup = {}
+            for position, name in enumerate(names):
+                lookup.setdefault(name, position)
+            self._children_lookup = lookup
+            self._children_lookup_key = key
+            self._children_positions = None
+
+        return self._children_lookup
+
+    def _get_direct_child(self, item_name: str) -> TargetFileOrDirectoryType | None:
+        from wexample_filestate.utils.lazy_children_list import LazyChildrenList
+
+        children = self.get_children_list()
+        if isinstance(children, LazyChildrenList) and not children.is_complete():
+            # Only generate children until the name is found.
+            position = children.find_position(item_name)
+        else:
+            position = self._get_children_lookup().get(item_name)
+        if position is None:
+            return None
+        return children[position]
+
+    def _get_item_index(self) -> ItemIndex:
+        from wexample_filestate.utils.item_index import ItemIndex
+
+        root = self._get_tree_root()
+        if not isinstance(root, ItemTargetDirectory):
+            root = self
+
+        if root._item_index is None:
+            root._item_index = ItemIndex.create_for_root(root)
+        return root._item_index
+
+    def _get_search_order_key(self, item: AbstractItemTarget) -> tuple | None:
+        """Sort key following the order of the recursive find_by_* scans.
+
+        Direct children come before any nested item, then each child directory
+        is searched in turn. Returns None if item is not below this directory.
+        """
+        key = []
+        node = item
+        while node is not self:
+            parent = node.get_parent_item_or_none()
+            if parent is None:
+                return None
+
+            position = parent._get_child_position(node)
+            if position is None:
+                return None
+
+            key.append((0 if node is item else 1, position))
+            node = parent
+
+        return tuple(reversed(key)) or None
+
+    def _invalidate_lookups(self) -> None:
+        self._children_lookup = None
+        self._children_lookup_key = None
+        self._children_positions = None
+
+        # New children may not be built yet, in this subtree and the ones above.
+        node = self
+        while isinstance(node, ItemTargetDirectory):
+            node._subtree_built = False
+            node = node.get_parent_item_or_none()
+
+        root = self._get_tree_root()
+        if isinstance(root, ItemTargetDirectory):
+            root._item_index = None
+
     def _invalidate_path_cache(self) -> None:
         super()._invalidate_path_cache()
         # Only descend into already-materialized children — unbuilt sub-trees
@@ -316,3 +511,45 @@ class ItemTargetDirectory(ItemDirectoryMixin, AbstractItemTarget):
         if self._tree_built:
             for child in self.get_children_list():
                 child._invalidate_path_cache()
+
+    def _is_subtree_built(self) -> bool:
+        if self._subtree_built:
+            return True
+        if not self._tree_built:
+            return False
+
+        for child in self.get_children_list():
+            if isinstance(child, ItemTargetDirectory) and not child._is_subtree_built():
+                return False
+
+        # Reset by _invalidate_lookups whenever children change below.
+        self._subtree_built = True
+        return True
+
+    def _iter_operation_candidates(
+        self, filter_paths: list[str] | None = None
+    ) -> Iterator[AbstractItemTarget]:
+        if not self.is_active():
+            return
+
+        if not self._may_match_filter_below(filter_paths):
+            yield from super()._iter_operation_candidates(filter_paths)
+            return
+
+        # Materialize children before this directory is handed to a worker,
+        # so that checks never race with the lazy tree build.
+        children = self.get_children_list()
+        yield from super()._iter_operation_candidates(filter_paths)
+        for child in children:
+            yield from child._iter_operation_candidates(filter_paths)
+
+    def _may_match_filter_below(self, filter_paths: list[str] | None = None) -> bool:
+        """Return False if filter_paths exclude every item of this subtree.
+
+        Only existing directories are pruned; the items below a missing
+        directory may have to be created.
+        """
+        path_filter = self._get_path_filter(filter_paths)
+        if path_filter is None or path_filter.may_match_below(str(self.get_path())):
+            return True
+        return not self.path_exists()
@@ -17,3 +17,23 @@ class ItemTargetFile(ItemFileMixin, AbstractItemTarget):
         default=None,
         description="Filesystem path to the content file",
     )
+
+    def release_content(self) -> None:
+        self.clear_caches()
+        if self._local_file is not None:
+            self._local_file.invalidate_cache()
+
+    def _get_disk_mtime_ns(self) -> int | None:
+        # Reuse the run-wide snapshot so cache staleness checks do not stat
+        # the file again on every read during apply()/dry_run().
+        if self.get_stat_snapshot() is None:
+            return super()._get_disk_mtime_ns()
+
+        stat = self.path_stat()
+        return stat.st_mtime_ns if stat is not None else None
+
+    def _on_disk_write(self) -> None:
+        super()._on_disk_write()
+        snapshot = self.get_stat_snapshot()
+        if snapshot is not None:
+            snapshot.invalidate(self.get_path())
@@ -13,6 +13,9 @@ class ItemFileMixin(WithLocalFileMixin, ItemMixin):
     # Disk mtime captured at last cache fill. Used to detect external mutations
     # (subprocess writes, git operations, manual edits) and auto-invalidate caches.
     _cache_mtime_ns: int | None = None
+    # Content proposed by a previous option while converging, read instead of
+    # the disk content until unstaged.
+    _staged_content: str | None = None
     _text_cache: str | None = None
 
     @classmethod
@@ -42,6 +45,12 @@ class ItemFileMixin(WithLocalFileMixin, ItemMixin):
         enc = encoding or self.default_encoding()
         return text.encode(enc)
 
+    def get_current_content(self) -> str | None:
+        """Return the content options should check: staged content, or the disk one."""
+        if self._staged_content is not None:
+            return self._staged_content
+        return self.get_local_file().read()
+
     def get_item_title(self) -> str:
         return "File"
 
@@ -74,6 +83,9 @@ class ItemFileMixin(WithLocalFileMixin, ItemMixin):
             return ""
 
     def read_bytes(self, reload: bool = False) -> bytes | None:
+        if self._staged_content is not None:
+            return self.encode_text(self._staged_content)
+
         stale = self._is_cache_stale()
         if reload or self._bytes_cache is None or stale:
             data = self.get_local_file().read()
@@ -94,11 +106,20 @@ class ItemFileMixin(WithLocalFileMixin, ItemMixin):
         return self._bytes_cache
 
     def read_text(self, reload: bool = False, encoding: str | None = None) -> str:
+        if self._staged_content is not None:
+            return self._staged_content
+
         if reload or self._text_cache is None or self._is_cache_stale():
             raw = self.read_bytes(reload=reload)
             self._text_cache = self.decode_bytes(raw, encoding=encoding)
         return self._text_cache
 
+    def stage_content(self, content: str | None) -> None:
+        """Make reads return content instead of the disk content; None unstages."""
+        self._staged_content = content
+        # Derived caches (parsed content, ...) must follow the staged content.
+        self.clear_caches()
+
     def write_bytes(
         self, content: bytes | None = None, encoding: str | None = None
     ) -> None:
@@ -110,6 +131,7 @@ class ItemFileMixin(WithLocalFileMixin, ItemMixin):
         self.get_local_file().write(
             content=text, encoding=encoding or self.default_encoding()
         )
+        self._on_disk_write()
         # Update caches: keep bytes as source and refresh text from decoded value
         self._bytes_cache = data
         self._text_cache = text
@@ -125,6 +147,7 @@ class ItemFileMixin(WithLocalFileMixin, ItemMixin):
         self.get_local_file().write(
             content=text, encoding=encoding or self.default_encoding()
         )
+        self._on_disk_write()
         # Update caches: keep text, refresh bytes from text
         self._text_cache = text
         self._bytes_cache = self.encode_text(text, encoding=encoding)
@@ -146,3 +169,6 @@ class ItemFileMixin(WithLocalFileMixin, ItemMixin):
 
     def _on_disk_reload(self) -> None:
         """Hook for subclasses to clear derived caches when disk content changed."""
+
+    def _on_disk_write(self) -> None:
+        """Hook for subclasses to drop disk metadata cached outside this item."""
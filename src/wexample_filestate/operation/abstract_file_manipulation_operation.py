@@ -69,11 +69,7 @@ class AbstractFileManipulationOperation(AbstractOperation):
         import os
 
         if self.target.is_file():
-            # Write through LocalFile (like _target_file_write does) so its
-            # content/mtime cache stays in sync: a raw file_write landing in
-            # the same clock tick as the previous write would leave the cache
-            # serving the pre-restore content.
-            self.target.get_local_file().write(content=self._original_file_content)
+            self._write_target_file(content=self._original_file_content)
             os.chmod(self._original_path, self._original_file_mode)
         elif self.target.is_directory():
             os.mkdir(self._original_path)
@@ -82,6 +78,13 @@ class AbstractFileManipulationOperation(AbstractOperation):
         from wexample_helpers.helpers.file import file_chown_as_real_user_if_sudo
 
         self._backup_target_file()
-        self.target.get_local_file().write(content=content)
+        self._write_target_file(content=content)
 
         file_chown_as_real_user_if_sudo(self._original_path)
+
+    def _write_target_file(self, content: str) -> None:
+        local_file = self.target.get_local_file()
+        self.target.get_file_writer().write(path=local_file.path, content=content)
+        # The file was replaced behind LocalFile: a cached content and mtime
+        # from the same clock tick would otherwise still look current.
+        local_file.invalidate_cache()
@@ -15,6 +15,8 @@ from wexample_filestate.common.mixin.with_scope_mixin import WithScopeMixin
 from wexample_filestate.option.mixin.option_mixin import OptionMixin
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from wexample_filestate.const.state_items import TargetFileOrDirectory
 
 
@@ -55,6 +57,16 @@ class AbstractOperation(WithScopeMixin, HasSnakeShortClassNameClassMixin, BaseCl
     def apply_operation(self) -> None:
         pass
 
+    def get_affected_paths(self) -> list[Path]:
+        """Paths whose on-disk metadata may change when applying or undoing.
+
+        Used to invalidate the run-wide StatSnapshot after execution.
+        """
+        return [self.target.get_path()]
+
+    def release_content(self) -> None:
+        """Drop data only needed to apply the operation, once it is applied."""
+
     @abstract_method
     def undo(self) -> None:
         pass
@@ -10,6 +10,8 @@ from wexample_filestate.operation.abstract_file_manipulation_operation import (
 )
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from wexample_filestate.enum.scopes import Scope
 
 
@@ -30,6 +32,15 @@ class FileRenameOperation(AbstractFileManipulationOperation):
         self._backup_target_file()
         self._rename_target(new_name=self.new_name)
 
+    def get_affected_paths(self) -> list[Path]:
+        # Both the previous and the current name changed on disk; the original
+        # path is only known once the operation has been applied.
+        original_path = getattr(self, "_original_path", None)
+        paths = [self.target.get_path()]
+        if original_path is not None:
+            paths.append(original_path)
+        return paths
+
     def undo(self) -> None:
         # Rename back from the new name to the original name.
         self._rename_target(new_name=self._original_path.name)
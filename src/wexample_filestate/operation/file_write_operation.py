@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 
 from wexample_filestate.operation.abstract_existing_file_operation import (
@@ -13,6 +14,32 @@ class FileWriteOperation(AbstractExistingFileOperation):
     content: str = public_field(
         description="The content to write",
     )
+    _coalesced_into: FileWriteOperation | None = private_field(
+        default=None,
+        description="Earlier write on the same file which writes this content instead",
+    )
 
     def apply_operation(self) -> None:
-        self._target_file_write(content=self.content)
+        # A coalesced write is performed by the write it was merged into.
+        if self._coalesced_into is None:
+            self._target_file_write(content=self.content)
+
+    def coalesce(self, operations: list[FileWriteOperation]) -> None:
+        """Write the content of later writes on the same file in this one.
+
+        Each write replaces the whole content, so the last one wins, as if
+        they were applied one by one. The merged operations stay in the result
+        for reporting, but apply and undo nothing: this one takes the only
+        backup and does the only write.
+        """
+        for operation in operations:
+            operation._coalesced_into = self
+        self.content = operations[-1].content
+
+    def release_content(self) -> None:
+        # Undo restores the backup of the original content, not this one.
+        self.content = None
+
+    def undo(self) -> None:
+        if self._coalesced_into is None:
+            super().undo()
@@ -7,6 +7,7 @@ from wexample_config.config_option.abstract_nested_config_option import (
 )
 from wexample_helpers.classes.abstract_method import abstract_method
 from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 
 from wexample_filestate.config_option.mixin.item_config_option_mixin import (
@@ -16,6 +17,7 @@ from wexample_filestate.enum.scopes import Scope
 from wexample_filestate.option.mixin.option_mixin import OptionMixin
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
     from wexample_config.const.types import DictConfig
@@ -25,6 +27,9 @@ if TYPE_CHECKING:
     from wexample_helpers.const.types import PathOrString
 
     from wexample_filestate.const.types_state_items import TargetFileOrDirectoryType
+    from wexample_filestate.utils.exclude_rules import ExcludeRules
+    from wexample_filestate.utils.generated_child_spec import GeneratedChildSpec
+    from wexample_filestate.utils.name_pattern_matcher import NamePatternMatcher
 
 
 @base_class
@@ -37,6 +42,11 @@ class AbstractChildrenManipulationOption(
     def get_scopes(cls) -> list[Scope]:
         return [Scope.LOCATION]
 
+    exclude: list[str] | None = public_field(
+        default=None,
+        description="Gitignore-style patterns of entries to skip, relative to the "
+        "parent directory. Excluded directories are never listed.",
+    )
     # Name pattern(s) to match against file/directory names
     name_pattern: str | list[str] | None = public_field(
         default=None,
@@ -45,6 +55,19 @@ class AbstractChildrenManipulationOption(
     pattern: DictConfig = public_field(
         description="Pattern configuration used for children manipulation",
     )
+    use_ignore_files: bool = public_field(
+        default=True,
+        description="Also read exclusion patterns from the .wexignore file of each "
+        "scanned directory, next to its .wex.yml.",
+    )
+    _name_matcher: NamePatternMatcher | None = private_field(
+        default=None,
+        description="Matcher compiled from name_pattern on first use",
+    )
+    _name_matcher_source: str | list[str] | None = private_field(
+        default=None,
+        description="name_pattern value the matcher was compiled from",
+    )
 
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
@@ -53,9 +76,17 @@ class AbstractChildrenManipulationOption(
         return DictConfig
 
     @abstract_method
-    def generate_children(self) -> list[TargetFileOrDirectoryType]:
+    def generate_children(self) -> list[GeneratedChildSpec]:
         pass
 
+    def iter_children(self) -> Iterator[GeneratedChildSpec]:
+        """Yield the generated children one at a time.
+
+        ChildrenOption pulls from this generator only as far as the children
+        are read, so subclasses should yield as they scan.
+        """
+        yield from self.generate_children()
+
     def get_options_providers(self) -> list[type[AbstractOptionsProvider]]:
         from wexample_filestate.options_provider.default_options_provider import (
             DefaultOptionsProvider,
@@ -68,60 +99,99 @@ class AbstractChildrenManipulationOption(
     def _create_child_from_config(
         self, path: Path, config: dict
     ) -> TargetFileOrDirectoryType:
-        import copy
-
         from wexample_filestate.option.children_option import (
             ChildrenOption,
         )
 
-        item_config_copy = copy.deepcopy(config)
-
-        if item_config_copy.get("name", None) is None:
-            item_config_copy["name"] = path.name
-
         parent_children_config = cast(ChildrenOption, self.get_parent())
+        spec = self._create_child_spec(path=path, config=config)
 
         return parent_children_config.create_child_item(
-            child_config=item_config_copy,
+            child_config=spec.build_config(),
         )
 
+    def _create_child_spec(
+        self, path: Path, config: dict, overrides: dict | None = None
+    ) -> GeneratedChildSpec:
+        from wexample_filestate.utils.generated_child_spec import GeneratedChildSpec
+
+        # The config is a shared template, only copied when the item is promoted.
+        return GeneratedChildSpec(path=path, config=config, overrides=overrides)
+
     def _get_directories_filtered(
-        self, base_path: PathOrString, recursive: bool = False
+        self,
+        base_path: PathOrString,
+        recursive: bool = False,
+        exclude_rules: ExcludeRules | None = None,
     ) -> list[str]:
+        from pathlib import Path
+
         from wexample_helpers.helpers.file import file_get_directories
 
         output = []
         directories = file_get_directories(path=base_path)
+        exclude_rules = self._get_exclude_rules(Path(base_path), exclude_rules)
 
         for directory in directories:
+            if exclude_rules.is_excluded(Path(directory), is_dir=True):
+                continue
+
             if self._path_match_patterns(directory):
                 output.append(directory)
 
                 if recursive:
                     output.extend(
                         self._get_directories_filtered(
-                            base_path=directory, recursive=recursive
+                            base_path=directory,
+                            recursive=recursive,
+                            exclude_rules=exclude_rules,
                         )
                     )
 
         return output
 
+    def _get_exclude_rules(
+        self, directory: Path, parent_rules: ExcludeRules | None = None
+    ) -> ExcludeRules:
+        """Return the rules applying to the entries of a scanned directory.
+
+        Without parent rules, directory is the scan root and the exclude
+        patterns of this option are anchored to it.
+        """
+        from wexample_filestate.const.globals import DIR_IGNORE_FILENAME
+        from wexample_filestate.utils.exclude_rules import ExcludeRules
+
+        rules = parent_rules
+        if rules is None:
+            rules = ExcludeRules.create_from_patterns(self.exclude, directory)
+
+        if self.use_ignore_files:
+            ignore_file_path = directory / DIR_IGNORE_FILENAME
+            if self.get_parent_item().path_is_file(ignore_file_path):
+                rules = rules.with_ignore_file(ignore_file_path)
+
+        return rules
+
+    def _get_name_matcher(self) -> NamePatternMatcher | None:
+        from wexample_filestate.utils.name_pattern_matcher import NamePatternMatcher
+
+        # Rebuilt only if name_pattern is replaced after the first match.
+        if self._name_matcher_source is not self.name_pattern:
+            self._name_matcher = NamePatternMatcher.create_from_option_value(
+                self.name_pattern
+            )
+            self._name_matcher_source = self.name_pattern
+        return self._name_matcher
+
     def _path_match_patterns(self, path: str) -> bool:
         """Check if path matches the name patterns defined in this option."""
-        import re
-        from pathlib import Path
+        import os
 
-        if self.name_pattern is None:
+        matcher = self._get_name_matcher()
+        if matcher is None:
             return True
 
-        patterns = self.name_pattern
-        if isinstance(patterns, str):
-            patterns = [patterns]
-
-        path_name = Path(path).name
-        for pattern_str in patterns:
-            pattern = re.compile(pattern_str)
-            if not pattern.match(path_name):
-                return False
-
-        return True
+        name = os.fspath(path)
+        if os.sep in name:
+            name = os.path.basename(name.rstrip(os.sep)) or name
+        return matcher.matches(name)
@@ -16,6 +16,10 @@ class ActiveOption(OptionMixin, AbstractConfigOption):
     def get_scopes(cls) -> list[Scope]:
         return [Scope.LOCATION]
 
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         from collections.abc import Callable
@@ -10,11 +10,14 @@ from wexample_filestate.option.abstract_children_manipulator_option import (
 )
 
 if TYPE_CHECKING:
+    from collections import Counter
+    from collections.abc import Iterator
     from pathlib import Path
 
     from wexample_config.const.types import DictConfig
 
-    from wexample_filestate.const.types_state_items import TargetFileOrDirectoryType
+    from wexample_filestate.utils.exclude_rules import ExcludeRules
+    from wexample_filestate.utils.generated_child_spec import GeneratedChildSpec
 
 
 @base_class
@@ -27,34 +30,52 @@ class ChildrenFileFactoryOption(AbstractChildrenManipulationOption):
         description="Whether to recurse into subdirectories when generating children from the base path.",
     )
 
-    def generate_children(self) -> list[TargetFileOrDirectoryType]:
+    def generate_children(self) -> list[GeneratedChildSpec]:
+        return list(self.iter_children())
+
+    def iter_children(self) -> Iterator[GeneratedChildSpec]:
+        from collections import Counter
         from pathlib import Path
 
-        children = []
-        path = self.get_parent_item().get_path()
+        from wexample_prompt.enums.verbosity_level import VerbosityLevel
+
+        from wexample_filestate.const.globals import DIR_CONFIG_FILENAME
+
+        parent_item = self.get_parent_item()
+        path = parent_item.get_path()
 
         if path.exists():
-            directories = self._get_directories_filtered(base_path=path)
+            cache_stats: Counter[str] = Counter()
+            exclude_rules = self._get_exclude_rules(path)
+            directories = self._get_directories_filtered(
+                base_path=path, exclude_rules=exclude_rules
+            )
 
             for directory in directories:
                 directory_path = Path(directory)
 
                 dir_config = self._generate_children_recursive(
                     path=directory_path,
+                    exclude_rules=exclude_rules,
+                    cache_stats=cache_stats,
                 )
 
-                children.append(
-                    self._create_child_from_config(
-                        path=directory_path,
-                        config=dir_config,
-                    )
+                yield self._create_child_spec(
+                    path=directory_path,
+                    config=dir_config,
                 )
 
-        return children
+            parent_item.io.log(
+                f"[{self.get_name()}] {DIR_CONFIG_FILENAME} cache: "
+                f"{cache_stats['hits']} hit(s), {cache_stats['misses']} miss(es)",
+                verbosity=VerbosityLevel.MAXIMUM,
+            )
 
     def _generate_children_recursive(
         self,
         path: Path,
+        exclude_rules: ExcludeRules,
+        cache_stats: Counter[str],
     ) -> DictConfig:
         from wexample_filestate.const.disk import DiskItemType
         from wexample_filestate.helpers.dir_config import read_dir_config
@@ -75,7 +96,7 @@ class ChildrenFileFactoryOption(AbstractChildrenManipulationOption):
             should_exist_key: True,
         }
 
-        wex_config = read_dir_config(path)
+        wex_config = read_dir_config(path, stats=cache_stats)
         python_init = wex_config.get("filestate", {}).get("python_init", True)
 
         if not python_init:
@@ -91,12 +112,20 @@ class ChildrenFileFactoryOption(AbstractChildrenManipulationOption):
             )
 
         if self.recursive:
+            exclude_rules = self._get_exclude_rules(path, exclude_rules)
+
             # Iterate safely over child entries using Path API
             for entry in path.iterdir():
-                if entry.is_dir() and self._path_match_patterns(entry.name):
+                if (
+                    entry.is_dir()
+                    and not exclude_rules.is_excluded(entry, is_dir=True)
+                    and self._path_match_patterns(entry.name)
+                ):
                     dir_config[children_key].append(
                         self._generate_children_recursive(
                             path=entry,
+                            exclude_rules=exclude_rules,
+                            cache_stats=cache_stats,
                         )
                     )
         return dir_config
@@ -12,10 +12,12 @@ from wexample_filestate.option.abstract_children_manipulator_option import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
-    from wexample_filestate.const.types_state_items import TargetFileOrDirectoryType
+    from wexample_filestate.const.disk import DiskItemType
+    from wexample_filestate.utils.exclude_rules import ExcludeRules
+    from wexample_filestate.utils.generated_child_spec import GeneratedChildSpec
 
 
 @base_class
@@ -32,11 +34,13 @@ class ChildrenFilterOption(AbstractChildrenManipulationOption):
         description="Search recursively under the base path; apply filters/name_pattern to all descendants.",
     )
 
-    def generate_children(self) -> list[TargetFileOrDirectoryType]:
+    def generate_children(self) -> list[GeneratedChildSpec]:
+        return list(self.iter_children())
+
+    def iter_children(self) -> Iterator[GeneratedChildSpec]:
         from wexample_filestate.const.disk import DiskItemType
 
         config = self.pattern
-        children = []
 
         parent_item = self.get_parent_item()
         has_callable_filter = callable(self.filter)
@@ -45,54 +49,53 @@ class ChildrenFilterOption(AbstractChildrenManipulationOption):
         # Trigger generation if either a name_pattern is present or a callable filter is provided
         if has_name_pattern or has_callable_filter:
             base_path: Path = parent_item.get_path()
-            if base_path.exists():
+            if parent_item.path_exists(base_path):
                 # Use the instance field `filter` when provided
                 entry_filter: Callable[[Path], bool] | None = (
                     self.filter if has_callable_filter else None
                 )
 
+                exclude_rules = self._get_exclude_rules(base_path)
+
                 if self.recursive:
                     # Preserve hierarchy: build nested trees for subdirectories, and add base-level files
-                    for entry in base_path.iterdir():
-                        if entry.is_dir():
-                            tree = self._build_dir_tree(entry, config, entry_filter)
+                    for entry_path, entry_type in self._scan_directory(
+                        base_path, exclude_rules
+                    ):
+                        if entry_type == DiskItemType.DIRECTORY:
+                            tree = self._build_dir_tree(
+                                entry_path, config, entry_filter, exclude_rules
+                            )
                             if tree is not None:
-                                children.append(
-                                    self._create_child_from_config(
-                                        path=entry,
-                                        config=tree,
-                                    )
+                                yield self._create_child_spec(
+                                    path=entry_path,
+                                    config=tree,
                                 )
-                        elif entry.is_file() and self._include_entry(
-                            entry, config, entry_filter
+                        elif entry_type == DiskItemType.FILE and self._include_entry(
+                            entry_path, entry_type, config, entry_filter
                         ):
-                            file_cfg = dict(config)
-                            file_cfg["name"] = entry.name
-                            file_cfg.setdefault("type", DiskItemType.FILE)
-                            children.append(
-                                self._create_child_from_config(
-                                    path=entry,
-                                    config=file_cfg,
-                                )
+                            yield self._create_file_spec(
+                                path=entry_path, config=config
                             )
                 else:
                     # Non-recursive: original behavior on the first level
-                    for entry in base_path.iterdir():
-                        entry_path: Path = entry
-                        if self._include_entry(entry_path, config, entry_filter):
-                            children.append(
-                                self._create_child_from_config(
-                                    path=entry_path,
-                                    config=config,
-                                )
+                    for entry_path, entry_type in self._scan_directory(
+                        base_path, exclude_rules
+                    ):
+                        if self._include_entry(
+                            entry_path, entry_type, config, entry_filter
+                        ):
+                            yield self._create_child_spec(
+                                path=entry_path,
+                                config=config,
                             )
-        return children
 
     def _build_dir_tree(
         self,
         base_dir: Path,
         config: dict,
         entry_filter: Callable[[Path], bool] | None,
+        exclude_rules: ExcludeRules,
     ) -> dict | None:
         """Build a nested DictConfig preserving the directory structure; returns None if empty when filtering files only."""
         from wexample_filestate.const.disk import DiskItemType
@@ -104,36 +107,36 @@ class ChildrenFilterOption(AbstractChildrenManipulationOption):
             "should_exist": True,
         }
 
-        # First, include matching files in this directory
-        for entry in base_dir.iterdir():
-            if entry.is_file() and self._include_entry(entry, config, entry_filter):
-                file_cfg = dict(config)
-                file_cfg["name"] = entry.name
-                # Ensure type is FILE when matching files
-                file_cfg.setdefault("type", DiskItemType.FILE)
-                dir_config["children"].append(file_cfg)
+        # List the directory once; matching files still come before subdirectories.
+        exclude_rules = self._get_exclude_rules(base_dir, exclude_rules)
+        subdirectories = []
+        for entry_path, entry_type in self._scan_directory(base_dir, exclude_rules):
+            if entry_type == DiskItemType.FILE:
+                if self._include_entry(entry_path, entry_type, config, entry_filter):
+                    dir_config["children"].append(
+                        self._create_file_spec(path=entry_path, config=config)
+                    )
+            elif entry_type == DiskItemType.DIRECTORY:
+                subdirectories.append(entry_path)
 
         # Recurse into subdirectories
-        for entry in base_dir.iterdir():
-            if entry.is_dir():
-                sub = self._build_dir_tree(entry, config, entry_filter)
-                if sub is not None and (
-                    sub.get("children") or config.get("type") == DiskItemType.DIRECTORY
+        for entry_path in subdirectories:
+            sub = self._build_dir_tree(entry_path, config, entry_filter, exclude_rules)
+            if sub is not None and (
+                sub.get("children") or config.get("type") == DiskItemType.DIRECTORY
+            ):
+                # If filtering directories, also include dirs that match themselves
+                if config.get("type") == DiskItemType.DIRECTORY and self._include_entry(
+                    entry_path, DiskItemType.DIRECTORY, config, entry_filter
                 ):
-                    # If filtering directories, also include dirs that match themselves
-                    if config.get(
-                        "type"
-                    ) == DiskItemType.DIRECTORY and self._include_entry(
-                        entry, config, entry_filter
-                    ):
-                        # Replace sub root with configured directory attributes
-                        sub = {
-                            "name": entry.name,
-                            "type": DiskItemType.DIRECTORY,
-                            "children": sub.get("children", []),
-                            "should_exist": config.get("should_exist", True),
-                        }
-                    dir_config["children"].append(sub)
+                    # Replace sub root with configured directory attributes
+                    sub = {
+                        "name": entry_path.name,
+                        "type": DiskItemType.DIRECTORY,
+                        "children": sub.get("children", []),
+                        "should_exist": config.get("should_exist", True),
+                    }
+                dir_config["children"].append(sub)
 
         # Prune empty directories when filtering files only
         if not dir_config["children"] and config.get("type") == DiskItemType.FILE:
@@ -141,21 +144,30 @@ class ChildrenFilterOption(AbstractChildrenManipulationOption):
 
         return dir_config
 
+    def _create_file_spec(self, path: Path, config: dict) -> GeneratedChildSpec:
+        from wexample_filestate.const.disk import DiskItemType
+
+        overrides = {"name": path.name}
+        # Ensure type is FILE when matching files
+        if "type" not in config:
+            overrides["type"] = DiskItemType.FILE
+
+        return self._create_child_spec(path=path, config=config, overrides=overrides)
+
     def _include_entry(
         self,
         entry_path: Path,
+        entry_type: DiskItemType | None,
         config: dict,
         entry_filter: Callable[[Path], bool] | None,
     ) -> bool:
         from wexample_filestate.const.disk import DiskItemType
-        from wexample_filestate.helpers.config_helper import (
-            config_has_same_type_as_path,
-        )
+        from wexample_filestate.helpers.config_helper import config_is_item_type
 
         requested_type = config.get("type")
-        if requested_type == DiskItemType.DIRECTORY and not entry_path.is_dir():
+        if requested_type == DiskItemType.DIRECTORY and entry_type != requested_type:
             return False
-        if requested_type == DiskItemType.FILE and not entry_path.is_file():
+        if requested_type == DiskItemType.FILE and entry_type != requested_type:
             return False
 
         # Inclusion decision: callback first, then name_pattern fallback
@@ -171,7 +183,53 @@ class ChildrenFilterOption(AbstractChildrenManipulationOption):
         if not include:
             return False
 
-        # Validate type semantics (historical behavior)
-        if "type" in config and not config_has_same_type_as_path(config, entry_path):
+        # Validate type semantics (historical behavior), from the scanned type
+        if "type" in config and (
+            entry_type is None or not config_is_item_type(config, entry_type)
+        ):
             return False
         return True
+
+    def _scan_directory(
+        self, directory: Path, exclude_rules: ExcludeRules
+    ) -> list[tuple[Path, DiskItemType | None]]:
+        """List a directory once, typing entries from their DirEntry.
+
+        DirEntry types come from the listing itself on most filesystems and
+        follow symlinks like Path.is_file() / is_dir(), so no extra stat is
+        needed. The listing of the running apply is reused when available.
+        Excluded entries are dropped, so excluded directories are never listed.
+        """
+        import os
+
+        from wexample_filestate.const.disk import DiskItemType
+
+        snapshot = self.get_parent_item().get_stat_snapshot()
+        if snapshot is not None:
+            entries = snapshot.list_dir(directory)
+        else:
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = list(iterator)
+            except OSError:
+                entries = []
+
+        scanned = []
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    entry_type = DiskItemType.DIRECTORY
+                elif entry.is_file():
+                    entry_type = DiskItemType.FILE
+                else:
+                    entry_type = None
+            except OSError:
+                entry_type = None
+
+            entry_path = directory / entry.name
+            if exclude_rules.is_excluded(
+                entry_path, is_dir=entry_type == DiskItemType.DIRECTORY
+            ):
+                continue
+            scanned.append((entry_path, entry_type))
+        return scanned
@@ -77,21 +77,22 @@ class ChildrenOption(OptionMixin, ChildrenConfigOption):
             has_explicit_dir = config_is_item_type(child_config, DiskItemType.DIRECTORY)
 
             name = item_name or child_config.get(NameOption.get_name(), None)
+            parent_item = self.get_parent_item()
             path = None
             if isinstance(name, str) and name:
-                path = self.get_parent_item().get_path() / name
+                path = parent_item.get_path() / name
 
             # If explicit type is provided and we can resolve a path, verify when it exists
             if (
                 (is_file_type or has_explicit_dir)
                 and path is not None
-                and path.exists()
+                and parent_item.path_exists(path)
             ):
-                if is_file_type and not path.is_file():
+                if is_file_type and not parent_item.path_is_file(path):
                     raise ValueError(
                         f"ChildrenConfigOption: child '{path}' is configured as FILE but is a directory on disk."
                     )
-                if has_explicit_dir and not path.is_dir():
+                if has_explicit_dir and not parent_item.path_is_dir(path):
                     raise ValueError(
                         f"ChildrenConfigOption: child '{path}' is configured as DIRECTORY but is a file on disk."
                     )
@@ -104,10 +105,10 @@ class ChildrenOption(OptionMixin, ChildrenConfigOption):
                     )
 
                 assert path is not None
-                if path.exists():
-                    if path.is_file():
+                if parent_item.path_exists(path):
+                    if parent_item.path_is_file(path):
                         is_file_type = True
-                    elif path.is_dir():
+                    elif parent_item.path_is_dir(path):
                         is_file_type = False
                 else:
                     raise ValueError(
@@ -132,8 +133,10 @@ class ChildrenOption(OptionMixin, ChildrenConfigOption):
         from wexample_filestate.option.abstract_children_manipulator_option import (
             AbstractChildrenManipulationOption,
         )
+        from wexample_filestate.utils.lazy_children_list import LazyChildrenList
 
-        children = []
+        # Generated children are pulled, and stay compact, until accessed.
+        children = LazyChildrenList(owner=self)
         # Parent item should be a file or directory target.
         for child_config in self.get_value().get_list():
             if isinstance(child_config, AbstractChildrenManipulationOption):
@@ -141,10 +144,10 @@ class ChildrenOption(OptionMixin, ChildrenConfigOption):
                 # Parent has not been assigned before now.
                 child.parent = self
 
-                children.extend(child.generate_children())
+                children.add_source(child.iter_children())
 
             else:
-                children.append(self.create_child_item(child_config=child_config))
+                children.add_source([self.create_child_item(child_config=child_config)])
 
         self.children = children
         return children
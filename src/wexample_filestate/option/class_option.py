@@ -20,6 +20,10 @@ class ClassOption(OptionMixin, WithCurrentContentOptionMixin, AbstractConfigOpti
     def get_scopes(cls) -> list[Scope]:
         return [Scope.CONTENT]
 
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         from wexample_filestate.item.item_target_directory import ItemTargetDirectory
@@ -26,6 +26,10 @@ class ContentOption(OptionMixin, WithCurrentContentOptionMixin, AbstractConfigOp
 
         return [Scope.CONTENT]
 
+    @classmethod
+    def is_convergence_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         from wexample_config.config_value.config_value import ConfigValue
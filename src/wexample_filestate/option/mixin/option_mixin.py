@@ -23,6 +23,34 @@ class OptionMixin(WithScopeMixin, ItemTreeConfigOptionMixin):
     def get_class_name_suffix(cls) -> str | None:
         return "Option"
 
+    @classmethod
+    def is_content_fingerprint_safe(cls) -> bool:
+        """Whether checks only depend on the option config and the file content.
+
+        Checks of such options that required no operation are remembered by
+        content fingerprint during incremental runs, and skipped while the
+        content and the config stay the same.
+        """
+        return False
+
+    @classmethod
+    def is_convergence_safe(cls) -> bool:
+        """Whether checks read the file content through get_current_content().
+
+        When converging, such options see the content proposed by the
+        previous ones on the same item, so their writes can be combined.
+        """
+        return False
+
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        """Whether checks only depend on the option config and its own item.
+
+        Items whose options all return True may be checked in a worker process,
+        on a standalone copy rebuilt from their class, path and raw config.
+        """
+        return False
+
     def applicable_on_directory(self) -> bool:
         return True
 
@@ -26,7 +26,7 @@ class WithCurrentContentOptionMixin(ItemTreeConfigOptionMixin):
 
         # If the target file does not exist, we don't create it,
         # it should be created by other dedicated options.
-        if not target.get_path().exists():
+        if not target.path_exists():
             return None
 
         if target_content is not None:
@@ -48,6 +48,6 @@ class WithCurrentContentOptionMixin(ItemTreeConfigOptionMixin):
 
     def _read_current_content(self, target: TargetFileOrDirectoryType) -> str | None:
         """Read current file content, return None if file doesn't exist."""
-        if not target.source or not target.source.get_path().exists():
+        if not target.source or not target.path_exists(target.source.get_path()):
             return None
-        return target.get_local_file().read()
+        return target.get_current_content()
@@ -15,6 +15,10 @@ class OwnerOption(OptionMixin, AbstractConfigOption):
     def get_scopes(cls) -> list[Scope]:
         return [Scope.OWNERSHIP]
 
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         return str
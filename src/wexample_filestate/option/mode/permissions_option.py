@@ -15,6 +15,10 @@ class PermissionsOption(OptionMixin, AbstractConfigOption):
     def get_scopes(cls) -> list[Scope]:
         return [Scope.PERMISSIONS]
 
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         return Union[str, int]
@@ -23,6 +23,10 @@ class ModeOption(OptionMixin, AbstractNestedConfigOption):
     def get_scopes(cls) -> list[Scope]:
         return [Scope.PERMISSIONS, Scope.OWNERSHIP]
 
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         from wexample_filestate.config_value.mode_config_value import ModeConfigValue
@@ -38,7 +42,6 @@ class ModeOption(OptionMixin, AbstractNestedConfigOption):
             file_mode_is_notation,
             file_mode_num_to_octal,
             file_mode_octal_to_num,
-            file_path_get_mode_num,
             file_validate_mode_octal_or_fail,
         )
 
@@ -54,7 +57,7 @@ class ModeOption(OptionMixin, AbstractNestedConfigOption):
 
         source_path = target.get_source().get_path()
 
-        if source_path.is_symlink():
+        if target.path_is_symlink(source_path):
             return None
         recursive = self.get_option_value(RecursiveOption, default=False).is_true()
 
@@ -64,8 +67,12 @@ class ModeOption(OptionMixin, AbstractNestedConfigOption):
         current_mode = None
         permissions = self.get_octal()
 
+        source_stat = target.path_stat(source_path)
+        if source_stat is None:
+            return None
+
         if permissions is not None:
-            current_mode = file_path_get_mode_num(source_path)
+            current_mode = source_stat.st_mode & 0o777
             if file_mode_is_notation(permissions):
                 target_mode = file_mode_apply_notation(current_mode, permissions)
             else:
@@ -81,17 +88,16 @@ class ModeOption(OptionMixin, AbstractNestedConfigOption):
 
         if owner_raw is not None:
             target_uid, target_gid = OwnerOption.resolve(owner_raw)
-            stat = os.stat(source_path)
-            needs_chown = (target_uid is not None and stat.st_uid != target_uid) or (
-                target_gid is not None and stat.st_gid != target_gid
-            )
+            needs_chown = (
+                target_uid is not None and source_stat.st_uid != target_uid
+            ) or (target_gid is not None and source_stat.st_gid != target_gid)
 
             # When recursive, also detect drift in any descendant — otherwise a
             # file created by another step (e.g. a service/setup hook running
             # under sudo) inside an already-correctly-owned directory would
             # never be chown'd. Early-exit on first mismatch to keep checks
             # cheap on large trees.
-            if not needs_chown and recursive and source_path.is_dir():
+            if not needs_chown and recursive and target.path_is_dir(source_path):
                 for root, dirs, files in os.walk(source_path):
                     for name in dirs + files:
                         child_stat = os.lstat(os.path.join(root, name))
@@ -15,6 +15,10 @@ if TYPE_CHECKING:
 
 @base_class
 class OnBadFormatOption(OptionMixin, AbstractConfigOption):
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         return str
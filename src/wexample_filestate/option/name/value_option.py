@@ -10,6 +10,10 @@ from wexample_filestate.option.mixin.option_mixin import OptionMixin
 
 @base_class
 class ValueOption(OptionMixin, AbstractConfigOption):
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         return str
@@ -29,6 +29,10 @@ class NameOption(OptionMixin, AbstractNestedConfigOption):
     def get_scopes(cls) -> list[Scope]:
         return [Scope.NAME]
 
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         from pathlib import Path
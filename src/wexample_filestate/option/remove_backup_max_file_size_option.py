@@ -21,6 +21,10 @@ class RemoveBackupMaxFileSizeOption(OptionMixin, AbstractConfigOption):
 
     value: int = REMOVE_BACKUP_MAX_FILE_SIZE_DEFAULT
 
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         return int
@@ -19,6 +19,18 @@ class ShouldContainLinesOption(OptionMixin, AbstractConfigOption):
     def get_scopes(cls) -> list[Scope]:
         return [Scope.CONTENT]
 
+    @classmethod
+    def is_content_fingerprint_safe(cls) -> bool:
+        return True
+
+    @classmethod
+    def is_convergence_safe(cls) -> bool:
+        return True
+
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         return list[str]
@@ -33,7 +45,7 @@ class ShouldContainLinesOption(OptionMixin, AbstractConfigOption):
 
         # Let ShouldExistOption create the file first; this option only adds
         # lines to an existing file.
-        if not target.get_path().exists():
+        if not target.path_exists():
             return None
 
         # Get the required lines
@@ -67,6 +79,6 @@ class ShouldContainLinesOption(OptionMixin, AbstractConfigOption):
 
     def _read_current_content(self, target: TargetFileOrDirectoryType) -> str | None:
         """Read current file content, return empty string if file doesn't exist."""
-        if not target.source or not target.source.get_path().exists():
+        if not target.source or not target.path_exists(target.source.get_path()):
             return ""
-        return target.get_local_file().read() or ""
+        return target.get_current_content() or ""
@@ -32,6 +32,10 @@ class ShouldExistOption(OptionMixin, AbstractConfigOption):
     def get_scopes(cls) -> list[Scope]:
         return [Scope.LOCATION]
 
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         return Union[bool, Callable]
@@ -66,7 +70,7 @@ class ShouldExistOption(OptionMixin, AbstractConfigOption):
             )
 
         # Check current existence state
-        exists = target.get_path().exists()
+        exists = target.path_exists()
 
         # Create operation based on mismatch
         if should_exist and not exists:
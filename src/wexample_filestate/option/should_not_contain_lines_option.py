@@ -19,6 +19,18 @@ class ShouldNotContainLinesOption(OptionMixin, AbstractConfigOption):
     def get_scopes(cls) -> list[Scope]:
         return [Scope.CONTENT]
 
+    @classmethod
+    def is_content_fingerprint_safe(cls) -> bool:
+        return True
+
+    @classmethod
+    def is_convergence_safe(cls) -> bool:
+        return True
+
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         return list[str]
@@ -62,9 +74,9 @@ class ShouldNotContainLinesOption(OptionMixin, AbstractConfigOption):
 
     def _read_current_content(self, target: TargetFileOrDirectoryType) -> str | None:
         """Read current file content, return None if file doesn't exist."""
-        if not target.source or not target.source.get_path().exists():
+        if not target.source or not target.path_exists(target.source.get_path()):
             return None
-        return target.get_local_file().read() or ""
+        return target.get_current_content() or ""
 
     def _remove_forbidden_lines(self, lines: list[str], content: str) -> str:
         """Remove specified lines from content."""
@@ -13,15 +13,6 @@ if TYPE_CHECKING:
     from wexample_filestate.operation.abstract_operation import AbstractOperation
 
 
-def _get_by_path(data: Any, path: str) -> Any:
-    current = data
-    for part in path.split("."):
-        if not isinstance(current, dict) or part not in current:
-            return None
-        current = current[part]
-    return current
-
-
 def _set_by_path(data: Any, path: str, value: Any) -> None:
     parts = path.split(".")
     current = data
@@ -38,6 +29,18 @@ class StructuredKeysOption(OptionMixin, AbstractConfigOption):
     def get_scopes(cls) -> list[Scope]:
         return [Scope.CONTENT]
 
+    @classmethod
+    def is_content_fingerprint_safe(cls) -> bool:
+        return True
+
+    @classmethod
+    def is_convergence_safe(cls) -> bool:
+        return True
+
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         return dict
@@ -51,6 +54,7 @@ class StructuredKeysOption(OptionMixin, AbstractConfigOption):
     def create_required_operation(
         self, target: TargetFileOrDirectoryType, scopes: set[Scope]
     ) -> AbstractOperation | None:
+        from wexample_filestate.helpers.key_path import key_path_get
         from wexample_filestate.item.file.structured_content_file import (
             StructuredContentFile,
         )
@@ -63,6 +67,19 @@ class StructuredKeysOption(OptionMixin, AbstractConfigOption):
         if not expected:
             return None
 
+        expected = {
+            key_path: self._resolve_expected_value(target, value)
+            for key_path, value in expected.items()
+        }
+
+        # Check the key paths without a full parse first: documents matching
+        # the expected values, the common case, never need one.
+        values = target.read_key_paths(list(expected))
+        if values is not None and all(
+            values[key_path] == value for key_path, value in expected.items()
+        ):
+            return None
+
         # Operate directly on the parsed structure (ruamel CommentedMap for YAML)
         # to preserve comments, anchors and custom tags. Refuse to operate if
         # parsing fails — better skip than truncate the file.
@@ -76,11 +93,7 @@ class StructuredKeysOption(OptionMixin, AbstractConfigOption):
 
         mismatches: list[tuple[str, Any]] = []
         for key_path, value in expected.items():
-            if callable(value):
-                value = value(target)
-            elif hasattr(value, "raw") and callable(value.raw):
-                value = value.raw(target)
-            if _get_by_path(parsed, key_path) != value:
+            if key_path_get(parsed, key_path) != value:
                 mismatches.append((key_path, value))
 
         if not mismatches:
@@ -96,3 +109,11 @@ class StructuredKeysOption(OptionMixin, AbstractConfigOption):
             content=target.dumps(parsed),
             description=f"Set {len(mismatches)} key(s): {', '.join(k for k, _ in mismatches)}",
         )
+
+    @staticmethod
+    def _resolve_expected_value(target: TargetFileOrDirectoryType, value: Any) -> Any:
+        if callable(value):
+            return value(target)
+        if hasattr(value, "raw") and callable(value.raw):
+            return value.raw(target)
+        return value
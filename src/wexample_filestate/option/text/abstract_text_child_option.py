@@ -3,12 +3,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from wexample_config.config_option.abstract_config_option import AbstractConfigOption
+from wexample_helpers.classes.abstract_method import abstract_method
 
 from wexample_filestate.enum.scopes import Scope
 from wexample_filestate.option.mixin.option_mixin import OptionMixin
 
 if TYPE_CHECKING:
     from wexample_filestate.const.types_state_items import TargetFileOrDirectoryType
+    from wexample_filestate.operation.abstract_operation import AbstractOperation
 
 
 class AbstractTextChildOption(OptionMixin, AbstractConfigOption):
@@ -16,12 +18,46 @@ class AbstractTextChildOption(OptionMixin, AbstractConfigOption):
     def get_scopes(cls) -> list[Scope]:
         return [Scope.CONTENT]
 
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         return bool
 
+    def create_required_operation(
+        self, target: TargetFileOrDirectoryType, scopes: set[Scope]
+    ) -> AbstractOperation | None:
+        from wexample_filestate.operation.file_write_operation import FileWriteOperation
+
+        current_content = self._read_current_content(target)
+        if current_content is None:
+            return None
+
+        updated_content = self.transform_content(current_content)
+        if updated_content == current_content:
+            return None
+
+        return FileWriteOperation(
+            option=self,
+            target=target,
+            content=updated_content,
+            description=self.get_description(),
+        )
+
+    def transform_content(self, content: str) -> str:
+        """Return content with this rule applied, unchanged if it is disabled."""
+        if not self.get_value().is_true():
+            return content
+        return self._transform_content(content)
+
     def _read_current_content(self, target: TargetFileOrDirectoryType) -> str | None:
         """Read current file content, return None if file doesn't exist."""
-        if not target.source or not target.source.get_path().exists():
+        if not target.source or not target.path_exists(target.source.get_path()):
             return None
-        return target.get_local_file().read()
+        return target.get_current_content()
+
+    @abstract_method
+    def _transform_content(self, content: str) -> str:
+        pass
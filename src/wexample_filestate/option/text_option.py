@@ -23,6 +23,18 @@ class TextOption(OptionMixin, AbstractNestedConfigOption):
     def get_scopes(cls) -> list[Scope]:
         return [Scope.CONTENT]
 
+    @classmethod
+    def is_content_fingerprint_safe(cls) -> bool:
+        return True
+
+    @classmethod
+    def is_convergence_safe(cls) -> bool:
+        return True
+
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         from wexample_helpers.const.types import StringKeysDict
@@ -35,8 +47,47 @@ class TextOption(OptionMixin, AbstractNestedConfigOption):
     def create_required_operation(
         self, target: TargetFileOrDirectoryType, scopes: set[Scope]
     ) -> AbstractOperation | None:
-        """Create FileWriteOperation if text processing is needed."""
-        return self._create_child_required_operation(target=target, scopes=scopes)
+        """Create a single FileWriteOperation applying every enabled text rule.
+
+        The content is read once and passed through the rules in the order of
+        get_allowed_options(), so the proposed content satisfies all of them.
+        """
+        from wexample_filestate.operation.file_write_operation import FileWriteOperation
+
+        options = []
+        for option_class in self.get_allowed_options():
+            option = self.get_option(option_class)
+            if (
+                option
+                and option_class.matches_scope_filter(scopes)
+                and option.get_value().is_true()
+            ):
+                options.append(option)
+
+        if not options:
+            return None
+
+        current_content = options[0]._read_current_content(target)
+        if current_content is None:
+            return None
+
+        updated_content = current_content
+        descriptions = []
+        for option in options:
+            transformed_content = option.transform_content(updated_content)
+            if transformed_content != updated_content:
+                descriptions.append(option.get_description())
+                updated_content = transformed_content
+
+        if updated_content == current_content:
+            return None
+
+        return FileWriteOperation(
+            option=self,
+            target=target,
+            content=updated_content,
+            description="; ".join(descriptions),
+        )
 
     def get_allowed_options(self) -> list[type[AbstractConfigOption]]:
         from wexample_filestate.option.text.end_new_line_option import EndNewLineOption
@@ -44,11 +95,13 @@ class TextOption(OptionMixin, AbstractNestedConfigOption):
         from wexample_filestate.option.text.trim_option import TrimOption
         from wexample_filestate.option.text.unique_lines_option import UniqueLinesOption
 
+        # Also the order in which rules are applied to the content: the final
+        # newline comes last so that trimming does not remove it.
         return [
             TrimOption,
-            EndNewLineOption,
             SortLinesOption,
             UniqueLinesOption,
+            EndNewLineOption,
         ]
 
     @abstract_method
@@ -16,6 +16,10 @@ class AbstractYamlChildOption(OptionMixin, AbstractConfigOption):
     def get_scopes(cls) -> list[Scope]:
         return [Scope.CONTENT]
 
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         return bool
@@ -27,7 +31,12 @@ class AbstractYamlChildOption(OptionMixin, AbstractConfigOption):
         return yaml.safe_dump(data, sort_keys=False)
 
     def _read_yaml_data(self, target: TargetFileOrDirectoryType):
-        """Read YAML data from target file."""
-        from wexample_helpers_yaml.helpers.yaml_helpers import yaml_read
+        """Read YAML data from target file, None unless it holds a mapping."""
+        from wexample_filestate.item.file.yaml_file import YamlFile
+
+        try:
+            content = YamlFile.loads_read_only(target.get_current_content() or "")
+        except Exception:
+            return None
 
-        return yaml_read(target.get_path())
+        return content if isinstance(content, dict) else None
@@ -23,16 +23,13 @@ class SortRecursiveOption(AbstractYamlChildOption):
 
         if self.get_value().is_true():
             data = self._read_yaml_data(target)
-            sorted_data = self._sort_recursive(data)
-            sorted_content = self._dump_yaml_content(sorted_data)
-
-            if self._dump_yaml_content(data) == sorted_content:
+            if self._is_sorted_recursive(data):
                 return None
 
             return FileWriteOperation(
                 option=self,
                 target=target,
-                content=sorted_content,
+                content=self._dump_yaml_content(self._sort_recursive(data)),
                 description=self.get_description(),
             )
 
@@ -41,15 +38,29 @@ class SortRecursiveOption(AbstractYamlChildOption):
     def get_description(self) -> str:
         return "Sort YAML file content recursively by keys"
 
-    def _is_yaml_sorted(self, target: TargetFileOrDirectoryType) -> bool:
-        """Check if YAML file is already recursively sorted."""
-        data = self._read_yaml_data(target)
-        sorted_data = self._sort_recursive(data)
+    def _is_sorted_recursive(self, obj) -> bool:
+        """Check that every mapping has sorted keys, stopping at the first one not.
 
-        current_dump = self._dump_yaml_content(data)
-        sorted_dump = self._dump_yaml_content(sorted_data)
+        Same result as comparing the dumps of obj and of its sorted copy,
+        without building or dumping anything.
+        """
+        stack = [obj]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, dict):
+                previous = None
+                for index, key in enumerate(current):
+                    if index and key < previous:
+                        return False
+                    previous = key
+                stack.extend(current.values())
+            elif isinstance(current, list):
+                stack.extend(current)
+        return True
 
-        return current_dump == sorted_dump
+    def _is_yaml_sorted(self, target: TargetFileOrDirectoryType) -> bool:
+        """Check if YAML file is already recursively sorted."""
+        return self._is_sorted_recursive(self._read_yaml_data(target))
 
     def _sort_recursive(self, obj):
         """Recursively sort dictionary keys and process lists."""
@@ -24,6 +24,18 @@ class YamlOption(OptionMixin, AbstractNestedConfigOption):
     def get_scopes(cls) -> list[Scope]:
         return [Scope.CONTENT]
 
+    @classmethod
+    def is_content_fingerprint_safe(cls) -> bool:
+        return True
+
+    @classmethod
+    def is_convergence_safe(cls) -> bool:
+        return True
+
+    @classmethod
+    def is_process_pool_safe(cls) -> bool:
+        return True
+
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         from wexample_filestate.config_value.yaml_config_value import YamlConfigValue
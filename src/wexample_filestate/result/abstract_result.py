@@ -6,14 +6,18 @@ from wexample_helpers.classes.abstract_method import abstract_method
 from wexample_helpers.classes.base_class import BaseClass
 from wexample_helpers.classes.field import public_field
 from wexample_helpers.classes.mixin.printable_mixin import PrintableMixin
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 
 from wexample_filestate.item.abstract_item_target import AbstractItemTarget
 from wexample_filestate.operation.abstract_operation import AbstractOperation
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from wexample_filestate.item.abstract_item_target import AbstractItemTarget
     from wexample_filestate.operation.abstract_operation import AbstractOperation
+    from wexample_filestate.option.mixin.option_mixin import OptionMixin
 
 
 @base_class
@@ -29,45 +33,147 @@ class AbstractResult(PrintableMixin, BaseClass):
     state_manager: AbstractItemTarget = public_field(
         description="Item target state manager associated with this result",
     )
+    _executed_operation_ids: set[int] = private_field(
+        factory=set,
+        description="Identities of the operations executed by the running "
+        "apply_operations(), so an operation listed twice runs once",
+    )
+    _indexed_operations: list[AbstractOperation] | None = private_field(
+        default=None,
+        description="Operations list covered by the lookup indexes",
+    )
+    _indexed_count: int = private_field(
+        default=0, description="Number of operations in the lookup indexes"
+    )
+    _operations_by_class: dict[type, list[int]] = private_field(
+        factory=dict, description="Operation positions by operation class"
+    )
+    _operations_by_option: dict[int, list[int]] = private_field(
+        factory=dict, description="Operation positions by option identity"
+    )
+    _operations_by_path: dict[Path, list[int]] = private_field(
+        factory=dict, description="Operation positions by target path"
+    )
+
+    def apply_operation(
+        self, operation: AbstractOperation, interactive: bool = False
+    ) -> bool:
+        """Record and apply a single operation, e.g. from iter_operations()."""
+        self.operations.append(operation)
+        return self._execute_operation(operation=operation, interactive=interactive)
 
     def apply_operations(self, interactive: bool = False) -> None:
-        self._executed_operations = []
+        self._executed_operation_ids = set()
 
         operations = reversed(self.operations) if self.rollback else self.operations
 
         for operation in operations:
-            if operation in self._executed_operations:
+            if id(operation) in self._executed_operation_ids:
                 continue
 
             if self.rollback:
                 operation.undo()
+                self._invalidate_stat_snapshot(operation)
                 operation.applied = False
-                self._executed_operations.append(operation)
-            else:
-                self.state_manager.subtitle(
-                    f"OPERATION: {operation.get_snake_short_class_name().upper()}"
-                )
-                applied = self._apply_single_operation(
-                    operation=operation, interactive=interactive
-                )
-
-                if applied:
-                    operation.applied = True
-                    self._executed_operations.append(operation)
-
-                    self.state_manager.task(
-                        message=f"{operation.target.get_item_title()}: {operation.target.render_display_path()}\n"
-                        f"    → {operation.description}\n"
-                    )
-                else:
-                    self.state_manager.log(
-                        message=f"{operation.target.get_item_title()}: {operation.target.render_display_path()}\n"
-                        f"    → {operation.description}\n"
-                        f"    ⋮ Operation aborted"
-                    )
+                self._executed_operation_ids.add(id(operation))
+            elif self._execute_operation(
+                operation=operation, interactive=interactive
+            ):
+                self._executed_operation_ids.add(id(operation))
+
+    def get_operations_by_class(
+        self, operation_class: type[AbstractOperation]
+    ) -> list[AbstractOperation]:
+        """Return the operations that are instances of operation_class, in order."""
+        self._update_indexes()
+
+        positions = []
+        for indexed_class, class_positions in self._operations_by_class.items():
+            if issubclass(indexed_class, operation_class):
+                positions.extend(class_positions)
+        return [self.operations[position] for position in sorted(positions)]
+
+    def get_operations_by_option(self, option: OptionMixin) -> list[AbstractOperation]:
+        """Return the operations created by this option instance, in order."""
+        self._update_indexes()
+        return [
+            self.operations[position]
+            for position in self._operations_by_option.get(id(option), ())
+        ]
+
+    def get_operations_by_target_path(self, path: Path) -> list[AbstractOperation]:
+        """Return the operations whose target had this path when indexed, in order."""
+        self._update_indexes()
+        return [
+            self.operations[position]
+            for position in self._operations_by_path.get(path, ())
+        ]
 
     @abstract_method
     def _apply_single_operation(
         self, operation: AbstractOperation, interactive: bool = False
     ) -> bool:
         pass
+
+    def _execute_operation(
+        self, operation: AbstractOperation, interactive: bool = False
+    ) -> bool:
+        self.state_manager.subtitle(
+            f"OPERATION: {operation.get_snake_short_class_name().upper()}"
+        )
+        applied = self._apply_single_operation(
+            operation=operation, interactive=interactive
+        )
+        self._invalidate_stat_snapshot(operation)
+
+        if applied:
+            operation.applied = True
+
+            self.state_manager.task(
+                message=f"{operation.target.get_item_title()}: {operation.target.render_display_path()}\n"
+                f"    → {operation.description}\n"
+            )
+        else:
+            self.state_manager.log(
+                message=f"{operation.target.get_item_title()}: {operation.target.render_display_path()}\n"
+                f"    → {operation.description}\n"
+                f"    ⋮ Operation aborted"
+            )
+
+        return applied
+
+    def _invalidate_stat_snapshot(self, operation: AbstractOperation) -> None:
+        snapshot = operation.target.get_stat_snapshot()
+        if snapshot is None:
+            return
+
+        for path in operation.get_affected_paths():
+            snapshot.invalidate(path)
+
+    def _update_indexes(self) -> None:
+        """Index the operations appended since the last lookup.
+
+        Operations are expected to be appended only; a shorter or replaced
+        list rebuilds the indexes from scratch.
+        """
+        operations = self.operations
+        if (
+            operations is not self._indexed_operations
+            or len(operations) < self._indexed_count
+        ):
+            self._indexed_operations = operations
+            self._indexed_count = 0
+            self._operations_by_class = {}
+            self._operations_by_option = {}
+            self._operations_by_path = {}
+
+        for position in range(self._indexed_count, len(operations)):
+            operation = operations[position]
+            self._operations_by_class.setdefault(type(operation), []).append(position)
+            self._operations_by_option.setdefault(id(operation.option), []).append(
+                position
+            )
+            self._operations_by_path.setdefault(operation.target.get_path(), []).append(
+                position
+            )
+        self._indexed_count = len(operations)
@@ -5,11 +5,22 @@ from typing import TYPE_CHECKING
 from wexample_filestate.result.abstract_result import AbstractResult
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from wexample_filestate.operation.abstract_operation import AbstractOperation
 
 
 class FileStateResult(AbstractResult):
-    _executed_operations: list = []
+    def apply_operations(self, interactive: bool = False) -> None:
+        if not self.rollback and not interactive:
+            # Each change is confirmed on its own in interactive mode.
+            self._coalesce_file_writes()
+
+        super().apply_operations(interactive=interactive)
+
+        # Batched syncs happen once all the operations are applied.
+        if self._executed_operation_ids:
+            self.state_manager.get_file_writer().flush()
 
     def _apply_single_operation(
         self, operation: AbstractOperation, interactive: bool = False
@@ -47,8 +58,30 @@ class FileStateResult(AbstractResult):
         operation.apply_operation()
         return True
 
-    def _find_dependency(self, dependency_class) -> AbstractOperation | None:
+    def _coalesce_file_writes(self) -> None:
+        """Merge the pending writes on a same file into the first of them.
+
+        Only writes that no other operation on the file separates are merged,
+        see FileWriteOperation.coalesce.
+        """
+        from wexample_filestate.operation.file_write_operation import (
+            FileWriteOperation,
+        )
+
+        pending: dict[Path, list[FileWriteOperation]] = {}
+        groups: list[list[FileWriteOperation]] = []
         for operation in self.operations:
-            if isinstance(operation, dependency_class):
-                return operation
-        return None
+            path = operation.target.get_path()
+            if isinstance(operation, FileWriteOperation) and not operation.applied:
+                pending.setdefault(path, []).append(operation)
+            elif path in pending:
+                groups.append(pending.pop(path))
+        groups.extend(pending.values())
+
+        for writes in groups:
+            if len(writes) > 1:
+                writes[0].coalesce(writes[1:])
+
+    def _find_dependency(self, dependency_class) -> AbstractOperation | None:
+        operations = self.get_operations_by_class(dependency_class)
+        return operations[0] if operations else None
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Any
+
+from wexample_helpers.classes.abstract_method import abstract_method
+
+
+class AbstractSerializerBackend:
+    """Parser and dumper of the text of a structured file type.
+
+    Backends are stateless and only expose class methods; file types list
+    the ones they support, see StructuredContentFile.get_serializer_backend.
+    Read-only backends parse faster but lose formatting details, so they are
+    only used by checks that never write the data back.
+    """
+
+    @classmethod
+    def create_empty_content(cls) -> Any:
+        """Return the content of an empty or unparsable file."""
+        return {}
+
+    @classmethod
+    def dumps(cls, content: Any) -> str:
+        raise NotImplementedError(f"{cls.get_name()} is a read-only backend")
+
+    @classmethod
+    @abstract_method
+    def get_name(cls) -> str:
+        pass
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Whether the optional dependencies of the backend are installed."""
+        return True
+
+    @classmethod
+    def is_read_only(cls) -> bool:
+        return False
+
+    @classmethod
+    @abstract_method
+    def loads(cls, text: str) -> Any:
+        """Parse text, raising on invalid content."""
+        pass
+
+    @classmethod
+    def loads_key_paths(cls, text: str, key_paths: list[str]) -> dict[str, Any] | None:
+        """Return the values at dotted key paths, reading no further than needed.
+
+        Values equal the ones of a full loads, missing key paths map to None,
+        as long as the unread rest of the document does not override them,
+        e.g. with a duplicate key. Returns None when the backend has no
+        partial reader or the document uses constructs that need a full parse.
+        """
+        return None
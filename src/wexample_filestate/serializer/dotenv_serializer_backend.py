@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import Any
+
+from wexample_filestate.serializer.abstract_serializer_backend import (
+    AbstractSerializerBackend,
+)
+
+
+class DotenvSerializerBackend(AbstractSerializerBackend):
+    """python-dotenv, the default .env backend, with variable interpolation."""
+
+    @classmethod
+    def dumps(cls, content: Any) -> str:
+        # Produce .env textual content from a dict-like mapping
+        if not isinstance(content, dict):
+            return ""
+        return (
+            "\n".join(f"{k}={'' if v is None else v}" for k, v in content.items())
+            + "\n"
+        )
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "dotenv"
+
+    @classmethod
+    def loads(cls, text: str) -> Any:
+        from io import StringIO
+
+        from dotenv import dotenv_values
+
+        return dict(dotenv_values(stream=StringIO(text)))
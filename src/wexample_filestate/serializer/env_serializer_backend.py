@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import Any
+
+from wexample_filestate.serializer.dotenv_serializer_backend import (
+    DotenvSerializerBackend,
+)
+
+_DOUBLE_QUOTE_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", '"': '"', "\\": "\\"}
+
+
+class EnvSerializerBackend(DotenvSerializerBackend):
+    """Native .env parser, without python-dotenv's parsing overhead.
+
+    Supports comments, ``export`` prefixes, single quoted (literal) and
+    double quoted (escapes, multiple lines) values and inline comments after
+    unquoted values. Unlike python-dotenv, ``${VAR}`` references are kept as
+    is instead of being interpolated.
+    """
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "env"
+
+    @classmethod
+    def loads(cls, text: str) -> Any:
+        values = {}
+        lines = text.splitlines()
+        position = 0
+        while position < len(lines):
+            line = lines[position].strip()
+            position += 1
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("export "):
+                line = line[len("export ") :].lstrip()
+
+            key, separator, value = line.partition("=")
+            key = key.strip()
+            if not separator:
+                values[key] = None
+                continue
+
+            value = value.strip()
+            quote = value[:1]
+            if quote in ("'", '"'):
+                value = value[1:]
+                # Quoted values may span several lines.
+                end = cls._find_closing_quote(value, quote)
+                while end == -1 and position < len(lines):
+                    value += "\n" + lines[position]
+                    position += 1
+                    end = cls._find_closing_quote(value, quote)
+                if end != -1:
+                    value = value[:end]
+                if quote == '"':
+                    value = cls._unescape(value)
+            else:
+                comment = value.find(" #")
+                if comment != -1:
+                    value = value[:comment].rstrip()
+
+            values[key] = value
+        return values
+
+    @staticmethod
+    def _find_closing_quote(value: str, quote: str) -> int:
+        position = 0
+        while position < len(value):
+            if value[position] == "\\" and quote == '"':
+                position += 2
+                continue
+            if value[position] == quote:
+                return position
+            position += 1
+        return -1
+
+    @staticmethod
+    def _unescape(value: str) -> str:
+        output = []
+        position = 0
+        while position < len(value):
+            character = value[position]
+            if character == "\\" and position + 1 < len(value):
+                escaped = value[position + 1]
+                output.append(_DOUBLE_QUOTE_ESCAPES.get(escaped, "\\" + escaped))
+                position += 2
+                continue
+            output.append(character)
+            position += 1
+        return "".join(output)
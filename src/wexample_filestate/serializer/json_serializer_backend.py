@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from wexample_filestate.serializer.abstract_serializer_backend import (
+    AbstractSerializerBackend,
+)
+
+_CONTAINER_TOKEN = re.compile(r'["{}\[\]]')
+_PRIMITIVE_END = re.compile(r"[,}\]\s]")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _FullParseRequired(Exception):
+    """Raised by the key paths scanner on duplicated keys of the paths."""
+
+
+class _KeyPathsResolved(Exception):
+    """Raised by the key paths scanner once every key path is resolved."""
+
+
+class JsonSerializerBackend(AbstractSerializerBackend):
+    """Standard library json, the default JSON backend."""
+
+    @classmethod
+    def dumps(cls, content: Any) -> str:
+        import json
+
+        return json.dumps(content or {}, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "json"
+
+    @classmethod
+    def loads(cls, text: str) -> Any:
+        import json
+
+        return json.loads(text)
+
+    @classmethod
+    def loads_key_paths(cls, text: str, key_paths: list[str]) -> dict[str, Any] | None:
+        """Scan the top level object, only decoding the values on the key paths.
+
+        Scanning stops once every key path is resolved, the rest of the text
+        is neither read nor validated. A key of the paths repeated before that
+        point needs a full parse (None), since json.loads keeps its last
+        value; repeated after it, it goes unnoticed. Skipped values are not
+        validated.
+        """
+        from wexample_filestate.helpers.key_path import key_path_tree
+
+        index = _WHITESPACE.match(text).end()
+        if not text.startswith("{", index):
+            return None
+
+        results: dict[str, Any] = {}
+        try:
+            index = cls._read_object(
+                text, index, key_path_tree(key_paths), results, len(set(key_paths))
+            )
+        except _FullParseRequired:
+            return None
+        except _KeyPathsResolved:
+            pass
+        else:
+            if _WHITESPACE.match(text, index).end() != len(text):
+                raise ValueError(f"Extra data at index {index}")
+        return {path: results.get(path) for path in key_paths}
+
+    @classmethod
+    def _read_object(
+        cls, text: str, index: int, node: dict, results: dict[str, Any], count: int
+    ) -> int:
+        """Read the object starting at index, resolving the key paths of node.
+
+        Returns the index following the object, or raises _KeyPathsResolved
+        once results holds all the count key paths.
+        """
+        import json
+        from json.decoder import scanstring
+
+        from wexample_filestate.helpers.key_path import (
+            key_path_leaves,
+            key_path_resolve,
+        )
+
+        index = _WHITESPACE.match(text, index + 1).end()
+        if text[index] == "}":
+            return index + 1
+
+        seen: set[str] = set()
+        while True:
+            if text[index] != '"':
+                raise ValueError(f"Expected a property name at index {index}")
+            key, index = scanstring(text, index + 1)
+            index = _WHITESPACE.match(text, index).end()
+            if text[index] != ":":
+                raise ValueError(f"Expected ':' at index {index}")
+            index = _WHITESPACE.match(text, index + 1).end()
+
+            child = node.get(key)
+            if child is not None:
+                if key in seen:
+                    raise _FullParseRequired(f"Duplicate key {key!r}")
+                seen.add(key)
+
+            if child is None or (None not in child and text[index] != "{"):
+                index = cls._skip_value(text, index)
+            elif None in child:
+                value, index = json.JSONDecoder().raw_decode(text, index)
+                key_path_resolve(value, child, results)
+            else:
+                index = cls._read_object(text, index, child, results, count)
+
+            if child is not None:
+                # Key paths the value does not hold resolve to None.
+                for path in key_path_leaves(child):
+                    results.setdefault(path, None)
+                if len(results) == count:
+                    raise _KeyPathsResolved()
+
+            index = _WHITESPACE.match(text, index).end()
+            if text[index] == "}":
+                return index + 1
+            if text[index] != ",":
+                raise ValueError(f"Expected ',' or '}}' at index {index}")
+            index = _WHITESPACE.match(text, index + 1).end()
+
+    @staticmethod
+    def _skip_value(text: str, index: int) -> int:
+        from json.decoder import scanstring
+
+        char = text[index]
+        if char == '"':
+            return scanstring(text, index + 1)[1]
+
+        if char in "{[":
+            depth = 0
+            while True:
+                match = _CONTAINER_TOKEN.search(text, index)
+                if match is None:
+                    raise ValueError("Unterminated JSON container")
+                index = match.end()
+                char = match.group()
+                if char == '"':
+                    index = scanstring(text, index)[1]
+                elif char in "{[":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        return index
+
+        match = _PRIMITIVE_END.search(text, index)
+        return match.start() if match else len(text)
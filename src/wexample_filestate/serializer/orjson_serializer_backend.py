@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any
+
+from wexample_filestate.serializer.abstract_serializer_backend import (
+    AbstractSerializerBackend,
+)
+
+
+class OrjsonSerializerBackend(AbstractSerializerBackend):
+    """JSON through the optional orjson package, several times faster than json.
+
+    Output uses the same two spaces indentation as the default backend, but
+    orjson is stricter: non-string keys and NaN are not accepted as is.
+    """
+
+    @classmethod
+    def dumps(cls, content: Any) -> str:
+        import orjson
+
+        return orjson.dumps(content or {}, option=orjson.OPT_INDENT_2).decode()
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "orjson"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        from importlib.util import find_spec
+
+        return find_spec("orjson") is not None
+
+    @classmethod
+    def loads(cls, text: str) -> Any:
+        import orjson
+
+        return orjson.loads(text)
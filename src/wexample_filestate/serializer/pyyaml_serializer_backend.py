@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any
+
+from wexample_filestate.serializer.abstract_serializer_backend import (
+    AbstractSerializerBackend,
+)
+
+
+class PyyamlSerializerBackend(AbstractSerializerBackend):
+    """Read-only YAML through PyYAML's C safe loader, when libyaml is available.
+
+    Much faster than the round-trip loader, but comments, quote styles and
+    custom tags are lost; unknown tags raise.
+    """
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "pyyaml"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        from importlib.util import find_spec
+
+        return find_spec("yaml") is not None
+
+    @classmethod
+    def is_read_only(cls) -> bool:
+        return True
+
+    @classmethod
+    def loads(cls, text: str) -> Any:
+        import yaml
+
+        return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Any
+
+from wexample_filestate.serializer.abstract_serializer_backend import (
+    AbstractSerializerBackend,
+)
+
+
+class TomlSerializerBackend(AbstractSerializerBackend):
+    """tomlkit, the default TOML backend: documents keep their formatting."""
+
+    @classmethod
+    def create_empty_content(cls) -> Any:
+        from tomlkit import document
+
+        # An empty TOMLDocument keeps types consistent
+        return document()
+
+    @classmethod
+    def dumps(cls, content: Any) -> str:
+        from tomlkit import TOMLDocument, document, dumps
+
+        if content is None:
+            return dumps(document())
+
+        # If it's already a TOMLDocument, dump as-is to preserve formatting
+        try:
+            if isinstance(content, TOMLDocument):
+                return dumps(content)
+        except Exception:
+            pass
+
+        # Otherwise, attempt to create a TOMLDocument from a dict-like value
+        if isinstance(content, dict):
+            doc = document()
+            for k, v in content.items():
+                doc[k] = v
+            return dumps(doc)
+
+        # Fallback: stringify
+        return str(content)
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "tomlkit"
+
+    @classmethod
+    def loads(cls, text: str) -> Any:
+        from tomlkit import parse
+
+        if not text:
+            return cls.create_empty_content()
+        return parse(text)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Any
+
+from wexample_filestate.serializer.abstract_serializer_backend import (
+    AbstractSerializerBackend,
+)
+
+
+class TomllibSerializerBackend(AbstractSerializerBackend):
+    """Read-only TOML through the standard library tomllib (Python 3.11+).
+
+    Parses into plain dicts, much faster than tomlkit documents.
+    """
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "tomllib"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        from importlib.util import find_spec
+
+        return find_spec("tomllib") is not None
+
+    @classmethod
+    def is_read_only(cls) -> bool:
+        return True
+
+    @classmethod
+    def loads(cls, text: str) -> Any:
+        import tomllib
+
+        return tomllib.loads(text)
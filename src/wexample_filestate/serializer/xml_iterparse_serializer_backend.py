@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from wexample_filestate.serializer.abstract_serializer_backend import (
+    AbstractSerializerBackend,
+)
+
+if TYPE_CHECKING:
+    from xml.etree.ElementTree import Element
+
+
+class XmlIterparseSerializerBackend(AbstractSerializerBackend):
+    """Read-only XML through the standard library incremental parser.
+
+    Builds the same structure as xmltodict (``@`` attributes, ``#text``,
+    lists for repeated elements) while releasing each element once read.
+    Namespaced tags keep their ``{uri}`` form, and text placed after child
+    elements is ignored.
+    """
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "iterparse"
+
+    @classmethod
+    def is_read_only(cls) -> bool:
+        return True
+
+    @classmethod
+    def loads(cls, text: str) -> Any:
+        from io import StringIO
+        from xml.etree.ElementTree import iterparse
+
+        stack: list[dict[str, Any]] = [{}]
+        for event, element in iterparse(StringIO(text), events=("start", "end")):
+            if event == "start":
+                stack.append({})
+                continue
+
+            value = cls._create_element_value(element, stack.pop())
+            parent = stack[-1]
+            if element.tag not in parent:
+                parent[element.tag] = value
+            elif isinstance(parent[element.tag], list):
+                parent[element.tag].append(value)
+            else:
+                parent[element.tag] = [parent[element.tag], value]
+            element.clear()
+
+        return stack[0]
+
+    @staticmethod
+    def _create_element_value(element: Element, children: dict[str, Any]) -> Any:
+        text = (element.text or "").strip()
+        if not element.attrib and not children:
+            return text or None
+
+        value = {f"@{name}": attribute for name, attribute in element.attrib.items()}
+        value.update(children)
+        if text:
+            value["#text"] = text
+        return value
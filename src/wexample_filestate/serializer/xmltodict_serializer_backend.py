@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import Any
+
+from wexample_filestate.serializer.abstract_serializer_backend import (
+    AbstractSerializerBackend,
+)
+
+
+class XmltodictSerializerBackend(AbstractSerializerBackend):
+    """xmltodict, the default XML backend."""
+
+    @classmethod
+    def dumps(cls, content: Any) -> str:
+        import xmltodict
+
+        if isinstance(content, str):
+            # Already XML string
+            return content
+        try:
+            return xmltodict.unparse(content or {}, pretty=True)
+        except Exception:
+            return str(content)
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "xmltodict"
+
+    @classmethod
+    def loads(cls, text: str) -> Any:
+        import xmltodict
+
+        return xmltodict.parse(text) or {}
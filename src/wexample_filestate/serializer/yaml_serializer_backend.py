@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+from wexample_filestate.serializer.abstract_serializer_backend import (
+    AbstractSerializerBackend,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ruamel.yaml import YAML
+    from ruamel.yaml.events import Event, ScalarEvent
+
+# Round-trip engines, one per thread: building one is costly and an instance
+# must not be used by two threads at once.
+_YAML_ENGINES = threading.local()
+
+
+class _FullParseRequired(Exception):
+    """Raised by the key paths walker on constructs it does not follow."""
+
+
+class _KeyPathsResolved(Exception):
+    """Raised by the key paths walker once every key path is resolved."""
+
+
+class YamlSerializerBackend(AbstractSerializerBackend):
+    """ruamel.yaml round-trip, the default YAML backend."""
+
+    @classmethod
+    def dumps(cls, content: Any) -> str:
+        import io
+
+        buf = io.StringIO()
+        cls.get_engine().dump(content, buf)
+        return buf.getvalue()
+
+    @classmethod
+    def get_engine(cls) -> YAML:
+        """Return the round-trip ruamel.yaml instance of the current thread."""
+        yaml = getattr(_YAML_ENGINES, "round_trip", None)
+        if yaml is None:
+            yaml = cls._create_engine()
+            _YAML_ENGINES.round_trip = yaml
+        return yaml
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "ruamel"
+
+    @classmethod
+    def loads(cls, text: str) -> Any:
+        import io
+
+        value = cls.get_engine().load(io.StringIO(text))
+        return value if value is not None else {}
+
+    @classmethod
+    def loads_key_paths(cls, text: str, key_paths: list[str]) -> dict[str, Any] | None:
+        """Walk the parser events, only constructing the scalars on the key paths.
+
+        Walking stops once every key path is resolved, the rest of the text is
+        neither parsed nor validated. Falls back to a full parse (None) for
+        aliases, merge keys, complex keys and key paths holding collections,
+        and for duplicate keys and multiple documents if met before that
+        point: mapping keys are constructed to find the duplicates a full load
+        rejects.
+        """
+        from ruamel.yaml.events import (
+            DocumentEndEvent,
+            DocumentStartEvent,
+            MappingStartEvent,
+            StreamEndEvent,
+        )
+
+        from wexample_filestate.helpers.key_path import key_path_tree
+
+        engine = cls.get_engine()
+        events = engine.parse(text)
+        results: dict[str, Any] = {}
+        try:
+            next(events)
+            if not isinstance(next(events), DocumentStartEvent):
+                return None
+            if not isinstance(next(events), MappingStartEvent):
+                return None
+            cls._read_mapping(
+                engine, events, key_path_tree(key_paths), results, len(set(key_paths))
+            )
+            if not isinstance(next(events), DocumentEndEvent):
+                return None
+            if not isinstance(next(events), StreamEndEvent):
+                raise _FullParseRequired("Multiple documents")
+        except _FullParseRequired:
+            return None
+        except _KeyPathsResolved:
+            pass
+        finally:
+            # Resets the parser of the shared engine.
+            events.close()
+
+        return {path: results.get(path) for path in key_paths}
+
+    @classmethod
+    def _add_key(cls, engine: YAML, keys: set, event: ScalarEvent) -> Any:
+        """Construct the key of event, raising if keys already holds it."""
+        key = cls._construct_scalar(engine, event)
+        if key in keys:
+            raise _FullParseRequired("Duplicate key")
+        keys.add(key)
+        return key
+
+    @staticmethod
+    def _construct_scalar(engine: YAML, event: ScalarEvent) -> Any:
+        """Construct a scalar the way a full round-trip load does."""
+        from ruamel.yaml.nodes import ScalarNode
+
+        tag = event.ctag
+        if tag is None or str(tag) == "!":
+            tag = engine.resolver.resolve(ScalarNode, event.value, event.implicit)
+
+        node = ScalarNode(
+            tag, event.value, event.start_mark, event.end_mark, style=event.style
+        )
+        constructor = engine.constructor
+        try:
+            return constructor.construct_object(node, deep=True)
+        finally:
+            constructor.constructed_objects.pop(node, None)
+
+    @staticmethod
+    def _create_engine() -> YAML:
+        """Return a ruamel.yaml instance configured for round-trip preservation:
+        comments, anchors/aliases, key order, quote style, and custom tags
+        (e.g. GitLab CI's ``!reference``) are kept intact.
+        """
+        from ruamel.yaml import YAML
+
+        yaml = YAML()
+        yaml.preserve_quotes = True
+        yaml.width = 4096  # avoid line-wrapping rewrites
+        yaml.indent(mapping=2, sequence=4, offset=2)
+        return yaml
+
+    @classmethod
+    def _read_mapping(
+        cls,
+        engine: YAML,
+        events: Iterator[Event],
+        node: dict,
+        results: dict[str, Any],
+        count: int,
+    ) -> None:
+        """Read the mapping whose start event was consumed, resolving the key
+        paths of node; raises _KeyPathsResolved once results holds all the
+        count key paths.
+        """
+        from ruamel.yaml.events import (
+            AliasEvent,
+            MappingEndEvent,
+            MappingStartEvent,
+            ScalarEvent,
+        )
+
+        from wexample_filestate.helpers.key_path import key_path_leaves
+
+        keys: set = set()
+        while True:
+            event = next(events)
+            if isinstance(event, MappingEndEvent):
+                return
+            if not isinstance(event, ScalarEvent):
+                raise _FullParseRequired("Complex mapping key")
+            if event.value == "<<" and event.style is None:
+                raise _FullParseRequired("Merge key")
+
+            key = cls._add_key(engine, keys, event)
+            child = node.get(key) if isinstance(key, str) else None
+            event = next(events)
+
+            if child is None:
+                cls._skip_node(engine, events, event)
+            elif None in child:
+                if len(child) > 1 or not isinstance(event, ScalarEvent):
+                    raise _FullParseRequired("Collection value on a key path")
+                results[child[None]] = cls._construct_scalar(engine, event)
+            elif isinstance(event, MappingStartEvent):
+                cls._read_mapping(engine, events, child, results, count)
+            elif isinstance(event, AliasEvent):
+                raise _FullParseRequired("Alias on a key path")
+            else:
+                # Key paths below a scalar or a sequence resolve to None.
+                cls._skip_node(engine, events, event)
+
+            if child is not None:
+                for path in key_path_leaves(child):
+                    results.setdefault(path, None)
+                if len(results) == count:
+                    raise _KeyPathsResolved()
+
+    @classmethod
+    def _skip_node(cls, engine: YAML, events: Iterator[Event], event: Event) -> None:
+        """Skip the node starting with event, still checking its mapping keys."""
+        from ruamel.yaml.events import (
+            CollectionEndEvent,
+            MappingEndEvent,
+            MappingStartEvent,
+            ScalarEvent,
+            SequenceStartEvent,
+        )
+
+        if isinstance(event, MappingStartEvent):
+            keys: set = set()
+            while True:
+                event = next(events)
+                if isinstance(event, MappingEndEvent):
+                    return
+                if isinstance(event, ScalarEvent):
+                    cls._add_key(engine, keys, event)
+                else:
+                    # Complex keys are not compared.
+                    cls._skip_node(engine, events, event)
+                cls._skip_node(engine, events, next(events))
+        elif isinstance(event, SequenceStartEvent):
+            while True:
+                event = next(events)
+                if isinstance(event, CollectionEndEvent):
+                    return
+                cls._skip_node(engine, events, event)
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_filestate.service.disk_persisted_registry import DiskPersistedRegistry
+
+if TYPE_CHECKING:
+    from wexample_filestate.const.types_state_items import TargetFileOrDirectoryType
+    from wexample_filestate.enum.scopes import Scope
+    from wexample_filestate.item.file.structured_content_file import (
+        StructuredContentFile,
+    )
+    from wexample_filestate.option.mixin.option_mixin import OptionMixin
+
+
+@base_class
+class OptionFingerprintStore(DiskPersistedRegistry[int]):
+    """Option checks that required no operation, keyed by fingerprint.
+
+    A fingerprint covers the file content hash, the item and option classes,
+    the option raw config, the run scopes and the package version. Unlike
+    the scan index, it survives changes of the file signature that keep its
+    content (checkouts, touch, copies). Only options whose check depends on
+    nothing else are fingerprinted, see OptionMixin.is_content_fingerprint_safe.
+    Entries are kept in least recently used order and the oldest ones are
+    evicted beyond MAX_ENTRIES.
+    """
+
+    FILE_NAME: ClassVar[str] = "option-fingerprints.json"
+    MAX_ENTRIES: ClassVar[int] = 50_000
+
+    _context: str = private_field(
+        default="", description="Fingerprint of the run parameters"
+    )
+    _last_content: tuple[bytes, str] | None = private_field(
+        default=None,
+        description="Last hashed content and its digest, shared by the options "
+        "of the same item",
+    )
+    _lock: threading.Lock | None = private_field(
+        default=None, description="Guards the LRU order against worker threads"
+    )
+    _max_entries: int = private_field(
+        default=0, description="Number of entries kept when saving"
+    )
+
+    def __init__(
+        self,
+        container: Any = None,
+        file: StructuredContentFile | None = None,
+        context: str = "",
+        max_entries: int | None = None,
+    ) -> None:
+        super().__init__(container=container, file=file)
+        self._context = context
+        self._last_content = None
+        self._lock = threading.Lock()
+        self._max_entries = max_entries or self.MAX_ENTRIES
+
+    @classmethod
+    def create_for_root(
+        cls,
+        root: TargetFileOrDirectoryType,
+        scopes: set[Scope],
+    ) -> OptionFingerprintStore:
+        from wexample_filestate.helpers.config_fingerprint import (
+            config_fingerprint,
+            config_fingerprint_version,
+        )
+        from wexample_filestate.item.file.json_file import JsonFile
+
+        path = root.get_path() / ".wex" / "tmp" / cls.FILE_NAME
+        store = cls(
+            container=root,
+            file=JsonFile.create_from_path(path=path),
+            context=config_fingerprint(config_fingerprint_version(), scopes),
+        )
+        store.load()
+        return store
+
+    def build_fingerprint(
+        self, item: TargetFileOrDirectoryType, option: OptionMixin
+    ) -> str | None:
+        """Return the fingerprint of an option check, or None if it cannot be stored."""
+        from wexample_filestate.helpers.config_fingerprint import config_fingerprint
+
+        if not option.is_content_fingerprint_safe():
+            return None
+
+        content_hash = self._get_content_hash(item)
+        if content_hash is None:
+            return None
+
+        return config_fingerprint(
+            option.get_value().raw,
+            content_hash,
+            type(option),
+            type(item),
+            self._context,
+        )
+
+    def is_clean(self, fingerprint: str) -> bool:
+        with self._lock:
+            if self._items.pop(fingerprint, None) is None:
+                return False
+            # Move the entry to the most recently used end.
+            self._items[fingerprint] = 1
+            return True
+
+    def mark_clean(self, fingerprint: str) -> None:
+        with self._lock:
+            self._items.pop(fingerprint, None)
+            self._items[fingerprint] = 1
+            while len(self._items) > self._max_entries:
+                del self._items[next(iter(self._items))]
+
+    def save(self) -> None:
+        self._file.get_path().parent.mkdir(parents=True, exist_ok=True)
+        super().save()
+
+    def _get_content_hash(self, item: TargetFileOrDirectoryType) -> str | None:
+        import hashlib
+
+        data = item.read_bytes()
+        if data is None:
+            return None
+
+        last_content = self._last_content
+        if last_content is not None and last_content[0] is data:
+            return last_content[1]
+
+        content_hash = hashlib.sha1(data).hexdigest()
+        self._last_content = (data, content_hash)
+        return content_hash
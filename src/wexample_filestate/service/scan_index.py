@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_filestate.service.disk_persisted_registry import DiskPersistedRegistry
+
+if TYPE_CHECKING:
+    from wexample_filestate.const.types_state_items import TargetFileOrDirectoryType
+    from wexample_filestate.enum.scopes import Scope
+    from wexample_filestate.item.file.structured_content_file import (
+        StructuredContentFile,
+    )
+
+
+@base_class
+class ScanIndex(DiskPersistedRegistry[dict]):
+    """Items verified clean by a previous rectify run, keyed by relative path.
+
+    Each entry stores the disk signature (size, mtime_ns, inode, ctime_ns)
+    and a fingerprint of the item config, run scopes, operation filter and
+    package version. An item whose entry still matches can skip every option
+    check. Items are never skipped by subtree: a directory signature does not
+    change when a nested file is edited.
+    """
+
+    FILE_NAME: ClassVar[str] = "scan-index.json"
+
+    _context: str = private_field(
+        default="", description="Fingerprint of the run parameters"
+    )
+    _pending: dict[str, tuple[TargetFileOrDirectoryType, dict]] = private_field(
+        factory=dict,
+        description="Items found clean during this run, confirmed on commit()",
+    )
+
+    def __init__(
+        self,
+        container: Any = None,
+        file: StructuredContentFile | None = None,
+        context: str = "",
+    ) -> None:
+        super().__init__(container=container, file=file)
+        self._context = context
+        self._pending = {}
+
+    @classmethod
+    def create_for_root(
+        cls,
+        root: TargetFileOrDirectoryType,
+        scopes: set[Scope],
+        filter_operation: str | None = None,
+    ) -> ScanIndex:
+        from wexample_filestate.helpers.config_fingerprint import (
+            config_fingerprint,
+            config_fingerprint_version,
+        )
+        from wexample_filestate.item.file.json_file import JsonFile
+
+        path = root.get_path() / ".wex" / "tmp" / cls.FILE_NAME
+        index = cls(
+            container=root,
+            file=JsonFile.create_from_path(path=path),
+            context=config_fingerprint(
+                config_fingerprint_version(), scopes, filter_operation
+            ),
+        )
+        index.load()
+        return index
+
+    def build_entry(self, item: TargetFileOrDirectoryType) -> dict | None:
+        """Return the current entry of an item, or None if it cannot be indexed."""
+        from wexample_filestate.helpers.config_fingerprint import config_fingerprint
+        from wexample_filestate.option.children_option import ChildrenOption
+
+        stat = item.path_stat()
+        if stat is None:
+            return None
+
+        raw = item.get_value().raw
+        if isinstance(raw, dict):
+            # Children are indexed on their own; they never produce
+            # operations on the directory itself.
+            raw = {
+                key: value
+                for key, value in raw.items()
+                if key != ChildrenOption.get_name()
+            }
+
+        config = config_fingerprint(raw, type(item), self._context)
+        if config is None:
+            return None
+
+        return {
+            "config": config,
+            "signature": [
+                stat.st_size,
+                stat.st_mtime_ns,
+                stat.st_ino,
+                stat.st_ctime_ns,
+            ],
+        }
+
+    def commit(self) -> None:
+        """Record items found clean during the run, if still unchanged on disk."""
+        for key, (item, entry) in self._pending.items():
+            if self.build_entry(item) == entry:
+                self.register(entry, key=key)
+            else:
+                self._items.pop(key, None)
+        self._pending = {}
+
+    def forget(self, item: TargetFileOrDirectoryType) -> None:
+        key = self._get_item_key(item)
+        self._items.pop(key, None)
+        self._pending.pop(key, None)
+
+    def is_clean(self, item: TargetFileOrDirectoryType, entry: dict) -> bool:
+        return self._items.get(self._get_item_key(item)) == entry
+
+    def mark_clean(self, item: TargetFileOrDirectoryType, entry: dict) -> None:
+        self._pending[self._get_item_key(item)] = (item, entry)
+
+    def save(self) -> None:
+        self._file.get_path().parent.mkdir(parents=True, exist_ok=True)
+        super().save()
+
+    def _get_item_key(self, item: TargetFileOrDirectoryType) -> str:
+        return str(item.get_relative_path())
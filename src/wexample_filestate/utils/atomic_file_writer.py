@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_filestate.enum.fsync_policy import FsyncPolicy
+
+if TYPE_CHECKING:
+    from typing import IO
+
+    from wexample_helpers.const.types import PathOrString
+
+
+@base_class
+class AtomicFileWriter(BaseClass):
+    """Writes files to a temporary file renamed over the previous one.
+
+    Readers, and the disk after a crash, see either the old or the new
+    content, never a truncated one. The fsync policy decides when the data is
+    made durable, see FsyncPolicy; without sync, a crash may still lose the
+    latest writes, depending on the filesystem.
+
+    The rename gives the file a new inode: the previous mode and owner are
+    kept and symlinks are followed, but hard links to the file keep the
+    previous content. Files that cannot be replaced, because their directory
+    is read-only or because their owner cannot be kept, are written in place.
+    """
+
+    fsync_policy: FsyncPolicy = public_field(
+        default=FsyncPolicy.NONE,
+        description="When the written files are synced to the disk",
+    )
+    _pending_directories: set[str] = private_field(
+        factory=set,
+        description="Directories of the files renamed since the last flush, "
+        "with the batch policy",
+    )
+
+    def flush(self) -> None:
+        """Sync the directories of the files renamed since the last flush.
+
+        Only needed with the batch policy: files are synced before their
+        rename, each directory is synced once here.
+        """
+        directories = self._pending_directories
+        self._pending_directories = set()
+
+        for directory in sorted(directories):
+            self._fsync_directory(directory)
+
+    def write(self, path: PathOrString, content: str, encoding: str = "utf-8") -> None:
+        import stat
+
+        from wexample_file.exception.not_a_file_exception import NotAFileException
+
+        path = os.path.realpath(path)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        try:
+            existing = os.stat(path)
+        except FileNotFoundError:
+            existing = None
+        if existing is not None and stat.S_ISDIR(existing.st_mode):
+            raise NotAFileException(path=path)
+
+        try:
+            # New files get the default mode, the umask applies as for open().
+            fd, temp_path = self._create_temporary_file(
+                path, stat.S_IMODE(existing.st_mode) if existing else 0o666
+            )
+        except PermissionError:
+            if existing is None:
+                raise
+            # The directory is read-only, the file itself may not be.
+            self._write_in_place(path, content, encoding)
+            return
+
+        try:
+            if existing is not None:
+                os.chmod(temp_path, stat.S_IMODE(existing.st_mode))
+                if not self._copy_owner(temp_path, existing):
+                    # Replacing the file would take it from its owner.
+                    os.close(fd)
+                    fd = None
+                    os.unlink(temp_path)
+                    self._write_in_place(path, content, encoding)
+                    return
+
+            with open(fd, "w", encoding=encoding) as file:
+                fd = None
+                file.write(content)
+                self._fsync_file(file)
+
+            os.replace(temp_path, path)
+        except BaseException:
+            if fd is not None:
+                os.close(fd)
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+        if self.fsync_policy is FsyncPolicy.FILE:
+            self._fsync_directory(directory)
+        elif self.fsync_policy is FsyncPolicy.BATCH:
+            self._pending_directories.add(directory)
+
+    def _fsync_file(self, file: IO[str]) -> None:
+        if self.fsync_policy is not FsyncPolicy.NONE:
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _write_in_place(self, path: str, content: str, encoding: str) -> None:
+        # Not atomic, but keeps the inode, and so the owner, of the file.
+        with open(path, "w", encoding=encoding) as file:
+            file.write(content)
+            self._fsync_file(file)
+
+    @staticmethod
+    def _copy_owner(path: str, existing: os.stat_result) -> bool:
+        """Give path the owner of the existing file; False if not allowed."""
+        if not hasattr(os, "chown"):
+            return True
+        if existing.st_uid == os.geteuid() and existing.st_gid == os.getegid():
+            return True
+
+        try:
+            os.chown(path, existing.st_uid, existing.st_gid)
+        except PermissionError:
+            # Only privileged users can give files away.
+            return False
+        return True
+
+    @staticmethod
+    def _create_temporary_file(path: str, mode: int) -> tuple[int, str]:
+        """Create a new file next to path, open for writing."""
+        import secrets
+
+        prefix = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        while True:
+            temp_path = f"{prefix}{secrets.token_hex(4)}.tmp"
+            try:
+                return os.open(temp_path, flags, mode), temp_path
+            except FileExistsError:
+                continue
+
+    @staticmethod
+    def _fsync_directory(directory: str) -> None:
+        # Directories cannot be opened, nor need to be synced, on Windows.
+        if os.name == "nt":
+            return
+
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
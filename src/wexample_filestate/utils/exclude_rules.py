@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+import re
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@base_class
+class ExcludeRules(BaseClass):
+    """Gitignore-style exclusion rules used to prune directory scans.
+
+    Supported syntax: comments, ``!`` negation, trailing ``/`` for
+    directories only, patterns anchored to their base directory when they
+    contain a ``/``, and ``*``, ``?``, ``[...]`` and ``**`` wildcards. Rules
+    are evaluated in order and the last matching one wins; rules read from
+    deeper ignore files come last.
+    """
+
+    _rules: list[tuple[str, bool, bool, re.Pattern]] = private_field(
+        factory=list,
+        description="Base directory, negated, directory only and compiled "
+        "regex of each rule",
+    )
+
+    @classmethod
+    def create_from_patterns(
+        cls, patterns: list[str] | None, base_path: Path
+    ) -> ExcludeRules:
+        rules = cls()
+        rules._add_patterns(patterns or [], base_path)
+        return rules
+
+    def is_empty(self) -> bool:
+        return not self._rules
+
+    def is_excluded(self, path: Path, is_dir: bool) -> bool:
+        path_str = os.fspath(path)
+        excluded = False
+
+        for base, negated, directory_only, regex in self._rules:
+            if directory_only and not is_dir:
+                continue
+            if not path_str.startswith(base):
+                continue
+
+            relative = path_str[len(base) :]
+            if os.sep != "/":
+                relative = relative.replace(os.sep, "/")
+            if regex.match(relative):
+                excluded = not negated
+
+        return excluded
+
+    def with_ignore_file(self, ignore_file_path: Path) -> ExcludeRules:
+        """Return new rules extended with the patterns of an ignore file."""
+        try:
+            with open(ignore_file_path, encoding="utf-8") as ignore_file:
+                patterns = ignore_file.read().splitlines()
+        except OSError:
+            return self
+
+        rules = ExcludeRules()
+        rules._rules = list(self._rules)
+        rules._add_patterns(patterns, ignore_file_path.parent)
+        return rules
+
+    def _add_patterns(self, patterns: list[str], base_path: Path) -> None:
+        base = os.fspath(base_path).rstrip(os.sep) + os.sep
+
+        for line in patterns:
+            pattern = line.strip()
+            if not pattern or pattern.startswith("#"):
+                continue
+
+            negated = pattern.startswith("!")
+            if negated:
+                pattern = pattern[1:]
+
+            directory_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+            if not pattern:
+                continue
+
+            # A slash other than a trailing one anchors the pattern to its base.
+            anchored = "/" in pattern
+            pattern = pattern.lstrip("/")
+
+            prefix = "" if anchored else "(?:.*/)?"
+            regex = re.compile(f"{prefix}{self._translate(pattern)}\\Z", re.DOTALL)
+            self._rules.append((base, negated, directory_only, regex))
+
+    @staticmethod
+    def _translate(pattern: str) -> str:
+        output = []
+        position = 0
+        while position < len(pattern):
+            if pattern.startswith("**/", position):
+                output.append("(?:.*/)?")
+                position += 3
+            elif pattern.startswith("**", position):
+                output.append(".*")
+                position += 2
+            elif pattern[position] == "*":
+                output.append("[^/]*")
+                position += 1
+            elif pattern[position] == "?":
+                output.append("[^/]")
+                position += 1
+            elif pattern[position] == "[":
+                end = pattern.find("]", position + 2)
+                if end == -1:
+                    output.append(re.escape("["))
+                    position += 1
+                else:
+                    content = pattern[position + 1 : end]
+                    if content.startswith("!"):
+                        content = "^" + content[1:]
+                    output.append(f"[{content}]")
+                    position = end + 1
+            elif pattern[position] == "\\" and position + 1 < len(pattern):
+                output.append(re.escape(pattern[position + 1]))
+                position += 2
+            else:
+                output.append(re.escape(pattern[position]))
+                position += 1
+        return "".join(output)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from wexample_config.const.types import DictConfig
+
+
+class GeneratedChildSpec:
+    """Compact placeholder of a child generated by a children manipulation option.
+
+    Pattern generated directories may hold a very large number of entries, so
+    this is a plain slotted class rather than a BaseClass. The pattern config
+    is a template shared by every entry of the pattern, and never mutated;
+    per entry values (name, type) live in a small overrides dict. The full
+    config is only built when the child is promoted to an item, see
+    LazyChildrenList.
+    """
+
+    __slots__ = ("config", "overrides", "path")
+
+    def __init__(
+        self,
+        path: Path,
+        config: DictConfig,
+        overrides: dict[str, Any] | None = None,
+    ) -> None:
+        self.config = config
+        self.overrides = overrides
+        self.path = path
+
+    def build_config(self) -> DictConfig:
+        from wexample_filestate.helpers.config_helper import config_clone
+
+        config = config_clone(self.config)
+        if self.overrides:
+            config.update(self.overrides)
+        if config.get("name", None) is None:
+            config["name"] = self.path.name
+        self._resolve_nested_specs(config)
+        return config
+
+    def get_item_name(self) -> str | None:
+        """Return the name of the future item, or None if only the item knows it."""
+        name = (self.overrides or {}).get("name", self.config.get("name", None))
+        if name is None:
+            return self.path.name
+        return name if isinstance(name, str) else None
+
+    @staticmethod
+    def _resolve_nested_specs(config: DictConfig) -> None:
+        """Replace the specs of a generated directory tree by their configs.
+
+        Specs only live in children lists; item configs hold plain dicts.
+        """
+        children = config.get("children")
+        if not isinstance(children, list):
+            return
+
+        for position, child in enumerate(children):
+            if isinstance(child, GeneratedChildSpec):
+                children[position] = child.build_config()
+            elif isinstance(child, dict):
+                GeneratedChildSpec._resolve_nested_specs(child)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from wexample_filestate.item.abstract_item_target import AbstractItemTarget
+    from wexample_filestate.item.item_target_directory import ItemTargetDirectory
+
+
+@base_class
+class ItemIndex(BaseClass):
+    """Lookup tables over the materialized items of a tree.
+
+    Items are registered as directories materialize their children and as
+    generated children are promoted, so the index only knows about the part
+    of the tree built so far. It is dropped
+    and rebuilt when names or paths change (see _invalidate_path_cache).
+    """
+
+    _by_name: dict[str, list[AbstractItemTarget]] = private_field(
+        factory=dict, description="Items grouped by item name"
+    )
+    _by_path: dict[Path, AbstractItemTarget] = private_field(
+        factory=dict, description="Items by absolute path"
+    )
+    _by_type: dict[type, list[AbstractItemTarget]] = private_field(
+        factory=dict, description="Items grouped by their exact class"
+    )
+    _indexed: set[int] = private_field(
+        factory=set, description="Ids of registered items, to avoid duplicates"
+    )
+
+    @classmethod
+    def create_for_root(cls, root: ItemTargetDirectory) -> ItemIndex:
+        """Index every item already materialized under root."""
+        from wexample_filestate.item.item_target_directory import ItemTargetDirectory
+
+        index = cls()
+
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            if not directory.is_tree_built():
+                continue
+            children = cls._get_promoted_children(directory)
+            for child in children:
+                index.add_item(child)
+            stack.extend(
+                child for child in children if isinstance(child, ItemTargetDirectory)
+            )
+        return index
+
+    def add_children(self, directory: ItemTargetDirectory) -> None:
+        for child in self._get_promoted_children(directory):
+            self.add_item(child)
+
+    def add_item(self, item: AbstractItemTarget) -> None:
+        if id(item) in self._indexed:
+            return
+        self._indexed.add(id(item))
+
+        self._by_name.setdefault(item.get_item_name(), []).append(item)
+        self._by_type.setdefault(type(item), []).append(item)
+        self._by_path.setdefault(item.get_path(), item)
+
+    def get_by_name(self, name: str) -> list[AbstractItemTarget]:
+        return self._by_name.get(name, [])
+
+    def get_by_path(self, path: Path) -> AbstractItemTarget | None:
+        return self._by_path.get(path)
+
+    def get_by_type(self, class_type: type) -> list[AbstractItemTarget]:
+        """Return the items that are instances of class_type, subclasses included."""
+        items = []
+        for item_type, typed_items in self._by_type.items():
+            if issubclass(item_type, class_type):
+                items.extend(typed_items)
+        return items
+
+    @staticmethod
+    def _get_promoted_children(
+        directory: ItemTargetDirectory,
+    ) -> list[AbstractItemTarget]:
+        # Generated children are neither pulled nor promoted just to be indexed.
+        from wexample_filestate.utils.lazy_children_list import LazyChildrenList
+
+        children = directory.get_children_list()
+        if isinstance(children, LazyChildrenList):
+            return list(children.iter_promoted())
+        return list(children)
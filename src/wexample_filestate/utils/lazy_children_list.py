@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import operator
+import threading
+from typing import TYPE_CHECKING, Any
+
+from wexample_filestate.utils.generated_child_spec import GeneratedChildSpec
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from wexample_filestate.const.types_state_items import TargetFileOrDirectoryType
+    from wexample_filestate.option.children_option import ChildrenOption
+
+
+class LazyChildrenList(list):
+    """Children list filled from generators and promoted on access.
+
+    Entries come from sources (generators of children manipulation options,
+    or single items) consumed in order, only as far as callers read: a
+    lookup or a limited iteration stops pulling once it is done. Pulled
+    entries may be GeneratedChildSpec placeholders; indexing and iteration
+    promote the ones they return to full items of the owner option and keep
+    them in place, so callers only ever see items. Asking for the length,
+    a negative index or the names of all entries consumes every source.
+
+    The other list methods follow the same rule: searches pull and promote
+    entries until they are done, appended entries are queued after the
+    sources, and every change is reported to the owner directory. Comparisons,
+    repetition and repr work on the promoted items, as copy() returns them.
+    """
+
+    def __init__(self, owner: ChildrenOption) -> None:
+        super().__init__()
+        self.owner = owner
+        self._lock = threading.RLock()
+        self._sources: list[Iterator[Any]] = []
+
+    def __add__(self, other: Iterable[Any]) -> list[TargetFileOrDirectoryType]:
+        return self.copy() + list(other)
+
+    def __bool__(self) -> bool:
+        return self._fill(1)
+
+    def __contains__(self, value: object) -> bool:
+        return any(entry is value or entry == value for entry in self)
+
+    def __delitem__(self, index: Any) -> None:
+        with self._lock:
+            self._fill_for(index)
+            list.__delitem__(self, index)
+        self._notify_change()
+
+    def __eq__(self, other: object) -> bool:
+        return self._compare(other, operator.eq)
+
+    def __ge__(self, other: object) -> bool:
+        return self._compare(other, operator.ge)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            self._fill_all()
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        with self._lock:
+            self._fill_for(index)
+
+            entry = list.__getitem__(self, index)
+            if isinstance(entry, GeneratedChildSpec):
+                entry = self.owner.create_child_item(child_config=entry.build_config())
+                list.__setitem__(self, index, entry)
+                self._register_items([entry])
+            return entry
+
+    def __gt__(self, other: object) -> bool:
+        return self._compare(other, operator.gt)
+
+    def __iadd__(self, other: Iterable[Any]) -> LazyChildrenList:
+        self.extend(other)
+        return self
+
+    def __imul__(self, times: int) -> LazyChildrenList:
+        with self._lock:
+            self._promote_all()
+            list.__imul__(self, times)
+        self._notify_change()
+        return self
+
+    def __iter__(self) -> Iterator[TargetFileOrDirectoryType]:
+        position = 0
+        while self._fill(position + 1):
+            yield self[position]
+            position += 1
+
+    def __le__(self, other: object) -> bool:
+        return self._compare(other, operator.le)
+
+    def __len__(self) -> int:
+        self._fill_all()
+        return list.__len__(self)
+
+    def __lt__(self, other: object) -> bool:
+        return self._compare(other, operator.lt)
+
+    def __mul__(self, times: int) -> list[TargetFileOrDirectoryType]:
+        return self.copy() * times
+
+    def __ne__(self, other: object) -> bool:
+        return self._compare(other, operator.ne)
+
+    def __radd__(self, other: Iterable[Any]) -> list[TargetFileOrDirectoryType]:
+        # Called before list.__add__, which would read the pulled entries as is.
+        return list(other) + self.copy()
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+    def __reversed__(self) -> Iterator[TargetFileOrDirectoryType]:
+        for position in range(len(self) - 1, -1, -1):
+            yield self[position]
+
+    def __rmul__(self, times: int) -> list[TargetFileOrDirectoryType]:
+        return times * self.copy()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        with self._lock:
+            self._fill_for(index)
+            list.__setitem__(self, index, value)
+        self._notify_change()
+
+    def add_source(self, entries: Iterable[Any]) -> None:
+        """Queue entries (items or specs) to be pulled after the current ones."""
+        self._sources.append(iter(entries))
+        self._notify_change()
+
+    def append(self, value: Any) -> None:
+        self.add_source([value])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sources.clear()
+            list.clear(self)
+        self._notify_change()
+
+    def copy(self) -> list[TargetFileOrDirectoryType]:
+        return list(self)
+
+    def count(self, value: Any) -> int:
+        return sum(1 for entry in self if entry is value or entry == value)
+
+    def count_promoted(self) -> int:
+        return sum(1 for _ in self.iter_promoted())
+
+    def count_pulled(self) -> int:
+        """Return how many entries were pulled from the sources so far."""
+        return list.__len__(self)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        self.add_source(list(values))
+
+    def find_position(self, item_name: str) -> int | None:
+        """Return the position of the first entry named item_name.
+
+        Sources are only consumed until the entry is found.
+        """
+        position = 0
+        while self._fill(position + 1):
+            if self._get_entry_name(position) == item_name:
+                return position
+            position += 1
+        return None
+
+    def get_item_names(self) -> list[str]:
+        self._fill_all()
+        return [self._get_entry_name(position) for position in range(len(self))]
+
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        if start < 0 or (stop is not None and stop < 0):
+            self._fill_all()
+            start, stop, _ = slice(start, stop).indices(list.__len__(self))
+
+        position = start
+        while (stop is None or position < stop) and self._fill(position + 1):
+            entry = self[position]
+            if entry is value or entry == value:
+                return position
+            position += 1
+        raise ValueError(f"{value!r} is not in list")
+
+    def insert(self, index: int, value: Any) -> None:
+        with self._lock:
+            if index < 0:
+                self._fill_all()
+            else:
+                self._fill(index)
+            list.insert(self, index, value)
+        self._notify_change()
+
+    def is_complete(self) -> bool:
+        return not self._sources
+
+    def iter_promoted(self) -> Iterator[TargetFileOrDirectoryType]:
+        """Yield the items pulled so far, without pulling or promoting entries."""
+        for position in range(list.__len__(self)):
+            entry = list.__getitem__(self, position)
+            if not isinstance(entry, GeneratedChildSpec):
+                yield entry
+
+    def pop(self, index: int = -1) -> TargetFileOrDirectoryType:
+        with self._lock:
+            entry = self[index]
+            list.__delitem__(self, index)
+        self._notify_change()
+        return entry
+
+    def remove(self, value: Any) -> None:
+        del self[self.index(value)]
+
+    def reverse(self) -> None:
+        with self._lock:
+            self._fill_all()
+            list.reverse(self)
+        self._notify_change()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        with self._lock:
+            self._promote_all()
+            list.sort(self, *args, **kwargs)
+        self._notify_change()
+
+    def _compare(self, other: object, compare: Callable[[Any, Any], bool]) -> bool:
+        if not isinstance(other, list):
+            return NotImplemented
+        # Lists of the same class are promoted too, plain ones are read as is.
+        return compare(self.copy(), list(other))
+
+    def _fill(self, size: int) -> bool:
+        """Pull entries until the list holds size of them; False if it cannot."""
+        with self._lock:
+            while list.__len__(self) < size and self._sources:
+                try:
+                    entry = next(self._sources[0])
+                except StopIteration:
+                    self._sources.pop(0)
+                    continue
+                list.append(self, entry)
+                if not isinstance(entry, GeneratedChildSpec):
+                    self._register_items([entry])
+            return list.__len__(self) >= size
+
+    def _fill_all(self) -> None:
+        with self._lock:
+            while self._sources:
+                start = list.__len__(self)
+                try:
+                    list.extend(self, self._sources[0])
+                finally:
+                    self._register_items(
+                        entry
+                        for entry in list.__getitem__(self, slice(start, None))
+                        if not isinstance(entry, GeneratedChildSpec)
+                    )
+                # Only dropped once read: a failing source keeps its position.
+                self._sources.pop(0)
+
+    def _fill_for(self, index: Any) -> None:
+        """Pull the entries needed to resolve index, or all of them for slices."""
+        if isinstance(index, slice) or index < 0:
+            self._fill_all()
+        else:
+            self._fill(index + 1)
+
+    def _get_entry_name(self, position: int) -> str:
+        entry = list.__getitem__(self, position)
+        name = entry.get_item_name()
+        if name is None:
+            # Only the item knows its name.
+            name = self[position].get_item_name()
+        return name
+
+    def _notify_change(self) -> None:
+        # Lists still being filled by create_children_items have no lookups yet.
+        if self.owner.children is self:
+            self.owner.get_parent_item()._invalidate_lookups()
+
+    def _promote_all(self) -> None:
+        with self._lock:
+            self._fill_all()
+            for position in range(list.__len__(self)):
+                self[position]
+
+    def _register_items(self, items: Iterable[TargetFileOrDirectoryType]) -> None:
+        # Keep the root index, if any, in sync with the items made available.
+        index = self.owner.get_parent_item()._get_built_item_index()
+        if index is not None:
+            for item in items:
+                index.add_item(item)
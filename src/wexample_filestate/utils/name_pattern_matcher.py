@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_REGEX_SPECIAL_CHARACTERS = frozenset(".^$*+?{}[]|()")
+
+
+@base_class
+class NamePatternMatcher(BaseClass):
+    """Match names against a list of regexes, all of which must match.
+
+    Patterns follow ``re.match`` semantics (anchored at the start of the
+    name). They are compiled once; plain literal patterns are turned into
+    string checks (prefix, suffix or equality), and the remaining ones are
+    combined into a single regex made of lookaheads.
+    """
+
+    patterns: list[str] = public_field(
+        description="Regex patterns that every matching name must satisfy"
+    )
+    _checks: list[Callable[[str], bool]] = private_field(
+        factory=list, description="Compiled checks, all must pass"
+    )
+    _regexes: list[re.Pattern] = private_field(
+        factory=list, description="Every pattern compiled as is"
+    )
+
+    def __attrs_post_init__(self) -> None:
+        self._regexes = [re.compile(pattern) for pattern in self.patterns]
+
+        remaining = []
+        for pattern, regex in zip(self.patterns, self._regexes):
+            check = self._create_literal_check(pattern)
+            if check is None:
+                remaining.append((pattern, regex))
+            else:
+                self._checks.append(check)
+
+        if len(remaining) == 1:
+            self._checks.append(remaining[0][1].match)
+        elif remaining:
+            try:
+                combined = re.compile(
+                    "".join(f"(?=(?:{pattern}))" for pattern, _ in remaining)
+                )
+            except re.error:
+                # Inline global flags are only allowed at the start of a regex.
+                self._checks.extend(regex.match for _, regex in remaining)
+            else:
+                self._checks.append(combined.match)
+
+    @classmethod
+    def create_from_option_value(
+        cls, name_pattern: str | list[str] | None
+    ) -> NamePatternMatcher | None:
+        if name_pattern is None:
+            return None
+        if isinstance(name_pattern, str):
+            name_pattern = [name_pattern]
+        return cls(patterns=list(name_pattern))
+
+    def matches(self, name: str) -> bool:
+        if "\n" in name:
+            # "." and "$" treat newlines specially, leave such names to re.
+            return all(regex.match(name) for regex in self._regexes)
+
+        for check in self._checks:
+            if not check(name):
+                return False
+        return True
+
+    @staticmethod
+    def _create_literal_check(pattern: str) -> Callable[[str], bool] | None:
+        body = pattern[1:] if pattern.startswith("^") else pattern
+        suffix_only = body.startswith(".*")
+        if suffix_only:
+            body = body[2:]
+        end_anchored = body.endswith("$") and not body.endswith("\\$")
+        if end_anchored:
+            body = body[:-1]
+
+        literal = NamePatternMatcher._parse_literal(body)
+        if literal is None or (suffix_only and not end_anchored):
+            return None
+
+        if suffix_only:
+            return lambda name: name.endswith(literal)
+        if end_anchored:
+            return lambda name: name == literal
+        return lambda name: name.startswith(literal)
+
+    @staticmethod
+    def _parse_literal(body: str) -> str | None:
+        """Return the text matched by a regex without special constructs."""
+        characters = []
+        position = 0
+        while position < len(body):
+            character = body[position]
+            if character == "\\":
+                if position + 1 >= len(body) or body[position + 1].isalnum():
+                    # Classes like \d, \w or back references are not literals.
+                    return None
+                characters.append(body[position + 1])
+                position += 2
+                continue
+            if character in _REGEX_SPECIAL_CHARACTERS:
+                return None
+            characters.append(character)
+            position += 1
+        return "".join(characters)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import os
+import re
+from typing import Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+# Marks trie nodes where an absolute filter path ends.
+_TERMINAL = "\0"
+
+
+@base_class
+class PathFilter(BaseClass):
+    """Compiled form of the filter_paths given to apply() and dry_run().
+
+    Absolute filter paths match themselves and everything below them; they
+    are stored in a trie of path parts, which also tells whether a directory
+    may contain a match at all. Relative filter paths are globs matched
+    anywhere in the path (``*pattern*``), combined into a single regex; as
+    any directory may contain such a match, they disable pruning.
+    """
+
+    patterns: list[str] = public_field(description="The filter paths as given")
+    _regex: re.Pattern | None = private_field(
+        default=None, description="Combined regex of the relative filter paths"
+    )
+    _trie: dict[str, Any] = private_field(
+        factory=dict, description="Path parts trie of the absolute filter paths"
+    )
+
+    def __attrs_post_init__(self) -> None:
+        import fnmatch
+
+        globs = []
+        for pattern in self.patterns:
+            if os.path.isabs(pattern):
+                node = self._trie
+                for part in self._split(pattern):
+                    node = node.setdefault(part, {})
+                node[_TERMINAL] = {}
+            else:
+                if not pattern.startswith("*"):
+                    pattern = "*" + pattern
+                if not pattern.endswith("*"):
+                    pattern = pattern + "*"
+                globs.append(fnmatch.translate(os.path.normcase(pattern)))
+
+        if globs:
+            self._regex = re.compile("|".join(f"(?:{glob})" for glob in globs))
+
+    def matches(self, path: str) -> bool:
+        if self._regex is not None and self._regex.match(os.path.normcase(path)):
+            return True
+
+        node = self._trie
+        for part in self._split(path):
+            if _TERMINAL in node:
+                return True
+            node = node.get(part)
+            if node is None:
+                return False
+        return _TERMINAL in node
+
+    def may_match_below(self, directory: str) -> bool:
+        """Return False if no path below directory can match the filter."""
+        if self._regex is not None:
+            return True
+
+        node = self._trie
+        for part in self._split(directory):
+            if _TERMINAL in node:
+                return True
+            node = node.get(part)
+            if node is None:
+                return False
+        # Either the directory is filtered itself or filter paths go deeper.
+        return bool(node)
+
+    @staticmethod
+    def _split(path: str) -> list[str]:
+        return os.path.normpath(path).split(os.sep)
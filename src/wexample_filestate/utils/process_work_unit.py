@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_filestate.enum.scopes import Scope
+
+
+@base_class
+class ProcessWorkUnit(BaseClass):
+    """Picklable check of one item, evaluated in a worker process.
+
+    The worker rebuilds a standalone item from its class, path and raw config,
+    so only items whose options all are process pool safe may be sent. Only
+    FileWriteOperation results travel back, as plain data; any other
+    operation asks the parent process to run the check itself.
+    """
+
+    config: dict[str, Any] = public_field(description="Raw config of the item")
+    converge: bool = public_field(
+        default=False, description="Whether content options are chained"
+    )
+    filter_operation: str | None = public_field(
+        default=None, description="Operation filter of the run"
+    )
+    item_class: type = public_field(description="Class of the item to rebuild")
+    path: str = public_field(description="Absolute path of the item")
+    scopes: set[Scope] = public_field(description="Scopes of the run")
+
+    def run(self) -> dict[str, Any] | None:
+        """Return None if the item is clean, or the payload of its operation.
+
+        The payload holds either ``fallback`` or the ``option_path``,
+        ``content`` and ``description`` of the FileWriteOperation to create.
+        """
+        from wexample_filestate.operation.file_write_operation import FileWriteOperation
+
+        item = self.item_class.create_from_path(path=self.path, config=self.config)
+        with item._converge_scope(self.converge):
+            operation = item._evaluate_options(self.scopes, self.filter_operation)
+        if operation is None:
+            return None
+
+        if type(operation) is not FileWriteOperation:
+            return {"fallback": True}
+
+        return {
+            "content": operation.content,
+            "description": operation.description,
+            "option_path": item.get_option_key_path(operation.option),
+        }
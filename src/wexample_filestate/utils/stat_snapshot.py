@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_helpers.const.types import PathOrString
+
+
+@base_class
+class StatSnapshot(BaseClass):
+    """Per-run cache of filesystem metadata, shared by every item of a tree.
+
+    Each directory is listed once with ``os.scandir``; existence and type
+    checks are then answered from the ``DirEntry`` objects (no extra syscall
+    on most filesystems), and ``stat()`` results are memoized by the entries
+    themselves. Operations that touch the disk must call :meth:`invalidate`
+    with the paths they changed, so the next lookup lists the directory again.
+    """
+
+    _listed_subdirectories: dict[str, set[str]] = private_field(
+        factory=dict,
+        description="Listed directories grouped by their parent directory, "
+        "so invalidating a directory also drops its descendants' listings.",
+    )
+    _listings: dict[str, dict[str, os.DirEntry] | None] = private_field(
+        factory=dict,
+        description="Directory listings keyed by directory path; None when "
+        "the directory does not exist or cannot be listed.",
+    )
+
+    def exists(self, path: PathOrString) -> bool:
+        entry = self._get_entry(path)
+        if entry is None or entry.is_symlink():
+            # Path.exists() follows links: a dangling link does not exist;
+            # the filesystem root has no parent listing and is stat'ed.
+            return self.stat(path) is not None
+        return True
+
+    def invalidate(self, path: PathOrString) -> None:
+        """Drop every cached listing that may describe ``path``.
+
+        The parent listing is dropped, as well as the listings of ``path``
+        itself and of its descendants when it was a listed directory.
+        """
+        path_str = os.fspath(path)
+        self._listings.pop(os.path.dirname(path_str), None)
+
+        stack = [path_str]
+        while stack:
+            directory = stack.pop()
+            self._listings.pop(directory, None)
+            stack.extend(self._listed_subdirectories.pop(directory, ()))
+
+    def is_dir(self, path: PathOrString) -> bool:
+        entry = self._get_entry(path)
+        if entry is None:
+            return self.stat(path) is not None
+        return self._entry_call(entry.is_dir)
+
+    def is_file(self, path: PathOrString) -> bool:
+        entry = self._get_entry(path)
+        return entry is not None and self._entry_call(entry.is_file)
+
+    def is_symlink(self, path: PathOrString) -> bool:
+        entry = self._get_entry(path)
+        return entry is not None and entry.is_symlink()
+
+    def list_dir(self, path: PathOrString) -> list[os.DirEntry]:
+        """Return the cached ``DirEntry`` list of a directory (empty if missing)."""
+        listing = self._get_listing(os.fspath(path))
+        return list(listing.values()) if listing else []
+
+    def stat(self, path: PathOrString) -> os.stat_result | None:
+        """Return the stat result following symlinks, or None if missing."""
+        entry = self._get_entry(path)
+        try:
+            if entry is None:
+                if os.path.basename(os.fspath(path)):
+                    return None
+                # Filesystem root: no parent listing can describe it.
+                return os.stat(path)
+            return entry.stat()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _entry_call(method) -> bool:
+        try:
+            return method()
+        except OSError:
+            return False
+
+    def _get_entry(self, path: PathOrString) -> os.DirEntry | None:
+        path_str = os.fspath(path)
+        directory, name = os.path.split(path_str)
+        if not name:
+            # Filesystem root or trailing separator, nothing to list from.
+            return None
+
+        listing = self._get_listing(directory)
+        if listing is None:
+            return None
+        return listing.get(name)
+
+    def _get_listing(self, directory: str) -> dict[str, os.DirEntry] | None:
+        try:
+            return self._listings[directory]
+        except KeyError:
+            pass
+
+        try:
+            with os.scandir(directory or os.curdir) as iterator:
+                listing = {entry.name: entry for entry in iterator}
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            listing = None
+
+        self._listings[directory] = listing
+        self._listed_subdirectories.setdefault(os.path.dirname(directory), set()).add(
+            directory
+        )
+        return listing
@@ -28,3 +28,29 @@ def test_read_dir_config_returns_empty_on_invalid_yaml(tmp_path: Path) -> None:
 
     (tmp_path / ".wex.yml").write_text("key: : : invalid")
     assert read_dir_config(tmp_path) == {}
+
+
+def test_read_dir_config_caches_unchanged_files(tmp_path: Path) -> None:
+    import os
+
+    from wexample_filestate.helpers.dir_config import (
+        read_dir_config,
+        read_dir_config_cache_clear,
+        read_dir_config_cache_stats,
+    )
+
+    read_dir_config_cache_clear()
+    config_path = tmp_path / ".wex.yml"
+    config_path.write_text("filestate:\n  python_init: false\n")
+
+    first = read_dir_config(tmp_path)
+    first["filestate"]["python_init"] = True
+    assert read_dir_config(tmp_path) == {"filestate": {"python_init": False}}
+    assert read_dir_config_cache_stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    # Any change of mtime or size parses the file again.
+    config_path.write_text("filestate:\n  python_init: true\n")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert read_dir_config(tmp_path) == {"filestate": {"python_init": True}}
+    assert read_dir_config_cache_stats()["misses"] == 2
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+
+def test_writes_never_reach_the_source() -> None:
+    from wexample_filestate.config_value.copy_on_write_config_value import (
+        CopyOnWriteConfigValue,
+    )
+
+    parsed = {
+        "project": {"name": "app", "tags": ["a", "b"]},
+        "other": {"large": list(range(5))},
+    }
+    config = CopyOnWriteConfigValue(raw=parsed)
+
+    assert config.search("project.name").get_str() == "app"
+    assert config.search("project.tags.1").get_str() == "b"
+    # Children are wrapped, over their own copy of the containers.
+    assert config.raw["other"].raw is not parsed["other"]
+    assert config.raw["other"].raw["large"].raw is not parsed["other"]["large"]
+
+    config.set_by_path("project.name", "renamed")
+    config.set_by_path("project.extra.key", "value")
+    config.update_nested({"other": {"added": True}})
+
+    assert parsed == {
+        "project": {"name": "app", "tags": ["a", "b"]},
+        "other": {"large": list(range(5))},
+    }
+    assert config.to_dict() == {
+        "project": {
+            "name": "renamed",
+            "tags": ["a", "b"],
+            "extra": {"key": "value"},
+        },
+        "other": {"large": list(range(5)), "added": True},
+    }
+
+
+def test_read_config_keeps_parsed_cache(tmp_path) -> None:
+    from wexample_filestate.item.file.json_file import JsonFile
+
+    path = tmp_path / "data.json"
+    path.write_text('{"project": {"name": "app"}}')
+    json_file = JsonFile.create_from_path(path=path)
+
+    config = json_file.read_config()
+    config.set_by_path("project.name", "renamed")
+
+    assert json_file.read_parsed() == {"project": {"name": "app"}}
+    assert json_file.read_config().search("project.name").get_str() == "renamed"
+
+
+def test_read_config_accessors_keep_parsed_cache(tmp_path) -> None:
+    from wexample_config.config_value.config_value import ConfigValue
+
+    from wexample_filestate.item.file.json_file import JsonFile
+
+    path = tmp_path / "data.json"
+    path.write_text('{"a": {"b": 1}, "l": [1, 2]}')
+    json_file = JsonFile.create_from_path(path=path)
+
+    children = json_file.read_config().get_dict()
+    assert all(isinstance(child, ConfigValue) for child in children.values())
+    assert children["a"].get_dict()["b"].get_int() == 1
+
+    children["a"].get_dict()["b"] = 99
+    children["l"].get_list().append(3)
+    children["new"] = 1
+
+    assert json_file.read_parsed() == {"a": {"b": 1}, "l": [1, 2]}
@@ -34,6 +34,36 @@ class TestYamlFile(AbstractStructuredFileTest):
         assert "name: test-app" in yaml_content, "Should contain key-value pairs"
         assert "- item1" in yaml_content, "Should format lists with dashes"
 
+    def test_yaml_engine_per_thread(self) -> None:
+        """Test the round-trip engine is built once per thread and reused."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from wexample_filestate.item.file.yaml_file import YamlFile
+
+        engine = YamlFile._get_yaml()
+        assert YamlFile._get_yaml() is engine
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(YamlFile._get_yaml).result()
+        assert other is not engine
+
+        # Reusing the engine keeps round-trip behavior across calls.
+        text = "# comment\nname: 'quoted'\nitems:\n  - a\n"
+        yaml_file = YamlFile.create_from_path(path="sample.yml")
+        assert yaml_file.dumps(yaml_file.loads(text)) == text
+        assert yaml_file.dumps(yaml_file.loads(text)) == text
+
+    def test_yaml_loads_read_only(self) -> None:
+        """Test the read-only fast path parses plain data and rejects custom tags."""
+        import pytest
+        import yaml
+
+        from wexample_filestate.item.file.yaml_file import YamlFile
+
+        assert YamlFile.loads_read_only("a:\n  b: [1, 2]\n") == {"a": {"b": [1, 2]}}
+        with pytest.raises(yaml.YAMLError):
+            YamlFile.loads_read_only("a: !reference [b]\n")
+
     def _get_expected_extension(self) -> str:
         """Get the expected file extension."""
         return "yml"
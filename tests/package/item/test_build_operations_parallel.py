@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_filestate.testing.abstract_state_manager_test import (
+    AbstractStateManagerTest,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestBuildOperationsParallel(AbstractStateManagerTest):
+    def test_dry_run_matches_sequential_order(self, tmp_path) -> None:
+        self._setup_tree(tmp_path)
+
+        sequential = self._dry_run_paths()
+        parallel = self._dry_run_paths(workers=4)
+
+        assert len(sequential) == 12
+        assert parallel == sequential
+
+    def test_max_limits_collected_operations(self, tmp_path) -> None:
+        self._setup_tree(tmp_path)
+
+        sequential = self._dry_run_paths(max=5)
+        parallel = self._dry_run_paths(max=5, workers=4)
+
+        assert len(sequential) == 5
+        assert parallel == sequential
+
+    def test_dry_run_with_processes_matches_sequential(self, tmp_path) -> None:
+        self._setup_tree(tmp_path)
+
+        sequential = self._dry_run_paths()
+        processes = self._dry_run_paths(workers=2, processes=True)
+
+        assert processes == sequential
+
+    def test_processes_without_workers_raises(self, tmp_path) -> None:
+        import pytest
+
+        self._setup_tree(tmp_path)
+
+        with pytest.raises(ValueError):
+            self._dry_run_paths(processes=True)
+        with pytest.raises(ValueError):
+            self._dry_run_paths(workers=1, processes=True)
+
+    def test_process_work_unit_returns_write_payload(self, tmp_path) -> None:
+        from wexample_filestate.enum.scopes import Scope
+
+        self._setup_tree(tmp_path)
+        item = self.state_manager.find_by_path("dir_0/file_0.txt")
+
+        unit = item._create_process_work_unit(scopes=set(Scope))
+        assert unit is not None
+
+        payload = unit.run()
+        assert payload["content"] == "no newline\n"
+
+        operation = item._create_operation_from_process_payload(
+            payload, scopes=set(Scope)
+        )
+        assert operation.target is item
+        assert item.get_option_key_path(operation.option) == payload["option_path"]
+
+    def test_apply_with_workers(self, tmp_path) -> None:
+        self._setup_tree(tmp_path)
+
+        self.state_manager.apply(workers=4)
+
+        for path in sorted(tmp_path.glob("dir_*/*.txt")):
+            assert path.read_text().endswith("\n")
+
+    def _dry_run_paths(self, **kwargs) -> list[Path]:
+        from wexample_filestate.enum.scopes import Scope
+
+        result = self.state_manager.dry_run(scopes=set(Scope), **kwargs)
+        return [operation.target.get_path() for operation in result.operations]
+
+    def _setup_tree(self, tmp_path) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+
+        self._setup_with_tmp_path(tmp_path)
+
+        children = []
+        for dir_index in range(3):
+            directory = tmp_path / f"dir_{dir_index}"
+            directory.mkdir()
+            files = []
+            for file_index in range(4):
+                name = f"file_{file_index}.txt"
+                (directory / name).write_text("no newline")
+                files.append(
+                    {
+                        "name": name,
+                        "type": DiskItemType.FILE,
+                        "text": {"end_new_line": True},
+                    }
+                )
+            children.append(
+                {
+                    "name": directory.name,
+                    "type": DiskItemType.DIRECTORY,
+                    "children": files,
+                }
+            )
+
+        self.state_manager.configure({"children": children})
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from wexample_filestate.testing.abstract_state_manager_test import (
+    AbstractStateManagerTest,
+)
+
+
+class TestConverge(AbstractStateManagerTest):
+    test_file_name: str = "converged.txt"
+
+    def test_converge_combines_content_options(self, tmp_path) -> None:
+        from wexample_filestate.enum.scopes import Scope
+
+        file_path = self._setup_file(tmp_path)
+
+        # Without converging, only the first option is fixed by a run.
+        result = self.state_manager.dry_run(scopes=set(Scope))
+        assert len(result.operations) == 1
+        assert result.operations[0].content == "charlie\nbravo\nalpha\n"
+
+        result = self.state_manager.dry_run(scopes=set(Scope), converge=True)
+        assert len(result.operations) == 1
+        assert result.operations[0].content == "alpha\nbravo\ncharlie\n"
+        assert file_path.read_text() == "charlie\nbravo"
+
+        result = self.state_manager.apply(converge=True)
+        assert len(result.operations) == 1
+        assert file_path.read_text() == "alpha\nbravo\ncharlie\n"
+
+        result = self.state_manager.apply()
+        assert not result.operations
+
+    def test_converge_without_change(self, tmp_path) -> None:
+        file_path = self._setup_file(tmp_path, content="alpha\nbravo\ncharlie\n")
+
+        result = self.state_manager.apply(converge=True)
+        assert not result.operations
+        assert file_path.read_text() == "alpha\nbravo\ncharlie\n"
+
+    def _setup_file(self, tmp_path, content: str = "charlie\nbravo"):
+        from wexample_filestate.const.disk import DiskItemType
+
+        self._setup_with_tmp_path(tmp_path)
+        file_path = tmp_path / self.test_file_name
+        file_path.write_text(content)
+
+        self.state_manager.configure(
+            {
+                "children": [
+                    {
+                        "name": self.test_file_name,
+                        "type": DiskItemType.FILE,
+                        "should_contain_lines": ["alpha"],
+                        "text": {"sort_lines": True, "end_new_line": True},
+                    }
+                ]
+            }
+        )
+        return file_path
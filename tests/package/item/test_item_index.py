@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from wexample_filestate.testing.abstract_state_manager_test import (
+    AbstractStateManagerTest,
+)
+
+
+class TestItemIndex(AbstractStateManagerTest):
+    def test_indexed_lookups_match_tree_scan(self, tmp_path) -> None:
+        from wexample_filestate.item.item_target_directory import ItemTargetDirectory
+        from wexample_filestate.item.item_target_file import ItemTargetFile
+
+        self._setup_tree(tmp_path)
+        manager = self.state_manager
+
+        # Nothing below the first level is built yet: lookups scan the tree.
+        assert not manager._is_subtree_built()
+        scanned = manager.find_by_name("shared.txt", recursive=True)
+        assert scanned.get_path() == tmp_path / "dir_0" / "shared.txt"
+
+        manager.build_item_tree_recursive()
+        assert manager._is_subtree_built()
+
+        assert manager.find_by_name("shared.txt", recursive=True) is scanned
+        assert manager.find_by_path("shared.txt", recursive=True) is scanned
+        assert (
+            manager.find_by_path("dir_1/nested/shared.txt").get_path()
+            == tmp_path / "dir_1" / "nested" / "shared.txt"
+        )
+        assert manager.find_by_type(ItemTargetFile, recursive=True) is scanned
+        assert manager.find_by_name("missing.txt", recursive=True) is None
+
+        # Lookups from a subdirectory only consider its own subtree.
+        dir_1 = manager.find_by_name("dir_1")
+        assert isinstance(dir_1, ItemTargetDirectory)
+        assert (
+            dir_1.find_by_name("shared.txt", recursive=True).get_path()
+            == tmp_path / "dir_1" / "shared.txt"
+        )
+        assert manager._item_index is not None
+
+    def test_added_directory_resets_subtree_built(self, tmp_path) -> None:
+        from wexample_filestate.option.children_option import ChildrenOption
+
+        self._setup_tree(tmp_path)
+        manager = self.state_manager
+        manager.build_item_tree_recursive()
+        assert manager._is_subtree_built()
+
+        (tmp_path / "dir_1" / "added").mkdir()
+        (tmp_path / "dir_1" / "added" / "late.txt").write_text("late")
+        dir_1 = manager.find_by_name("dir_1")
+        dir_1.get_children_list().append(
+            dir_1.get_option(ChildrenOption).create_child_item(
+                {
+                    "name": "added",
+                    "type": "dir",
+                    "children": [{"name": "late.txt", "type": "file"}],
+                }
+            )
+        )
+
+        assert not manager._is_subtree_built()
+        assert (
+            manager.find_by_name("late.txt", recursive=True).get_path()
+            == tmp_path / "dir_1" / "added" / "late.txt"
+        )
+        assert manager._is_subtree_built()
+
+    def test_reconfigure_rebuilds_children(self, tmp_path) -> None:
+        self._setup_tree(tmp_path)
+        manager = self.state_manager
+        manager.build_item_tree_recursive()
+        assert manager.find_by_name("shared.txt", recursive=True) is not None
+
+        manager.configure({"children": [{"name": "dir_0", "type": "dir"}]})
+
+        assert not manager._is_subtree_built()
+        assert manager.find_by_name("dir_1") is None
+        assert manager.find_by_name("shared.txt", recursive=True) is None
+
+    def test_rename_keeps_lookups_in_sync(self, tmp_path) -> None:
+        from wexample_filestate.operation.file_rename_operation import (
+            FileRenameOperation,
+        )
+        from wexample_filestate.option.name_option import NameOption
+
+        self._setup_tree(tmp_path)
+        manager = self.state_manager
+        manager.build_item_tree_recursive()
+
+        target = manager.find_by_path("dir_1/nested/shared.txt")
+        operation = FileRenameOperation(
+            description="Rename",
+            new_name="moved.txt",
+            option=target.get_option(NameOption),
+            target=target,
+        )
+        operation.apply_operation()
+
+        assert manager.find_by_name("moved.txt", recursive=True) is target
+        assert manager.find_by_path("dir_1/nested/moved.txt") is target
+        assert manager.find_by_path("dir_1/nested/shared.txt") is None
+
+    def _setup_tree(self, tmp_path) -> None:
+        self._setup_with_tmp_path(tmp_path)
+
+        for directory in ("dir_0", "dir_1", "dir_1/nested"):
+            (tmp_path / directory).mkdir()
+            (tmp_path / directory / "shared.txt").write_text("shared")
+
+        self.state_manager.configure(
+            {
+                "children": [
+                    {"name": "dir_0", "type": "dir", "children": [self._file()]},
+                    {
+                        "name": "dir_1",
+                        "type": "dir",
+                        "children": [
+                            {
+                                "name": "nested",
+                                "type": "dir",
+                                "children": [self._file()],
+                            },
+                            self._file(),
+                        ],
+                    },
+                ]
+            }
+        )
+
+    def _file(self) -> dict:
+        return {"name": "shared.txt", "type": "file"}
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from wexample_filestate.testing.abstract_state_manager_test import (
+    AbstractStateManagerTest,
+)
+
+
+class TestIterOperations(AbstractStateManagerTest):
+    def test_iter_operations_matches_dry_run(self, tmp_path) -> None:
+        from wexample_filestate.enum.scopes import Scope
+
+        self._setup_tree(tmp_path)
+
+        expected = [
+            operation.target.get_path()
+            for operation in self.state_manager.dry_run(scopes=set(Scope)).operations
+        ]
+        streamed = [
+            operation.target.get_path()
+            for operation in self.state_manager.iter_operations(scopes=set(Scope))
+        ]
+
+        assert len(expected) == 3
+        assert streamed == expected
+
+        limited = list(self.state_manager.iter_operations(scopes=set(Scope), max=2))
+        assert len(limited) == 2
+
+    def test_apply_streaming_releases_content(self, tmp_path) -> None:
+        self._setup_tree(tmp_path)
+
+        result = self.state_manager.apply_streaming()
+
+        assert len(result.operations) == 3
+        for operation in result.operations:
+            assert operation.applied
+            assert operation.content is None
+            assert operation.target._text_cache is None
+        for path in tmp_path.glob("streamed_*.txt"):
+            assert path.read_text() == "no newline\n"
+
+        self.state_manager.rollback()
+        for path in tmp_path.glob("streamed_*.txt"):
+            assert path.read_text() == "no newline"
+
+    def _setup_tree(self, tmp_path) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+
+        self._setup_with_tmp_path(tmp_path)
+
+        children = []
+        for index in range(3):
+            name = f"streamed_{index}.txt"
+            (tmp_path / name).write_text("no newline")
+            children.append(
+                {
+                    "name": name,
+                    "type": DiskItemType.FILE,
+                    "text": {"end_new_line": True},
+                }
+            )
+
+        self.state_manager.configure({"children": children})
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+from wexample_filestate.testing.abstract_state_manager_test import (
+    AbstractStateManagerTest,
+)
+
+
+class TestLazyChildrenList(AbstractStateManagerTest):
+    def test_generated_children_are_promoted_on_access(self, tmp_path) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.item.item_target_file import ItemTargetFile
+        from wexample_filestate.option.children_filter_option import (
+            ChildrenFilterOption,
+        )
+        from wexample_filestate.utils.lazy_children_list import LazyChildrenList
+
+        self._setup_with_tmp_path(tmp_path)
+        for index in range(5):
+            (tmp_path / f"generated_{index}.txt").write_text("content")
+
+        self.state_manager.configure(
+            {
+                "children": [
+                    ChildrenFilterOption(
+                        name_pattern=r"^generated_.*\.txt$",
+                        pattern={"type": DiskItemType.FILE},
+                    )
+                ]
+            }
+        )
+
+        children = self.state_manager.get_children_list()
+        assert isinstance(children, LazyChildrenList)
+        assert len(children) == 5
+        assert children.count_promoted() == 0
+
+        item = self.state_manager.find_by_name("generated_3.txt")
+        assert isinstance(item, ItemTargetFile)
+        assert item.get_path() == tmp_path / "generated_3.txt"
+        assert children.count_promoted() == 1
+
+        # Promoted items keep their identity and own a copy of the config.
+        assert self.state_manager.find_by_name("generated_3.txt") is item
+        names = sorted(child.get_item_name() for child in children)
+        assert names == [f"generated_{index}.txt" for index in range(5)]
+        assert children.count_promoted() == 5
+        assert children[0].get_value() is not children[1].get_value()
+
+    def test_path_lookup_only_promotes_the_found_child(self, tmp_path) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.option.children_filter_option import (
+            ChildrenFilterOption,
+        )
+
+        self._setup_with_tmp_path(tmp_path)
+        (tmp_path / "sub").mkdir()
+        for index in range(200):
+            (tmp_path / "sub" / f"file_{index}.txt").write_text("content")
+
+        self.state_manager.configure(
+            {
+                "children": [
+                    {
+                        "name": "sub",
+                        "type": DiskItemType.DIRECTORY,
+                        "children": [
+                            ChildrenFilterOption(
+                                name_pattern=r"^file_.*\.txt$",
+                                pattern={"type": DiskItemType.FILE},
+                            )
+                        ],
+                    }
+                ]
+            }
+        )
+
+        item = self.state_manager.find_by_path("sub/file_42.txt")
+        children = self.state_manager.find_by_name("sub").get_children_list()
+        assert item.get_path() == tmp_path / "sub" / "file_42.txt"
+        assert children.count_promoted() == 1
+
+        # Promoted items are indexed as they appear.
+        assert self.state_manager.find_by_path("sub/file_42.txt") is item
+        assert self.state_manager._item_index.get_by_path(item.get_path()) is item
+        assert children.count_promoted() == 1
+
+    def test_list_methods_work_on_promoted_items(self, tmp_path) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.option.children_filter_option import (
+            ChildrenFilterOption,
+        )
+
+        self._setup_with_tmp_path(tmp_path)
+        for index in range(4):
+            (tmp_path / f"listed_{index}.txt").write_text("content")
+
+        self.state_manager.configure(
+            {
+                "children": [
+                    ChildrenFilterOption(
+                        name_pattern=r"^listed_.*\.txt$",
+                        pattern={"type": DiskItemType.FILE},
+                    )
+                ]
+            }
+        )
+
+        children = self.state_manager.get_children_list()
+        second = children[1]
+        assert children.count_pulled() == 2
+        assert second in children
+        assert children.index(second) == 1
+        assert children.count_pulled() == 2
+        assert children.count(second) == 1
+
+        copy = children.copy()
+        assert type(copy) is list
+        assert copy == list(children)
+
+        name = second.get_item_name()
+        children.remove(second)
+        assert second not in children
+        assert self.state_manager.find_by_name(name) is None
+
+        children.append(second)
+        assert children[-1] is second
+        assert self.state_manager.find_by_name(name) is second
+
+        children.sort(key=lambda item: item.get_item_name())
+        assert [item.get_item_name() for item in children] == [
+            f"listed_{index}.txt" for index in range(4)
+        ]
+
+    def test_operators_work_on_promoted_items(self, tmp_path) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.option.children_filter_option import (
+            ChildrenFilterOption,
+        )
+        from wexample_filestate.utils.generated_child_spec import GeneratedChildSpec
+
+        self._setup_with_tmp_path(tmp_path)
+        for index in range(3):
+            (tmp_path / f"operand_{index}.txt").write_text("content")
+
+        self.state_manager.configure(
+            {
+                "children": [
+                    ChildrenFilterOption(
+                        name_pattern=r"^operand_.*\.txt$",
+                        pattern={"type": DiskItemType.FILE},
+                    )
+                ]
+            }
+        )
+
+        children = self.state_manager.get_children_list()
+        assert "GeneratedChildSpec" not in repr(children)
+        assert children.count_promoted() == 3
+
+        self.state_manager.configure(
+            {
+                "children": [
+                    ChildrenFilterOption(
+                        name_pattern=r"^operand_.*\.txt$",
+                        pattern={"type": DiskItemType.FILE},
+                    )
+                ]
+            }
+        )
+        children = self.state_manager.get_children_list()
+        assert children.count_pulled() == 0
+        assert [] + children == children.copy()
+        assert not children != children.copy()
+        assert not children < children.copy()
+        assert children <= children.copy()
+
+        doubled = children * 2
+        assert len(doubled) == 6
+        assert not any(isinstance(entry, GeneratedChildSpec) for entry in doubled)
+        assert 2 * children == doubled
+
+    def test_pattern_config_is_shared_and_never_mutated(self, tmp_path) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.helpers.config_helper import config_clone
+        from wexample_filestate.option.children_filter_option import (
+            ChildrenFilterOption,
+        )
+
+        self._setup_with_tmp_path(tmp_path)
+        (tmp_path / "nested").mkdir()
+        for name in ("a.txt", "b.txt", "nested/c.txt"):
+            (tmp_path / name).write_text("content")
+
+        pattern = {"type": DiskItemType.FILE, "text": {"end_new_line": True}}
+        self.state_manager.configure(
+            {
+                "children": [
+                    ChildrenFilterOption(
+                        name_pattern=r".*\.txt$", pattern=pattern, recursive=True
+                    )
+                ]
+            }
+        )
+        self.state_manager.build_item_tree_recursive()
+
+        nested = self.state_manager.find_by_path("nested/c.txt")
+        assert nested.get_path() == tmp_path / "nested" / "c.txt"
+        assert pattern == {"type": DiskItemType.FILE, "text": {"end_new_line": True}}
+
+        clone = config_clone(pattern)
+        assert clone == pattern
+        assert clone["text"] is not pattern["text"]
+        assert clone["type"] is pattern["type"]
+
+    def test_item_configs_hold_no_specs(self, tmp_path) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.option.children_filter_option import (
+            ChildrenFilterOption,
+        )
+        from wexample_filestate.utils.generated_child_spec import GeneratedChildSpec
+
+        self._setup_with_tmp_path(tmp_path)
+        (tmp_path / "src" / "nested").mkdir(parents=True)
+        for name in ("src/a.txt", "src/nested/b.txt"):
+            (tmp_path / name).write_text("content")
+
+        self.state_manager.configure(
+            {
+                "children": [
+                    ChildrenFilterOption(
+                        name_pattern=r".*\.txt$",
+                        pattern={"type": DiskItemType.FILE},
+                        recursive=True,
+                    )
+                ]
+            }
+        )
+
+        def walk(value) -> None:
+            assert not isinstance(value, GeneratedChildSpec)
+            if isinstance(value, dict):
+                for child in value.values():
+                    walk(child)
+            elif isinstance(value, list):
+                for child in value:
+                    walk(child)
+
+        source = self.state_manager.find_by_name("src")
+        walk(source.get_value().raw)
+        nested = source.find_by_name("nested")
+        walk(nested.get_value().raw)
+        assert nested.find_by_name("b.txt").get_path() == tmp_path / "src/nested/b.txt"
+
+    def test_failing_source_is_kept(self, tmp_path) -> None:
+        import pytest
+
+        from wexample_filestate.utils.lazy_children_list import LazyChildrenList
+
+        class FlakySource:
+            def __init__(self) -> None:
+                self.calls = 0
+
+            def __iter__(self) -> FlakySource:
+                return self
+
+            def __next__(self) -> str:
+                self.calls += 1
+                if self.calls == 2:
+                    raise OSError("listing failed")
+                if self.calls > 3:
+                    raise StopIteration
+                return f"entry_{self.calls}"
+
+        self._setup_with_tmp_path(tmp_path)
+        self.state_manager.configure({"children": []})
+        children = LazyChildrenList(owner=self.state_manager.get_option("children"))
+        children.add_source(FlakySource())
+        children.add_source(["after"])
+
+        with pytest.raises(OSError):
+            children._fill_all()
+        assert children.count_pulled() == 1
+
+        # The rest of the failing source is still read, before the next one.
+        children._fill_all()
+        assert children.count_pulled() == 3
+        assert children.is_complete()
+
+    def test_generated_children_are_pulled_on_demand(self, tmp_path) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.enum.scopes import Scope
+        from wexample_filestate.option.children_filter_option import (
+            ChildrenFilterOption,
+        )
+
+        self._setup_with_tmp_path(tmp_path)
+        for index in range(5):
+            (tmp_path / f"pulled_{index}.txt").write_text("no newline")
+
+        self.state_manager.configure(
+            {
+                "children": [
+                    ChildrenFilterOption(
+                        name_pattern=r"^pulled_.*\.txt$",
+                        pattern={
+                            "type": DiskItemType.FILE,
+                            "text": {"end_new_line": True},
+                        },
+                    )
+                ]
+            }
+        )
+
+        children = self.state_manager.get_children_list()
+        assert children.count_pulled() == 0
+
+        # A limited run stops pulling children once it has enough operations.
+        result = self.state_manager.dry_run(scopes=set(Scope), max=2)
+        assert len(result.operations) == 2
+        assert children.count_pulled() == 2
+        assert not children.is_complete()
+
+        first_name = children[0].get_item_name()
+        assert self.state_manager.find_by_name(first_name) is children[0]
+        assert children.count_pulled() == 2
+
+        assert self.state_manager.find_by_name("missing.txt") is None
+        assert children.is_complete()
+        assert len(children) == 5
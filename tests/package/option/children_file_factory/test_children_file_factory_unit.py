@@ -141,6 +141,52 @@ class TestChildrenFileFactoryOptionUnit(AbstractStateManagerTest):
 
         assert option_non_recursive.recursive is False, "recursive should be False"
 
+    def test_children_file_factory_option_reports_dir_config_cache(
+        self, tmp_path
+    ) -> None:
+        """Test each generation logs its own .wex.yml cache hits and misses."""
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.helpers.dir_config import read_dir_config_cache_clear
+        from wexample_filestate.option.children_file_factory_option import (
+            ChildrenFileFactoryOption,
+        )
+
+        self._setup_with_tmp_path(tmp_path)
+        for name in ("project_a", "project_b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / ".wex.yml").write_text("filestate: {}\n")
+        read_dir_config_cache_clear()
+
+        io = self.state_manager.io
+        records = io.push_recorder()
+        try:
+            for _ in range(2):
+                self.state_manager.configure(
+                    {
+                        "children": [
+                            ChildrenFileFactoryOption(
+                                pattern={"name": "test.txt", "type": DiskItemType.FILE},
+                                name_pattern=["project_.*"],
+                            )
+                        ]
+                    }
+                )
+                assert len(self.state_manager.get_children_list()) == 2
+        finally:
+            io.pop_recorder()
+
+        messages = [record.render() for record in records]
+        messages = [message for message in messages if ".wex.yml cache" in message]
+        assert len(messages) == 2
+        assert (
+            "[children_file_factory] .wex.yml cache: 0 hit(s), 2 miss(es)"
+            in messages[0]
+        )
+        assert (
+            "[children_file_factory] .wex.yml cache: 2 hit(s), 0 miss(es)"
+            in messages[1]
+        )
+
     def _get_test_data_path(self) -> Path:
         """Get the path to test data directory."""
         from pathlib import Path
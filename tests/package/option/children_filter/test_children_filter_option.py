@@ -424,6 +424,103 @@ class TestChildrenFilterOption(AbstractStateManagerTest):
             len(directories) > 0
         ), "Should preserve directory hierarchy when recursive"
 
+    def test_children_filter_option_recursive_lists_each_directory_once(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        """Recursive filtering lists every directory a single time."""
+        import os
+
+        from wexample_prompt.common.io_manager import IoManager
+
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.item.item_target_directory import ItemTargetDirectory
+        from wexample_filestate.option.children_filter_option import (
+            ChildrenFilterOption,
+        )
+
+        self._setup_with_tmp_path(tmp_path)
+        test_data_path = self._get_test_data_path()
+        self._copy_directory_structure(test_data_path, tmp_path)
+
+        listed = []
+        scandir = os.scandir
+
+        def counting_scandir(path="."):
+            listed.append(os.fspath(path))
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        parent_directory = ItemTargetDirectory.create_from_path(
+            path=str(tmp_path), io=IoManager()
+        )
+        parent_directory.set_value(
+            {
+                "children": [
+                    ChildrenFilterOption(
+                        pattern={"type": DiskItemType.FILE},
+                        name_pattern=r".*\.txt$",
+                        recursive=True,
+                    )
+                ]
+            }
+        )
+        parent_directory.build_item_tree_recursive()
+
+        assert listed
+        assert len(listed) == len(set(listed))
+
+    def test_children_filter_option_exclude_prunes_directories(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        """Excluded directories are never listed."""
+        import os
+
+        from wexample_prompt.common.io_manager import IoManager
+
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.item.item_target_directory import ItemTargetDirectory
+        from wexample_filestate.option.children_filter_option import (
+            ChildrenFilterOption,
+        )
+
+        for directory in ("src", "node_modules/pkg", "src/build"):
+            (tmp_path / directory).mkdir(parents=True)
+            (tmp_path / directory / "file.txt").write_text("content")
+        (tmp_path / "src" / ".wexignore").write_text("build/\n")
+
+        listed = []
+        scandir = os.scandir
+
+        def counting_scandir(path="."):
+            listed.append(os.fspath(path))
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        parent_directory = ItemTargetDirectory.create_from_path(
+            path=str(tmp_path), io=IoManager()
+        )
+        parent_directory.set_value(
+            {
+                "children": [
+                    ChildrenFilterOption(
+                        exclude=["node_modules/"],
+                        pattern={"type": DiskItemType.FILE},
+                        name_pattern=r".*\.txt$",
+                        recursive=True,
+                    )
+                ]
+            }
+        )
+        parent_directory.build_item_tree_recursive()
+
+        assert parent_directory.find_by_path("src/file.txt") is not None
+        assert parent_directory.find_by_name("node_modules") is None
+        assert parent_directory.find_by_path("src/build") is None
+        assert not any("node_modules" in path for path in listed)
+        assert not any(path.endswith("build") for path in listed)
+
     def test_children_filter_option_type_filtering(self, tmp_path) -> None:
         """Test ChildrenFilterOption respects type filtering."""
         from wexample_prompt.common.io_manager import IoManager
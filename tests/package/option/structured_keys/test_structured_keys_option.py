@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from wexample_filestate.testing.abstract_state_manager_test import (
+    AbstractStateManagerTest,
+)
+
+
+class TestStructuredKeysOption(AbstractStateManagerTest):
+    def test_matching_keys_skip_full_parse(self, tmp_path, monkeypatch) -> None:
+        import json
+
+        from wexample_filestate.enum.scopes import Scope
+        from wexample_filestate.item.file.json_file import JsonFile
+        from wexample_filestate.item.file.yaml_file import YamlFile
+
+        self._setup_with_tmp_path(tmp_path)
+        (tmp_path / "package.json").write_text(
+            json.dumps(
+                {"name": "app", "version": "1.0.0", "packages": {"a": [1, "}"]}},
+                indent=2,
+            )
+        )
+        (tmp_path / "config.yml").write_text(
+            "# comment\nproject:\n  name: app\n  version: '1.0.0'\nlist: [1, 2]\n"
+        )
+        self.state_manager.configure(
+            {
+                "children": [
+                    {
+                        "class": JsonFile,
+                        "name": "package.json",
+                        "structured_keys": {"name": "app", "version": "1.0.0"},
+                    },
+                    self._get_yaml_item_config(),
+                ]
+            }
+        )
+
+        parsed = []
+        read_parsed = JsonFile.read_parsed
+
+        def counting(item, *args, **kwargs):
+            # Class rules preview the file, only count the option own reads.
+            if kwargs.get("strict"):
+                parsed.append(item)
+            return read_parsed(item, *args, **kwargs)
+
+        monkeypatch.setattr(JsonFile, "read_parsed", counting)
+        monkeypatch.setattr(YamlFile, "read_parsed", counting)
+
+        assert not self.state_manager.dry_run(scopes=set(Scope)).operations
+        assert not parsed
+
+    def test_mismatching_keys_are_written(self, tmp_path) -> None:
+        from wexample_filestate.enum.scopes import Scope
+
+        self._setup_with_tmp_path(tmp_path)
+        yaml_path = tmp_path / "config.yml"
+        yaml_path.write_text("# comment\nproject:\n  name: app\n  version: 0.9\n")
+        self.state_manager.configure({"children": [self._get_yaml_item_config()]})
+
+        self.state_manager.apply(scopes=set(Scope))
+        assert yaml_path.read_text() == (
+            "# comment\nproject:\n  name: app\n  version: 1.0.0\n"
+        )
+
+    def _get_yaml_item_config(self) -> dict:
+        from wexample_filestate.item.file.yaml_file import YamlFile
+
+        return {
+            "class": YamlFile,
+            "name": "config.yml",
+            "structured_keys": {"project.name": "app", "project.version": "1.0.0"},
+        }
+
+
+def test_loads_key_paths_matches_full_parse() -> None:
+    from wexample_filestate.helpers.key_path import key_path_get
+    from wexample_filestate.serializer.json_serializer_backend import (
+        JsonSerializerBackend,
+    )
+    from wexample_filestate.serializer.yaml_serializer_backend import (
+        YamlSerializerBackend,
+    )
+
+    key_paths = ["name", "a.b", "a.missing", "list.0", "version"]
+    json_text = (
+        '{"a": {"x": "{[\\"", "b": [1, {"c": null}]}, '
+        '"list": [1], "name": "app", "version": 1.5e2}'
+    )
+    yaml_text = "a:\n  x: '{['\n  b: 0x1F\nlist: [1]\nname: yes\nversion: 1.10\n"
+
+    for backend, text in (
+        (JsonSerializerBackend, json_text),
+        (YamlSerializerBackend, yaml_text),
+    ):
+        parsed = backend.loads(text)
+        assert backend.loads_key_paths(text, key_paths) == {
+            key_path: key_path_get(parsed, key_path) for key_path in key_paths
+        }
+
+    # Constructs the walker does not follow need a full parse.
+    assert YamlSerializerBackend.loads_key_paths("a: &x 1\nb: *x\n", ["b"]) is None
+    assert YamlSerializerBackend.loads_key_paths("- a\n", ["a"]) is None
+    assert JsonSerializerBackend.loads_key_paths("[1]", ["a"]) is None
+
+    # So do duplicate keys and multiple documents met before the key paths
+    # are resolved.
+    assert (
+        JsonSerializerBackend.loads_key_paths('{"a": 1, "a": 2, "b": 3}', ["a", "b"])
+        is None
+    )
+    assert (
+        JsonSerializerBackend.loads_key_paths(
+            '{"a": {"b": 1}, "c": 2, "a": {"b": 3}}', ["a.b", "d"]
+        )
+        is None
+    )
+    assert (
+        YamlSerializerBackend.loads_key_paths("a: 1\nb: 2\na: 3\n", ["a", "c"])
+        is None
+    )
+    assert (
+        YamlSerializerBackend.loads_key_paths("a: 1\nb:\n  c: 1\n  c: 2\n", ["a", "d"])
+        is None
+    )
+    assert (
+        YamlSerializerBackend.loads_key_paths("a: 1\n---\na: 2\n", ["a", "b"])
+        is None
+    )
+
+
+def test_loads_key_paths_stops_once_resolved() -> None:
+    from wexample_filestate.serializer.json_serializer_backend import (
+        JsonSerializerBackend,
+    )
+    from wexample_filestate.serializer.yaml_serializer_backend import (
+        YamlSerializerBackend,
+    )
+
+    # The rest of the document is not read, invalid content included.
+    expected = {"name": "app", "project.version": None}
+    assert (
+        JsonSerializerBackend.loads_key_paths(
+            '{"project": 1, "name": "app", "rest": [', list(expected)
+        )
+        == expected
+    )
+    assert (
+        YamlSerializerBackend.loads_key_paths(
+            "project: 1\nname: app\nrest: [\n", list(expected)
+        )
+        == expected
+    )
@@ -7,6 +7,29 @@ from wexample_filestate.testing.abstract_test_operation import AbstractTestOpera
 
 
 class TestYamlSortRecursiveOperation(AbstractTestOperation):
+    def test_is_sorted_recursive(self, tmp_path, monkeypatch) -> None:
+        from wexample_filestate.enum.scopes import Scope
+        from wexample_filestate.option.yaml.sort_recursive_option import (
+            SortRecursiveOption,
+        )
+
+        self._setup_with_tmp_path(tmp_path)
+        self._operation_test_setup()
+        option = self._get_target().get_option_recursive(SortRecursiveOption)
+
+        assert option._is_sorted_recursive({"a": [{"b": 1, "c": 2}], "d": None})
+        assert not option._is_sorted_recursive({"a": [{"c": 1, "b": 2}]})
+        assert option._is_sorted_recursive(None)
+
+        # A sorted file is checked without dumping anything.
+        dumped = []
+        monkeypatch.setattr(
+            SortRecursiveOption, "_dump_yaml_content", lambda *args: dumped.append(1)
+        )
+        self._get_target().get_local_file().write(content="a: 1\nb:\n  c: 2\n")
+        assert not self.state_manager.dry_run(scopes=set(Scope)).operations
+        assert not dumped
+
     def _get_target(self) -> TargetFileOrDirectoryType | None:
         return self.state_manager.find_by_name("unsorted.yml")
 
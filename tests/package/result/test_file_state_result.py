@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from wexample_filestate.testing.abstract_state_manager_test import (
+    AbstractStateManagerTest,
+)
+
+
+class TestFileStateResult(AbstractStateManagerTest):
+    def test_writes_on_same_file_are_coalesced(self, tmp_path, monkeypatch) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.operation.file_write_operation import (
+            FileWriteOperation,
+        )
+        from wexample_filestate.result.file_state_result import FileStateResult
+        from wexample_filestate.utils.atomic_file_writer import AtomicFileWriter
+
+        self._setup_with_tmp_path(tmp_path)
+        file_path = tmp_path / "coalesced.txt"
+        file_path.write_text("original")
+        self.state_manager.configure(
+            {"children": [{"name": "coalesced.txt", "type": DiskItemType.FILE}]}
+        )
+        target = self.state_manager.find_by_name("coalesced.txt")
+        option = target.get_option("name")
+
+        result = FileStateResult(state_manager=self.state_manager)
+        result.operations.extend(
+            FileWriteOperation(
+                option=option,
+                target=target,
+                content=content,
+                description=f"Write {content}",
+            )
+            for content in ("first", "second", "third")
+        )
+
+        writes = []
+        write = AtomicFileWriter.write
+
+        def counting(writer, *args, **kwargs):
+            writes.append(kwargs.get("content"))
+            return write(writer, *args, **kwargs)
+
+        monkeypatch.setattr(AtomicFileWriter, "write", counting)
+
+        result.apply_operations()
+        assert writes == ["third"]
+        assert file_path.read_text() == "third"
+        # Every write is still reported.
+        assert [operation.description for operation in result.operations] == [
+            "Write first",
+            "Write second",
+            "Write third",
+        ]
+        assert all(operation.applied for operation in result.operations)
+
+        rollback = FileStateResult(
+            state_manager=self.state_manager,
+            operations=list(result.operations),
+            rollback=True,
+        )
+        rollback.apply_operations()
+        assert file_path.read_text() == "original"
+
+    def test_dry_run_neither_coalesces_nor_flushes(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.operation.file_write_operation import (
+            FileWriteOperation,
+        )
+        from wexample_filestate.result.file_state_dry_run_result import (
+            FileStateDryRunResult,
+        )
+        from wexample_filestate.result.file_state_result import FileStateResult
+        from wexample_filestate.utils.atomic_file_writer import AtomicFileWriter
+
+        self._setup_with_tmp_path(tmp_path)
+        (tmp_path / "planned.txt").write_text("original")
+        self.state_manager.configure(
+            {"children": [{"name": "planned.txt", "type": DiskItemType.FILE}]}
+        )
+        target = self.state_manager.find_by_name("planned.txt")
+
+        flushes = []
+        monkeypatch.setattr(
+            AtomicFileWriter, "flush", lambda writer: flushes.append(writer)
+        )
+
+        result = FileStateDryRunResult(state_manager=self.state_manager)
+        result.operations.extend(
+            FileWriteOperation(
+                option=target.get_option("name"),
+                target=target,
+                content=content,
+                description=f"Write {content}",
+            )
+            for content in ("first", "second")
+        )
+        result.apply_operations()
+
+        assert [operation.content for operation in result.operations] == [
+            "first",
+            "second",
+        ]
+        assert flushes == []
+
+        # Nothing executed, nothing to flush.
+        FileStateResult(state_manager=self.state_manager).apply_operations()
+        assert flushes == []
+
+    def test_operation_indexes(self, tmp_path) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.operation.abstract_existing_file_operation import (
+            AbstractExistingFileOperation,
+        )
+        from wexample_filestate.operation.file_change_mode_operation import (
+            FileChangeModeOperation,
+        )
+        from wexample_filestate.operation.file_write_operation import (
+            FileWriteOperation,
+        )
+        from wexample_filestate.result.file_state_result import FileStateResult
+
+        self._setup_with_tmp_path(tmp_path)
+        for name in ("a.txt", "b.txt"):
+            (tmp_path / name).write_text(name)
+        self.state_manager.configure(
+            {
+                "children": [
+                    {"name": name, "type": DiskItemType.FILE}
+                    for name in ("a.txt", "b.txt")
+                ]
+            }
+        )
+        first = self.state_manager.find_by_name("a.txt")
+        second = self.state_manager.find_by_name("b.txt")
+
+        result = FileStateResult(state_manager=self.state_manager)
+        write = FileWriteOperation(
+            option=first.get_option("name"),
+            target=first,
+            content="a",
+            description="Write a",
+        )
+        result.operations.append(write)
+        assert result.get_operations_by_target_path(first.get_path()) == [write]
+
+        # Operations appended after a lookup are indexed on the next one.
+        mode = FileChangeModeOperation(
+            option=second.get_option("name"),
+            target=second,
+            description="Mode b",
+            recursive=False,
+            target_mode=0o644,
+        )
+        result.operations.append(mode)
+        assert result.get_operations_by_target_path(second.get_path()) == [mode]
+        assert result.get_operations_by_class(FileWriteOperation) == [write]
+        assert result.get_operations_by_class(AbstractExistingFileOperation) == [
+            write
+        ]
+        assert result.get_operations_by_option(second.get_option("name")) == [mode]
+        assert result._find_dependency(FileChangeModeOperation) is mode
+
+        # Executed operations are tracked per result.
+        other = FileStateResult(state_manager=self.state_manager)
+        result.operations = [write, write]
+        result.apply_operations()
+        assert other._executed_operation_ids == set()
+        assert result._executed_operation_ids == {id(write)}
+        assert result.get_operations_by_class(FileChangeModeOperation) == []
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+
+def test_env_native_parser_matches_dotenv() -> None:
+    from wexample_filestate.serializer.dotenv_serializer_backend import (
+        DotenvSerializerBackend,
+    )
+    from wexample_filestate.serializer.env_serializer_backend import (
+        EnvSerializerBackend,
+    )
+
+    text = (
+        "# comment\n"
+        "export NAME=app\n"
+        "EMPTY=\n"
+        "SINGLE='raw $value'\n"
+        'DOUBLE="line\\nbreak" # inline comment\n'
+        "PLAIN=value # inline comment\n"
+        'MULTI="first\n'
+        'second"\n'
+    )
+
+    assert EnvSerializerBackend.loads(text) == DotenvSerializerBackend.loads(text)
+
+
+def test_json_backend_selection(tmp_path) -> None:
+    import pytest
+
+    from wexample_filestate.item.file.json_file import JsonFile
+
+    json_file = JsonFile.create_from_path(path=tmp_path / "data.json")
+    assert JsonFile.get_serializer_backend().get_name() == "json"
+    default_text = json_file.dumps({"name": "app", "items": [1, 2]})
+
+    JsonFile.use_serializer_backend("orjson")
+    try:
+        assert JsonFile.get_serializer_backend().get_name() == "orjson"
+        assert json_file.dumps({"name": "app", "items": [1, 2]}) == default_text
+        assert json_file.loads("{invalid", strict=False) == {}
+    finally:
+        JsonFile.use_serializer_backend(None)
+
+    assert JsonFile.get_serializer_backend().get_name() == "json"
+    with pytest.raises(ValueError):
+        JsonFile.use_serializer_backend("unknown")
+
+
+def test_read_only_backend(tmp_path) -> None:
+    import pytest
+    from tomlkit import TOMLDocument
+
+    from wexample_filestate.item.file.toml_file import TomlFile
+
+    # Read-only backends are rejected for writes.
+    with pytest.raises(ValueError):
+        TomlFile.use_serializer_backend("tomllib")
+
+    text = '[project]\nname = "app"\n'
+    TomlFile.use_serializer_backend("tomllib", read_only=True)
+    try:
+        parsed = TomlFile.loads_read_only(text)
+        assert type(parsed) is dict
+        assert parsed == {"project": {"name": "app"}}
+
+        # Writes keep the formatting preserving default backend.
+        toml_file = TomlFile.create_from_path(path=tmp_path / "data.toml")
+        assert isinstance(toml_file.loads(text), TOMLDocument)
+    finally:
+        TomlFile.use_serializer_backend(None, read_only=True)
+
+    assert isinstance(TomlFile.loads_read_only(text), TOMLDocument)
+
+
+def test_xml_iterparse_matches_xmltodict() -> None:
+    from wexample_filestate.serializer.xml_iterparse_serializer_backend import (
+        XmlIterparseSerializerBackend,
+    )
+    from wexample_filestate.serializer.xmltodict_serializer_backend import (
+        XmltodictSerializerBackend,
+    )
+
+    text = (
+        '<project id="1"><name>app</name>'
+        '<item kind="a">one</item><item>two</item><empty/></project>'
+    )
+
+    assert XmlIterparseSerializerBackend.loads(
+        text
+    ) == XmltodictSerializerBackend.loads(text)
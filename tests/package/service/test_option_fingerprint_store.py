@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from wexample_filestate.testing.abstract_state_manager_test import (
+    AbstractStateManagerTest,
+)
+
+
+class TestOptionFingerprintStore(AbstractStateManagerTest):
+    test_file_name: str = "fingerprinted.txt"
+
+    def test_lru_eviction(self, tmp_path) -> None:
+        from wexample_filestate.item.file.json_file import JsonFile
+        from wexample_filestate.service.option_fingerprint_store import (
+            OptionFingerprintStore,
+        )
+
+        store = OptionFingerprintStore(
+            file=JsonFile.create_from_path(path=tmp_path / "store.json"),
+            max_entries=2,
+        )
+        store.mark_clean("a")
+        store.mark_clean("b")
+        assert store.is_clean("a")
+        store.mark_clean("c")
+
+        # "b" was the least recently used entry.
+        assert not store.is_clean("b")
+        assert store.is_clean("a")
+        assert store.is_clean("c")
+
+    def test_unchanged_content_skips_option_checks(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        import os
+
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.option.text_option import TextOption
+        from wexample_filestate.service.option_fingerprint_store import (
+            OptionFingerprintStore,
+        )
+
+        self._setup_with_tmp_path(tmp_path)
+        file_path = tmp_path / self.test_file_name
+        file_path.write_text("content\n")
+
+        self.state_manager.configure(
+            {
+                "children": [
+                    {
+                        "name": self.test_file_name,
+                        "type": DiskItemType.FILE,
+                        "text": {"end_new_line": True},
+                    }
+                ]
+            }
+        )
+
+        self.state_manager.apply(incremental=True)
+        assert (tmp_path / ".wex" / "tmp" / OptionFingerprintStore.FILE_NAME).is_file()
+
+        checked = []
+        create_required_operation = TextOption.create_required_operation
+
+        def counting(option, *args, **kwargs):
+            checked.append(option)
+            return create_required_operation(option, *args, **kwargs)
+
+        monkeypatch.setattr(TextOption, "create_required_operation", counting)
+
+        # A new signature with the same content still matches the fingerprint.
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+        result = self.state_manager.apply(incremental=True)
+        assert not result.operations
+        assert not checked
+
+        file_path.write_text("changed")
+        result = self.state_manager.apply(incremental=True)
+        assert checked
+        assert len(result.operations) == 1
+        assert file_path.read_text() == "changed\n"
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from wexample_filestate.testing.abstract_state_manager_test import (
+    AbstractStateManagerTest,
+)
+
+
+class TestScanIndex(AbstractStateManagerTest):
+    test_file_name: str = "indexed.txt"
+
+    def test_config_fingerprint_rejects_callables(self) -> None:
+        from wexample_filestate.enum.scopes import Scope
+        from wexample_filestate.helpers.config_fingerprint import config_fingerprint
+
+        first = config_fingerprint({"a": [1, "b"], "scopes": {Scope.CONTENT}})
+        assert first is not None
+        assert first == config_fingerprint({"scopes": {Scope.CONTENT}, "a": [1, "b"]})
+        assert first != config_fingerprint({"a": [1, "c"], "scopes": {Scope.CONTENT}})
+        assert config_fingerprint({"name": lambda option: "x"}) is None
+
+    def test_incremental_apply_skips_clean_items(self, tmp_path, monkeypatch) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.item.abstract_item_target import AbstractItemTarget
+        from wexample_filestate.service.scan_index import ScanIndex
+
+        self._setup_with_tmp_path(tmp_path)
+        file_path = tmp_path / self.test_file_name
+        file_path.write_text("content")
+
+        self.state_manager.configure(
+            {
+                "children": [
+                    {
+                        "name": self.test_file_name,
+                        "type": DiskItemType.FILE,
+                        "text": {"end_new_line": True},
+                    }
+                ]
+            }
+        )
+
+        # The first run fixes the file, the second one records it as clean.
+        self.state_manager.apply(incremental=True)
+        assert file_path.read_text() == "content\n"
+        self.state_manager.apply(incremental=True)
+        assert (tmp_path / ".wex" / "tmp" / ScanIndex.FILE_NAME).is_file()
+
+        checked = []
+        try_create = AbstractItemTarget.try_create_operation_from_option
+
+        def counting(item, *args, **kwargs):
+            checked.append(item.get_item_name())
+            return try_create(item, *args, **kwargs)
+
+        monkeypatch.setattr(
+            AbstractItemTarget, "try_create_operation_from_option", counting
+        )
+
+        result = self.state_manager.apply(incremental=True)
+        assert not result.operations
+        assert self.test_file_name not in checked
+
+        # Any change of the file signature triggers a full check again.
+        file_path.write_text("changed")
+        result = self.state_manager.apply(incremental=True)
+        assert self.test_file_name in checked
+        assert len(result.operations) == 1
+        assert file_path.read_text() == "changed\n"
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+
+from wexample_filestate.testing.abstract_state_manager_test import (
+    AbstractStateManagerTest,
+)
+
+
+class TestAtomicFileWriter(AbstractStateManagerTest):
+    def test_apply_batches_sync(self, tmp_path, monkeypatch) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.enum.fsync_policy import FsyncPolicy
+        from wexample_filestate.utils.atomic_file_writer import AtomicFileWriter
+
+        self._setup_with_tmp_path(tmp_path)
+        for name in ("a.txt", "b.txt"):
+            (tmp_path / name).write_text("content")
+        self.state_manager.configure(
+            {
+                "children": [
+                    {
+                        "name": name,
+                        "type": DiskItemType.FILE,
+                        "text": {"end_new_line": True},
+                    }
+                    for name in ("a.txt", "b.txt")
+                ]
+            }
+        )
+
+        syncs = []
+        monkeypatch.setattr(os, "fsync", lambda fd: syncs.append("file"))
+        monkeypatch.setattr(
+            AtomicFileWriter,
+            "_fsync_directory",
+            staticmethod(lambda directory: syncs.append(directory)),
+        )
+
+        result = self.state_manager.apply(fsync_policy=FsyncPolicy.BATCH)
+        assert len(result.operations) == 2
+        # Each file is synced, their shared directory once, at the end.
+        assert syncs == ["file", "file", str(tmp_path.resolve())]
+        assert (tmp_path / "a.txt").read_text() == "content\n"
+
+    def test_write_replaces_file(self, tmp_path) -> None:
+        from wexample_filestate.enum.fsync_policy import FsyncPolicy
+        from wexample_filestate.utils.atomic_file_writer import AtomicFileWriter
+
+        target = tmp_path / "target.txt"
+        target.write_text("old")
+        os.chmod(target, 0o640)
+        link = tmp_path / "link.txt"
+        link.symlink_to(target)
+
+        writer = AtomicFileWriter(fsync_policy=FsyncPolicy.FILE)
+        writer.write(link, "new")
+
+        assert link.is_symlink()
+        assert target.read_text() == "new"
+        assert os.stat(target).st_mode & 0o777 == 0o640
+        # No temporary file is left behind.
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "link.txt",
+            "target.txt",
+        ]
+
+        writer.write(tmp_path / "sub" / "created.txt", "created")
+        assert (tmp_path / "sub" / "created.txt").read_text() == "created"
+
+    def test_write_keeps_the_umask(self, tmp_path, monkeypatch) -> None:
+        from wexample_filestate.utils.atomic_file_writer import AtomicFileWriter
+
+        def fail(mask):
+            raise AssertionError("The umask must not be changed")
+
+        umask = os.umask(0o027)
+        try:
+            monkeypatch.setattr(os, "umask", fail)
+            AtomicFileWriter().write(tmp_path / "created.txt", "created")
+        finally:
+            monkeypatch.undo()
+            os.umask(umask)
+
+        assert os.stat(tmp_path / "created.txt").st_mode & 0o777 == 0o640
+
+    def test_write_in_place_when_file_cannot_be_replaced(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        import pytest
+
+        from wexample_filestate.utils.atomic_file_writer import AtomicFileWriter
+
+        target = tmp_path / "target.txt"
+        target.write_text("old")
+        link = tmp_path / "hard_link.txt"
+        os.link(target, link)
+        writer = AtomicFileWriter()
+
+        # The owner could not be kept.
+        monkeypatch.setattr(
+            AtomicFileWriter, "_copy_owner", staticmethod(lambda path, existing: False)
+        )
+        writer.write(target, "owned")
+        assert link.read_text() == "owned"
+
+        # The directory is read-only.
+        def deny(path, mode):
+            raise PermissionError(path)
+
+        monkeypatch.setattr(
+            AtomicFileWriter, "_create_temporary_file", staticmethod(deny)
+        )
+        writer.write(target, "read-only directory")
+        assert link.read_text() == "read-only directory"
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "hard_link.txt",
+            "target.txt",
+        ]
+        with pytest.raises(PermissionError):
+            writer.write(tmp_path / "new.txt", "new")
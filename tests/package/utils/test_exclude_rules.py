@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def test_unanchored_and_anchored_patterns() -> None:
+    from wexample_filestate.utils.exclude_rules import ExcludeRules
+
+    base = Path("/project")
+    rules = ExcludeRules.create_from_patterns(
+        ["# comment", "", "node_modules/", "*.pyc", "/build", "docs/**/*.tmp"],
+        base,
+    )
+
+    assert rules.is_excluded(base / "node_modules", is_dir=True)
+    assert rules.is_excluded(base / "a" / "node_modules", is_dir=True)
+    assert not rules.is_excluded(base / "node_modules", is_dir=False)
+    assert rules.is_excluded(base / "a" / "b.pyc", is_dir=False)
+    assert rules.is_excluded(base / "build", is_dir=True)
+    assert not rules.is_excluded(base / "a" / "build", is_dir=True)
+    assert rules.is_excluded(base / "docs" / "x.tmp", is_dir=False)
+    assert rules.is_excluded(base / "docs" / "a" / "b" / "x.tmp", is_dir=False)
+    assert not rules.is_excluded(base / "x.tmp", is_dir=False)
+    assert not rules.is_excluded(Path("/other/b.pyc"), is_dir=False)
+
+
+def test_negation_and_ignore_files(tmp_path: Path) -> None:
+    from wexample_filestate.utils.exclude_rules import ExcludeRules
+
+    rules = ExcludeRules.create_from_patterns(["*.log"], tmp_path)
+    assert rules.is_excluded(tmp_path / "sub" / "keep.log", is_dir=False)
+
+    (tmp_path / "sub").mkdir()
+    ignore_file_path = tmp_path / "sub" / ".wexignore"
+    ignore_file_path.write_text("!keep.log\n/local\n")
+    sub_rules = rules.with_ignore_file(ignore_file_path)
+
+    assert not sub_rules.is_excluded(tmp_path / "sub" / "keep.log", is_dir=False)
+    assert sub_rules.is_excluded(tmp_path / "sub" / "other.log", is_dir=False)
+    assert sub_rules.is_excluded(tmp_path / "sub" / "local", is_dir=True)
+    assert not sub_rules.is_excluded(tmp_path / "local", is_dir=True)
+    # Parent rules are left untouched.
+    assert rules.is_excluded(tmp_path / "sub" / "keep.log", is_dir=False)
+    assert rules.with_ignore_file(tmp_path / "missing") is rules
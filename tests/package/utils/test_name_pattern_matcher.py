@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+
+NAMES = [
+    "",
+    "a.txt",
+    "a.txt\n",
+    "readme",
+    "readme.md",
+    "README",
+    "test_data",
+    "tests",
+    "x.py",
+    "x.pyc",
+]
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        [r".*\.txt$"],
+        [r"^readme"],
+        [r"readme$"],
+        [r"^test_.*"],
+        [r"(?i)readme"],
+        [r"^[a-z]+$", r".*\.py$"],
+        [r"^x", r".*c$", r"(?i)X"],
+        [r"\d+"],
+        [r"^$"],
+    ],
+)
+def test_matches_like_re_match(patterns: list[str]) -> None:
+    from wexample_filestate.utils.name_pattern_matcher import NamePatternMatcher
+
+    matcher = NamePatternMatcher(patterns=patterns)
+
+    for name in NAMES:
+        expected = all(re.match(pattern, name) for pattern in patterns)
+        assert matcher.matches(name) == expected, (patterns, name)
+
+
+def test_create_from_option_value() -> None:
+    from wexample_filestate.utils.name_pattern_matcher import NamePatternMatcher
+
+    assert NamePatternMatcher.create_from_option_value(None) is None
+
+    matcher = NamePatternMatcher.create_from_option_value(r".*\.md$")
+    assert matcher.patterns == [r".*\.md$"]
+    assert matcher.matches("readme.md")
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import os
+
+from wexample_filestate.testing.abstract_state_manager_test import (
+    AbstractStateManagerTest,
+)
+
+
+class TestPathFilter(AbstractStateManagerTest):
+    def test_matches_and_pruning(self) -> None:
+        from wexample_filestate.utils.path_filter import PathFilter
+
+        base = os.path.join(os.sep, "project")
+        target = os.path.join(base, "src", "module")
+        path_filter = PathFilter(patterns=[target])
+
+        assert path_filter.matches(target)
+        assert path_filter.matches(os.path.join(target, "file.py"))
+        assert not path_filter.matches(target + "_other")
+        assert not path_filter.matches(os.path.join(base, "src"))
+
+        assert path_filter.may_match_below(base)
+        assert path_filter.may_match_below(os.path.join(target, "deep"))
+        assert not path_filter.may_match_below(os.path.join(base, "docs"))
+
+        relative = PathFilter(patterns=["*.md", "src/mod"])
+        assert relative.matches(os.path.join(base, "README.md"))
+        assert relative.matches(os.path.join(base, "src", "module", "a.py"))
+        assert not relative.matches(os.path.join(base, "setup.py"))
+        assert relative.may_match_below(os.path.join(base, "docs"))
+
+    def test_dry_run_skips_unmatched_subtrees(self, tmp_path) -> None:
+        from wexample_filestate.const.disk import DiskItemType
+        from wexample_filestate.enum.scopes import Scope
+
+        self._setup_with_tmp_path(tmp_path)
+
+        children = []
+        for dir_index in range(3):
+            directory = tmp_path / f"dir_{dir_index}"
+            directory.mkdir()
+            (directory / "file.txt").write_text("no newline")
+            children.append(
+                {
+                    "name": directory.name,
+                    "type": DiskItemType.DIRECTORY,
+                    "children": [
+                        {
+                            "name": "file.txt",
+                            "type": DiskItemType.FILE,
+                            "text": {"end_new_line": True},
+                        }
+                    ],
+                }
+            )
+        self.state_manager.configure({"children": children})
+
+        target = tmp_path / "dir_1" / "file.txt"
+        result = self.state_manager.dry_run(
+            scopes=set(Scope), filter_paths=[str(target)]
+        )
+
+        assert [operation.target.get_path() for operation in result.operations] == [
+            target
+        ]
+        assert self.state_manager.find_by_name("dir_1").is_tree_built()
+        assert not self.state_manager.find_by_name("dir_0").is_tree_built()
+        assert not self.state_manager.find_by_name("dir_2").is_tree_built()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+
+from wexample_filestate.testing.abstract_state_manager_test import (
+    AbstractStateManagerTest,
+)
+
+
+class TestStatSnapshot(AbstractStateManagerTest):
+    def test_lookups_match_pathlib(self, tmp_path) -> None:
+        from wexample_filestate.utils.stat_snapshot import StatSnapshot
+
+        (tmp_path / "file.txt").write_text("content")
+        (tmp_path / "folder").mkdir()
+        (tmp_path / "dangling").symlink_to(tmp_path / "missing")
+
+        snapshot = StatSnapshot()
+
+        for name in ("file.txt", "folder", "dangling", "missing"):
+            path = tmp_path / name
+            assert snapshot.exists(path) == path.exists()
+            assert snapshot.is_file(path) == path.is_file()
+            assert snapshot.is_dir(path) == path.is_dir()
+            assert snapshot.is_symlink(path) == path.is_symlink()
+
+        assert snapshot.stat(tmp_path / "missing") is None
+        assert snapshot.stat(tmp_path / "file.txt").st_size == len("content")
+        assert snapshot.exists(os.sep)
+        assert snapshot.is_dir(os.sep)
+
+    def test_lists_each_directory_once(self, tmp_path, monkeypatch) -> None:
+        from wexample_filestate.utils.stat_snapshot import StatSnapshot
+
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+
+        calls = []
+        scandir = os.scandir
+
+        def counting_scandir(path):
+            calls.append(path)
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        snapshot = StatSnapshot()
+        snapshot.exists(tmp_path / "a.txt")
+        snapshot.is_file(tmp_path / "b.txt")
+        snapshot.stat(tmp_path / "c.txt")
+
+        assert calls == [str(tmp_path)]
+
+    def test_invalidate_drops_stale_listings(self, tmp_path) -> None:
+        from wexample_filestate.utils.stat_snapshot import StatSnapshot
+
+        folder = tmp_path / "folder"
+        folder.mkdir()
+        snapshot = StatSnapshot()
+
+        assert not snapshot.exists(folder / "new.txt")
+        (folder / "new.txt").write_text("new")
+        assert not snapshot.exists(folder / "new.txt")
+
+        # Invalidating an ancestor also drops the descendants' listings.
+        snapshot.invalidate(folder)
+        assert snapshot.exists(folder / "new.txt")
+
+    def test_apply_shares_snapshot_and_sees_created_items(self, tmp_path) -> None:
+        self._setup_with_tmp_path(tmp_path)
+
+        self.state_manager.configure(
+            {
+                "children": [
+                    {
+                        "name": "created",
+                        "type": "dir",
+                        "should_exist": True,
+                        "children": [
+                            {
+                                "name": "inner.txt",
+                                "type": "file",
+                                "should_exist": True,
+                            }
+                        ],
+                    }
+                ]
+            }
+        )
+
+        assert self.state_manager.get_stat_snapshot() is None
+        self.state_manager.apply()
+        assert self.state_manager.get_stat_snapshot() is None
+
+        assert (tmp_path / "created" / "inner.txt").is_file()